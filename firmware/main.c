@@ -74,6 +74,7 @@ static void help(void)
 	puts("reboot      - reboot CPU");
 	puts("meminit     - run a memory initialization");
 	puts("memtest     - run a memory test");
+	puts("memtest_full - run a bist over the whole memory");
 }
 
 static void reboot(void)
@@ -97,6 +98,8 @@ static void console_service(void)
 		sdrinit();	
 	else if(strcmp(token, "memtest") == 0)
 		memtest();
+	else if(strcmp(token, "memtest_full") == 0)
+		memtest_full();
 	prompt();
 }
 
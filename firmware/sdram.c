@@ -215,63 +215,103 @@ void sdrwloff(void)
 
 #define ERR_DDRPHY_DELAY 512
 
+#define NMODULES (DFII_PIX_DATA_SIZE/2)
+
+#ifdef CSR_DELAY_LOADER_BASE
+#define DELAY_LOADER_TARGET_WDLY_DQ  0
+#define DELAY_LOADER_TARGET_WDLY_DQS 1
+#define DELAY_LOADER_TARGET_RDLY_DQ  2
+
+static void delay_loader_init(void)
+{
+	delay_loader_dly_sel_addr_write(CSR_DDRPHY_DLY_SEL_ADDR);
+	delay_loader_wdly_dq_rst_addr_write(CSR_DDRPHY_WDLY_DQ_RST_ADDR);
+	delay_loader_wdly_dq_inc_addr_write(CSR_DDRPHY_WDLY_DQ_INC_ADDR);
+	delay_loader_wdly_dqs_rst_addr_write(CSR_DDRPHY_WDLY_DQS_RST_ADDR);
+	delay_loader_wdly_dqs_inc_addr_write(CSR_DDRPHY_WDLY_DQS_INC_ADDR);
+	delay_loader_rdly_dq_rst_addr_write(CSR_DDRPHY_RDLY_DQ_RST_ADDR);
+	delay_loader_rdly_dq_inc_addr_write(CSR_DDRPHY_RDLY_DQ_INC_ADDR);
+	delay_loader_rdly_dq_bitslip_addr_write(CSR_DDRPHY_RDLY_DQ_BITSLIP_ADDR);
+}
+#endif
+
+/* Reset the read delay of the modules of mask and set it to value */
+static void rdly_dq_load(int mask, int value)
+{
+#ifdef CSR_DELAY_LOADER_BASE
+	delay_loader_load_write(value | (mask << 16) | (DELAY_LOADER_TARGET_RDLY_DQ << 24));
+	while(!delay_loader_done_read());
+#else
+	int i;
+
+	ddrphy_dly_sel_write(mask);
+	ddrphy_rdly_dq_rst_write(1);
+	for(i=0;i<value;i++)
+		ddrphy_rdly_dq_inc_write(1);
+#endif
+}
+
 static int write_level(int *delay, int *high_skew)
 {
 	int i;
 	int dq_address;
 	unsigned char dq;
+	int phase[NMODULES];
+	int sel;
 	int ok;
 
 	printf("Write leveling: ");
 
 	sdrwlon();
 	cdelay(100);
-	for(i=0;i<DFII_PIX_DATA_SIZE/2;i++) {
-		dq_address = sdram_dfii_pix_rddata_addr[0]+4*(DFII_PIX_DATA_SIZE/2-1-i);
-		ddrphy_dly_sel_write(1 << i);
-		ddrphy_wdly_dq_rst_write(1);
-		ddrphy_wdly_dqs_rst_write(1);
 
+	/* All modules are swept at once */
+	ddrphy_dly_sel_write((1 << NMODULES) - 1);
+	ddrphy_wdly_dq_rst_write(1);
+	ddrphy_wdly_dqs_rst_write(1);
+	ddrphy_wlevel_strobe_write(1);
+	cdelay(10);
+	for(i=0;i<NMODULES;i++) {
+		dq_address = sdram_dfii_pix_rddata_addr[0]+4*(NMODULES-1-i);
 		delay[i] = 0;
+		/*
+		 * Assume a DQ group sampling 1 has between 1 and 2 bit times of skew.
+		 * Bring DQS into the CK=0 zone (phase 0) before continuing leveling
+		 * (phase 1, until DQ samples 1).
+		 */
+		high_skew[i] = MMPTR(dq_address) != 0;
+		phase[i] = high_skew[i] ? 0 : 1;
+	}
 
-		ddrphy_wlevel_strobe_write(1);
-		cdelay(10);
-		dq = MMPTR(dq_address);
-		if(dq != 0) {
-			/*
-			 * Assume this DQ group has between 1 and 2 bit times of skew.
-			 * Bring DQS into the CK=0 zone before continuing leveling.
-			 */
-			high_skew[i] = 1;
-			while(dq != 0) {
+	while(1) {
+		sel = 0;
+		for(i=0;i<NMODULES;i++) {
+			dq_address = sdram_dfii_pix_rddata_addr[0]+4*(NMODULES-1-i);
+			dq = MMPTR(dq_address);
+			if((phase[i] == 0) && (dq == 0))
+				phase[i] = 1;
+			if((phase[i] == 1) && (dq != 0))
+				phase[i] = 2;
+			if(phase[i] != 2) {
 				delay[i]++;
 				if(delay[i] >= ERR_DDRPHY_DELAY)
-					break;
-				ddrphy_wdly_dq_inc_write(1);
-				ddrphy_wdly_dqs_inc_write(1);
-				ddrphy_wlevel_strobe_write(1);
-				cdelay(10);
-				dq = MMPTR(dq_address);
-			 }
-		} else
-			high_skew[i] = 0;
-
-		while(dq == 0) {
-			delay[i]++;
-			if(delay[i] >= ERR_DDRPHY_DELAY)
-				break;
-			ddrphy_wdly_dq_inc_write(1);
-			ddrphy_wdly_dqs_inc_write(1);
-
-			ddrphy_wlevel_strobe_write(1);
-			cdelay(10);
-			dq = MMPTR(dq_address);
+					phase[i] = 2;
+				else
+					sel |= 1 << i;
+			}
 		}
+		if(sel == 0)
+			break;
+		ddrphy_dly_sel_write(sel);
+		ddrphy_wdly_dq_inc_write(1);
+		ddrphy_wdly_dqs_inc_write(1);
+		ddrphy_wlevel_strobe_write(1);
+		cdelay(10);
 	}
 	sdrwloff();
 
 	ok = 1;
-	for(i=DFII_PIX_DATA_SIZE/2-1;i>=0;i--) {
+	for(i=NMODULES-1;i>=0;i--) {
 		printf("%2d%c ", delay[i], high_skew[i] ? '*' : ' ');
 		if(delay[i] >= ERR_DDRPHY_DELAY)
 			ok = 0;
@@ -291,7 +331,7 @@ static void read_bitslip(int *delay, int *high_skew)
 	int i;
 
 	bitslip_thr = 0x7fffffff;
-	for(i=0;i<DFII_PIX_DATA_SIZE/2;i++)
+	for(i=0;i<NMODULES;i++)
 		if(high_skew[i] && (delay[i] < bitslip_thr))
 			bitslip_thr = delay[i];
 	if(bitslip_thr == 0x7fffffff)
@@ -299,7 +339,7 @@ static void read_bitslip(int *delay, int *high_skew)
 	bitslip_thr = bitslip_thr/2;
 
 	printf("Read bitslip: ");
-	for(i=DFII_PIX_DATA_SIZE/2-1;i>=0;i--)
+	for(i=NMODULES-1;i>=0;i--)
 		if(delay[i] > bitslip_thr) {
 			ddrphy_dly_sel_write(1 << i);
 			ddrphy_rdly_dq_bitslip_write(1);
@@ -312,9 +352,12 @@ static void read_delays(void)
 {
 	unsigned int prv;
 	unsigned char prs[DFII_NPHASES*DFII_PIX_DATA_SIZE];
-	int p, i, j;
+	int p, i;
 	int working;
-	int delay, delay_min, delay_max;
+	int delay;
+	int delay_min[NMODULES], delay_max[NMODULES];
+	int phase[NMODULES];
+	int pending;
 
 	printf("Read delays: ");
 
@@ -339,66 +382,51 @@ static void read_delays(void)
 	sdram_dfii_piwr_baddress_write(0);
 	command_pwr(DFII_COMMAND_CAS|DFII_COMMAND_WE|DFII_COMMAND_CS|DFII_COMMAND_WRDATA);
 
-	/* Calibrate each DQ in turn */
+	/*
+	 * Calibrate all DQ groups at once: for each group find the smallest
+	 * working delay (phase 0), then get a bit further into the working
+	 * zone and find the largest working delay (phase 1).
+	 */
 	sdram_dfii_pird_address_write(0);
 	sdram_dfii_pird_baddress_write(0);
-	for(i=0;i<DFII_PIX_DATA_SIZE/2;i++) {
-		ddrphy_dly_sel_write(1 << (DFII_PIX_DATA_SIZE/2-i-1));
-		delay = 0;
-
-		/* Find smallest working delay */
-		ddrphy_rdly_dq_rst_write(1);
-		while(1) {
-			command_prd(DFII_COMMAND_CAS|DFII_COMMAND_CS|DFII_COMMAND_RDDATA);
-			cdelay(15);
+	for(i=0;i<NMODULES;i++) {
+		delay_min[i] = ERR_DDRPHY_DELAY;
+		delay_max[i] = ERR_DDRPHY_DELAY;
+		phase[i] = 0;
+	}
+	rdly_dq_load((1 << NMODULES) - 1, 0);
+	for(delay=0;delay<ERR_DDRPHY_DELAY;delay++) {
+		command_prd(DFII_COMMAND_CAS|DFII_COMMAND_CS|DFII_COMMAND_RDDATA);
+		cdelay(15);
+		pending = 0;
+		for(i=0;i<NMODULES;i++) {
 			working = 1;
 			for(p=0;p<DFII_NPHASES;p++) {
 				if(MMPTR(sdram_dfii_pix_rddata_addr[p]+4*i) != prs[DFII_PIX_DATA_SIZE*p+i])
 					working = 0;
-				if(MMPTR(sdram_dfii_pix_rddata_addr[p]+4*(i+DFII_PIX_DATA_SIZE/2)) != prs[DFII_PIX_DATA_SIZE*p+i+DFII_PIX_DATA_SIZE/2])
+				if(MMPTR(sdram_dfii_pix_rddata_addr[p]+4*(i+NMODULES)) != prs[DFII_PIX_DATA_SIZE*p+i+NMODULES])
 					working = 0;
 			}
-			if(working)
-				break;
-			delay++;
-			if(delay >= ERR_DDRPHY_DELAY)
-				break;
-			ddrphy_rdly_dq_inc_write(1);
-		}
-		delay_min = delay;
-
-		/* Get a bit further into the working zone */
-		for(j=0;j<8;j++) {
-			delay += 1;
-			ddrphy_rdly_dq_inc_write(1);
-		}
-
-		/* Find largest working delay */
-		while(1) {
-			command_prd(DFII_COMMAND_CAS|DFII_COMMAND_CS|DFII_COMMAND_RDDATA);
-			cdelay(15);
-			working = 1;
-			for(p=0;p<DFII_NPHASES;p++) {
-				if(MMPTR(sdram_dfii_pix_rddata_addr[p]+4*i) != prs[DFII_PIX_DATA_SIZE*p+i])
-					working = 0;
-				if(MMPTR(sdram_dfii_pix_rddata_addr[p]+4*(i+DFII_PIX_DATA_SIZE/2)) != prs[DFII_PIX_DATA_SIZE*p+i+DFII_PIX_DATA_SIZE/2])
-					working = 0;
+			if((phase[i] == 0) && working) {
+				delay_min[i] = delay;
+				phase[i] = 1;
+			} else if((phase[i] == 1) && (delay >= delay_min[i] + 8) && !working) {
+				delay_max[i] = delay;
+				phase[i] = 2;
 			}
-			if(!working)
-				break;
-			delay++;
-			if(delay >= ERR_DDRPHY_DELAY)
-				break;
-			ddrphy_rdly_dq_inc_write(1);
+			if(phase[i] != 2)
+				pending = 1;
 		}
-		delay_max = delay;
-
-		printf("%d:%02d-%02d  ", DFII_PIX_DATA_SIZE/2-i-1, delay_min, delay_max);
+		if(!pending)
+			break;
+		ddrphy_dly_sel_write((1 << NMODULES) - 1);
+		ddrphy_rdly_dq_inc_write(1);
+	}
 
-		/* Set delay to the middle */
-		ddrphy_rdly_dq_rst_write(1);
-		for(j=0;j<(delay_min+delay_max)/2;j++)
-			ddrphy_rdly_dq_inc_write(1);
+	/* Set delays to the middle */
+	for(i=0;i<NMODULES;i++) {
+		printf("%d:%02d-%02d  ", NMODULES-i-1, delay_min[i], delay_max[i]);
+		rdly_dq_load(1 << (NMODULES-i-1), (delay_min[i]+delay_max[i])/2);
 	}
 
 	/* Precharge */
@@ -465,36 +493,125 @@ static int memtest_bus(void)
 	return errors;
 }
 
+#ifdef CSR_TIMER0_BASE
+static void memtest_timer_start(void)
+{
+	timer0_en_write(0);
+	timer0_reload_write(0);
+	timer0_load_write(0xffffffff);
+	timer0_en_write(1);
+}
+
+static unsigned int memtest_timer_cycles(void)
+{
+	timer0_update_value_write(1);
+	return 0xffffffff - timer0_value_read();
+}
+#endif
+
+/* MB/s (1MB = 1000000 bytes) for bytes transferred in cycles */
+static unsigned int memtest_speed(unsigned int bytes, unsigned int cycles)
+{
+	if(cycles == 0)
+		return 0;
+	return (unsigned long long)bytes*CONFIG_CLOCK_FREQUENCY/cycles/1000000;
+}
+
 #ifndef MEMTEST_DATA_SIZE
 #define MEMTEST_DATA_SIZE (2*1024*1024)
 #endif
 #define MEMTEST_DATA_RANDOM 1
+/* words per L2 cache line (width of the sdram port) */
+#ifndef MEMTEST_DATA_BURST
+#define MEMTEST_DATA_BURST 8
+#endif
 
-static int memtest_data(void)
+/*
+ * Words are written and checked in bursts of a L2 cache line, word n of a
+ * burst taking the next value of the LCG stream n%4: the streams are
+ * independent and are computed in parallel by the CPU.
+ */
+static int memtest_data(unsigned int *write_speed, unsigned int *read_speed)
 {
-	volatile unsigned int *array = (unsigned int *)MAIN_RAM_BASE;
-	int i, errors;
-	unsigned int seed_32;
+	unsigned int *array = (unsigned int *)MAIN_RAM_BASE;
+	int i, j, errors;
+	unsigned int s0, s1, s2, s3;
 
 	errors = 0;
-	seed_32 = 0;
+	*write_speed = 0;
+	*read_speed = 0;
 
-	for(i=0;i<MEMTEST_DATA_SIZE/4;i++) {
-		seed_32 = seed_to_data_32(seed_32, MEMTEST_DATA_RANDOM);
-		array[i] = seed_32;
+	s0 = 0; s1 = 1; s2 = 2; s3 = 3;
+#ifdef CSR_TIMER0_BASE
+	memtest_timer_start();
+#endif
+	for(i=0;i<MEMTEST_DATA_SIZE/4;i+=MEMTEST_DATA_BURST) {
+		for(j=0;j<MEMTEST_DATA_BURST;j+=4) {
+			s0 = seed_to_data_32(s0, MEMTEST_DATA_RANDOM);
+			s1 = seed_to_data_32(s1, MEMTEST_DATA_RANDOM);
+			s2 = seed_to_data_32(s2, MEMTEST_DATA_RANDOM);
+			s3 = seed_to_data_32(s3, MEMTEST_DATA_RANDOM);
+			array[i+j+0] = s0;
+			array[i+j+1] = s1;
+			array[i+j+2] = s2;
+			array[i+j+3] = s3;
+		}
 	}
-
-	seed_32 = 0;
+	/* flushes also prevent the compiler from reordering the accesses */
 	flush_cpu_dcache();
 	flush_l2_cache();
-	for(i=0;i<MEMTEST_DATA_SIZE/4;i++) {
-		seed_32 = seed_to_data_32(seed_32, MEMTEST_DATA_RANDOM);
-		if(array[i] != seed_32)
-			errors++;
+#ifdef CSR_TIMER0_BASE
+	*write_speed = memtest_speed(MEMTEST_DATA_SIZE, memtest_timer_cycles());
+#endif
+
+	s0 = 0; s1 = 1; s2 = 2; s3 = 3;
+#ifdef CSR_TIMER0_BASE
+	memtest_timer_start();
+#endif
+	for(i=0;i<MEMTEST_DATA_SIZE/4;i+=MEMTEST_DATA_BURST) {
+		for(j=0;j<MEMTEST_DATA_BURST;j+=4) {
+			s0 = seed_to_data_32(s0, MEMTEST_DATA_RANDOM);
+			s1 = seed_to_data_32(s1, MEMTEST_DATA_RANDOM);
+			s2 = seed_to_data_32(s2, MEMTEST_DATA_RANDOM);
+			s3 = seed_to_data_32(s3, MEMTEST_DATA_RANDOM);
+			errors += (array[i+j+0] != s0);
+			errors += (array[i+j+1] != s1);
+			errors += (array[i+j+2] != s2);
+			errors += (array[i+j+3] != s3);
+		}
 	}
+#ifdef CSR_TIMER0_BASE
+	*read_speed = memtest_speed(MEMTEST_DATA_SIZE, memtest_timer_cycles());
+#endif
 
 	return errors;
 }
+
+#ifdef CSR_CHECKER_BASE
+/* Same test with the BIST generator/checker of the design */
+static int memtest_bist(unsigned int base, unsigned int length,
+			unsigned int *write_speed, unsigned int *read_speed)
+{
+	generator_reset_write(1);
+	generator_base_write(base);
+	generator_length_write(length);
+	generator_seed_write(0);
+	generator_start_write(1);
+	while(!generator_done_read());
+	*write_speed = memtest_speed(length, generator_ticks_read());
+
+	checker_reset_write(1);
+	checker_base_write(base);
+	checker_length_write(length);
+	checker_seed_write(0);
+	checker_start_write(1);
+	while(!checker_done_read());
+	*read_speed = memtest_speed(length, checker_ticks_read());
+
+	return checker_errors_read();
+}
+#endif
+
 #ifndef MEMTEST_ADDR_SIZE
 #define MEMTEST_ADDR_SIZE (32*1024)
 #endif
@@ -526,22 +643,121 @@ static int memtest_addr(void)
 	return errors;
 }
 
+/*
+ * Walking ones/zeros on the address lines over the whole MAIN_RAM: only
+ * the words at offsets base ^ (1 << n) are used (O(log(size)) accesses).
+ * A word is written with the antipattern while the others hold the
+ * pattern, a stuck or shorted address line then corrupts another word.
+ */
+#define MEMTEST_WALK_PATTERN     0xaaaaaaaa
+#define MEMTEST_WALK_ANTIPATTERN 0x55555555
+
+static int memtest_walk_check(unsigned int *array, unsigned int base, int nbits, int tested)
+{
+	int n, errors;
+
+	errors = 0;
+	flush_cpu_dcache();
+	flush_l2_cache();
+	for(n=-1;n<nbits;n++) {
+		unsigned int offset = (n < 0) ? base : base ^ (1 << n);
+		unsigned int expected = (n == tested) ? MEMTEST_WALK_ANTIPATTERN : MEMTEST_WALK_PATTERN;
+		if(array[offset] != expected) {
+			printf("Memtest walk: 0x%08x: 0x%08x (expected 0x%08x)\n",
+				(unsigned int)&array[offset], array[offset], expected);
+			errors++;
+		}
+	}
+	return errors;
+}
+
+static int memtest_walk(unsigned int base)
+{
+	unsigned int *array = (unsigned int *)MAIN_RAM_BASE;
+	int n, nbits, errors;
+
+	errors = 0;
+	nbits = 0;
+	while((4 << nbits) < MAIN_RAM_SIZE)
+		nbits++;
+
+	array[base] = MEMTEST_WALK_PATTERN;
+	for(n=0;n<nbits;n++)
+		array[base ^ (1 << n)] = MEMTEST_WALK_PATTERN;
+	errors += memtest_walk_check(array, base, nbits, nbits);
+
+	/* base (tested = -1) and each address line in turn */
+	for(n=-1;n<nbits;n++) {
+		unsigned int offset = (n < 0) ? base : base ^ (1 << n);
+		array[offset] = MEMTEST_WALK_ANTIPATTERN;
+		errors += memtest_walk_check(array, base, nbits, n);
+		array[offset] = MEMTEST_WALK_PATTERN;
+	}
+
+	return errors;
+}
+
+static int memtest_addr_walk(void)
+{
+	int errors;
+
+	/* walking ones from the first word, walking zeros from the last */
+	errors = memtest_walk(0);
+	errors += memtest_walk(MAIN_RAM_SIZE/4 - 1);
+	return errors;
+}
+
+/* Full memory sweep with the BIST (data depends on the address) */
+void memtest_full(void)
+{
+#ifdef CSR_CHECKER_BASE
+	int errors;
+	unsigned int write_speed, read_speed;
+
+	printf("Memtest full: %dMB...\n", MAIN_RAM_SIZE/(1024*1024));
+	errors = memtest_bist(0, MAIN_RAM_SIZE, &write_speed, &read_speed);
+	printf("Memtest full: %d errors, write %dMB/s, read %dMB/s\n", errors, write_speed, read_speed);
+#else
+	printf("Memtest full: no BIST in this design\n");
+#endif
+}
+
 int memtest(void)
 {
-	int bus_errors, data_errors, addr_errors;
+	int bus_errors, data_errors, addr_errors, walk_errors;
+	unsigned int write_speed, read_speed;
+#ifdef CSR_CHECKER_BASE
+	int bist_errors;
+#endif
 
 	bus_errors = memtest_bus();
 	if(bus_errors != 0)
 		printf("Memtest bus failed: %d/%d errors\n", bus_errors, 2*128);
 
-	data_errors = memtest_data();
-	if(bus_errors != 0)
+	data_errors = memtest_data(&write_speed, &read_speed);
+	if(data_errors != 0)
 		printf("Memtest data failed: %d/%d errors\n", data_errors, MEMTEST_DATA_SIZE/4);
+#ifdef CSR_TIMER0_BASE
+	printf("Memtest data: write %dMB/s, read %dMB/s\n", write_speed, read_speed);
+#endif
 
 	addr_errors = memtest_addr();
 	if(addr_errors != 0)
 		printf("Memtest addr failed: %d/%d errors\n", addr_errors, MEMTEST_ADDR_SIZE/4);
 
+	walk_errors = memtest_addr_walk();
+	if(walk_errors != 0)
+		printf("Memtest addr walk failed: %d errors\n", walk_errors);
+	addr_errors += walk_errors;
+
+#ifdef CSR_CHECKER_BASE
+	bist_errors = memtest_bist(0, MEMTEST_DATA_SIZE, &write_speed, &read_speed);
+	if(bist_errors != 0)
+		printf("Memtest bist failed: %d/%d errors\n", bist_errors, MEMTEST_DATA_SIZE/MEMTEST_DATA_BURST/4);
+	printf("Memtest bist: write %dMB/s, read %dMB/s\n", write_speed, read_speed);
+	data_errors += bist_errors;
+#endif
+
 	if(bus_errors + data_errors + addr_errors != 0)
 		return 0;
 	else {
@@ -576,6 +792,9 @@ int sdrlevel(void)
 	int delay[DFII_PIX_DATA_SIZE/2];
 	int high_skew[DFII_PIX_DATA_SIZE/2];
 
+#ifdef CSR_DELAY_LOADER_BASE
+	delay_loader_init();
+#endif
 	if(!write_level(delay, high_skew))
 		return 0;
 	read_bitslip(delay, high_skew);
@@ -19,6 +19,7 @@ int sdrlevel(void);
 
 int memtest_silent(void);
 int memtest(void);
+void memtest_full(void);
 int sdrinit(void);
 
 #endif /* __SDRAM_H */
@@ -0,0 +1,182 @@
+from litex.gen import *
+
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect.csr import *
+
+
+OP_WRITE = 0
+OP_READ  = 1
+OP_POLL  = 2
+OP_WAIT  = 3
+
+
+# Executes a script of bus accesses stored in memory and packs the read
+# values in a result memory, a whole CSR access sequence is then uploaded
+# and retrieved in a few bridge bursts.
+#
+# Each command is described by 4 words:
+#  - op (bits 0-1) | timeout in units of 256 sys cycles (bits 8-31).
+#  - address (byte address on the bus).
+#  - data (write data or expected poll value).
+#  - mask (applied on read values and on poll comparison).
+#
+# Commands:
+#  - OP_WRITE: write data at address.
+#  - OP_READ: read address and store value & mask in the result memory.
+#  - OP_POLL: read address until (value & mask) == (data & mask), stop
+#    the script with error set if timeout expires.
+#  - OP_WAIT: wait timeout.
+#
+# Commands are at offset 0 of mem_bus, results at offset 4*depth.
+class CommandProcessor(Module, AutoCSR):
+    def __init__(self, depth=8192, results_depth=2048):
+        self.bus = bus = wishbone.Interface()
+        self.mem_bus = wishbone.Interface()
+
+        self.start = CSR()
+        self.length = CSRStorage(16)
+        self.done = CSRStatus()
+        self.error = CSRStatus()
+        self.error_index = CSRStatus(16)
+        self.results = CSRStatus(16)
+
+        # # #
+
+        # commands / results memories (host access through mem_bus)
+        mem = Memory(32, depth)
+        results_mem = Memory(32, results_depth)
+        self.submodules.sram = wishbone.SRAM(mem)
+        self.submodules.results_sram = wishbone.SRAM(results_mem, read_only=True)
+        self.submodules.decoder = wishbone.Decoder(self.mem_bus, [
+            (lambda a: a[log2_int(depth)] == 0, self.sram.bus),
+            (lambda a: a[log2_int(depth)] == 1, self.results_sram.bus)
+        ], register=True)
+        mem_port = mem.get_port()
+        results_port = results_mem.get_port(write_capable=True)
+        self.specials += mem_port, results_port
+
+        index = Signal(16)
+        word = Signal(2)
+        op = Signal(2)
+        timeout = Signal(24)
+        addr = Signal(32)
+        data = Signal(32)
+        mask = Signal(32)
+        timer = Signal(32)
+        done = Signal(reset=1)
+        error = Signal()
+        results = Signal(16)
+        self.comb += [
+            mem_port.adr.eq(Cat(word, index)),
+            results_port.adr.eq(results),
+            results_port.dat_w.eq(bus.dat_r & mask),
+            self.done.status.eq(done),
+            self.error.status.eq(error),
+            self.error_index.status.eq(index),
+            self.results.status.eq(results)
+        ]
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+
+        def bus_access(we, *ack_statements):
+            return [
+                bus.stb.eq(1),
+                bus.cyc.eq(1),
+                bus.we.eq(we),
+                bus.sel.eq(0xf),
+                bus.adr.eq(addr[2:]),
+                bus.dat_w.eq(data),
+                If(bus.ack,
+                    *ack_statements
+                )
+            ]
+
+        fsm.act("IDLE",
+            If(self.start.re,
+                NextValue(done, 0),
+                NextValue(error, 0),
+                NextValue(index, 0),
+                NextValue(word, 0),
+                NextValue(results, 0),
+                If(self.length.storage != 0,
+                    NextState("FETCH")
+                ).Else(
+                    NextValue(done, 1)
+                )
+            )
+        )
+        # memory read latency is 1 cycle, word 0 is presented in FETCH
+        fsm.act("FETCH",
+            NextValue(word, 1),
+            NextState("FETCH_OP")
+        )
+        fsm.act("FETCH_OP",
+            NextValue(op, mem_port.dat_r[0:2]),
+            NextValue(timeout, mem_port.dat_r[8:32]),
+            NextValue(word, 2),
+            NextState("FETCH_ADDR")
+        )
+        fsm.act("FETCH_ADDR",
+            NextValue(addr, mem_port.dat_r),
+            NextValue(word, 3),
+            NextState("FETCH_DATA")
+        )
+        fsm.act("FETCH_DATA",
+            NextValue(data, mem_port.dat_r),
+            NextState("FETCH_MASK")
+        )
+        fsm.act("FETCH_MASK",
+            NextValue(mask, mem_port.dat_r),
+            NextValue(word, 0),
+            NextValue(timer, timeout << 8),
+            Case(op, {
+                OP_WRITE: NextState("WRITE"),
+                OP_READ:  NextState("READ"),
+                OP_POLL:  NextState("POLL"),
+                OP_WAIT:  NextState("WAIT")
+            })
+        )
+        fsm.act("WRITE",
+            bus_access(1,
+                NextState("NEXT")
+            )
+        )
+        fsm.act("READ",
+            bus_access(0,
+                If(results != results_depth,
+                    results_port.we.eq(1),
+                    NextValue(results, results + 1)
+                ),
+                NextState("NEXT")
+            )
+        )
+        fsm.act("POLL",
+            If(timer != 0,
+                NextValue(timer, timer - 1)
+            ),
+            bus_access(0,
+                If((bus.dat_r & mask) == (data & mask),
+                    NextState("NEXT")
+                ).Elif(timer == 0,
+                    NextValue(error, 1),
+                    NextValue(done, 1),
+                    NextState("IDLE")
+                )
+            )
+        )
+        fsm.act("WAIT",
+            NextValue(timer, timer - 1),
+            If(timer == 0,
+                NextState("NEXT")
+            )
+        )
+        fsm.act("NEXT",
+            NextValue(index, index + 1),
+            If(index == (self.length.storage - 1),
+                NextValue(done, 1),
+                NextState("IDLE")
+            ).Else(
+                NextState("FETCH")
+            )
+        )
@@ -0,0 +1,168 @@
+from functools import reduce
+from operator import and_
+
+from litex.gen import *
+from litex.gen.genlib.cdc import MultiReg, PulseSynchronizer, BusSynchronizer
+from litex.gen.genlib.fifo import AsyncFIFO
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+
+K28_1 = (1 << 5) | 28 # idle
+K28_5 = (5 << 5) | 28 # marker (also used as comma by the clock aligners)
+
+
+# Bonds the lanes of a TransceiverInterface: one word of
+# nlanes x nwords x 8 bits is transmitted per rtio cycle. A marker is
+# inserted simultaneously on all lanes every marker_period cycles, idles
+# are sent when no data is available.
+class BondingTX(Module):
+    def __init__(self, channels, marker_period=1024):
+        nlanes = len(channels)
+        nwords = len(channels[0].encoder.d)
+        self.sink = sink = stream.Endpoint([("data", nlanes*nwords*8)])
+
+        # # #
+
+        marker_counter = Signal(max=marker_period)
+        marker = Signal()
+        self.sync.rtio += \
+            If(marker_counter == (marker_period - 1),
+                marker_counter.eq(0)
+            ).Else(
+                marker_counter.eq(marker_counter + 1)
+            )
+        self.comb += [
+            marker.eq(marker_counter == 0),
+            sink.ready.eq(~marker)
+        ]
+
+        for i, channel in enumerate(channels):
+            for j in range(nwords):
+                data = sink.data[8*(nwords*i + j):8*(nwords*i + j + 1)]
+                self.comb += \
+                    If(marker,
+                        channel.encoder.k[j].eq(1),
+                        channel.encoder.d[j].eq(K28_5)
+                    ).Elif(sink.valid,
+                        channel.encoder.k[j].eq(0),
+                        channel.encoder.d[j].eq(data)
+                    ).Else(
+                        channel.encoder.k[j].eq(1),
+                        channel.encoder.d[j].eq(K28_1)
+                    )
+
+
+# Moves each lane to the rtio domain through a FIFO and deskews the lanes
+# on the markers: lanes receiving the marker first are stalled until the
+# marker is seen on all lanes. Skew of each lane (in rtio cycles) is
+# reported, marker misalignments are counted and trigger a realignment.
+class BondingRX(Module, AutoCSR):
+    def __init__(self, channels, fifo_depth=16):
+        nlanes = len(channels)
+        nwords = len(channels[0].decoders)
+        self.source = source = stream.Endpoint([("data", nlanes*nwords*8)])
+
+        self.aligned = CSRStatus()
+        self.realign = CSR()
+        self.errors = CSRStatus(32)
+        for i in range(nlanes):
+            setattr(self, "lane{}_skew".format(i), CSRStatus(8))
+
+        # # #
+
+        rx_ready = Signal()
+        self.comb += rx_ready.eq(reduce(and_, [c.rx_ready for c in channels]))
+
+        # lanes fifos
+        fifos = []
+        for i, channel in enumerate(channels):
+            fifo = ClockDomainsRenamer({"write": "rtio_rx" + str(i), "read": "rtio"})(
+                AsyncFIFO(nwords*9, fifo_depth))
+            self.submodules += fifo
+            self.comb += [
+                fifo.we.eq(1),
+                fifo.din.eq(Cat(*[Cat(d.d, d.k) for d in channel.decoders]))
+            ]
+            fifos.append(fifo)
+
+        def is_marker(fifo):
+            return (fifo.dout[:8] == K28_5) & fifo.dout[8]
+
+        # deskew
+        aligned = Signal()
+        error = Signal()
+        errors = Signal(32)
+        realign = Signal()
+        stalled = Signal(nlanes)
+        skews = [Signal(8) for i in range(nlanes)]
+        markers = Signal(nlanes)
+        readable = Signal()
+        self.comb += [
+            markers.eq(Cat(*[fifo.readable & is_marker(fifo) for fifo in fifos])),
+            readable.eq(reduce(and_, [fifo.readable for fifo in fifos]))
+        ]
+
+        realign_ps = PulseSynchronizer("sys", "rtio")
+        self.submodules += realign_ps
+        self.comb += realign_ps.i.eq(self.realign.re)
+
+        self.sync.rtio += [
+            If(~rx_ready | realign | realign_ps.o,
+                aligned.eq(0),
+                stalled.eq(0)
+            ).Elif(~aligned,
+                If(markers == (2**nlanes - 1),
+                    aligned.eq(1),
+                    stalled.eq(0)
+                ).Else(
+                    stalled.eq(stalled | markers)
+                )
+            ),
+            If(error & (errors != (2**32-1)),
+                errors.eq(errors + 1)
+            )
+        ]
+        for i in range(nlanes):
+            self.sync.rtio += \
+                If(~aligned,
+                    If(~stalled[i] & markers[i],
+                        skews[i].eq(0)
+                    ).Elif(stalled[i] & (skews[i] != (2**8-1)),
+                        skews[i].eq(skews[i] + 1)
+                    )
+                )
+
+        for i, fifo in enumerate(fifos):
+            self.comb += \
+                If(aligned,
+                    fifo.re.eq(readable)
+                ).Else(
+                    fifo.re.eq(fifo.readable & ~markers[i])
+                )
+
+        # markers must be received simultaneously on all lanes once aligned
+        self.comb += [
+            error.eq(aligned & readable & (markers != 0) & (markers != (2**nlanes - 1))),
+            realign.eq(error)
+        ]
+
+        # output
+        lane0 = fifos[0].dout
+        self.comb += [
+            source.valid.eq(aligned & readable & ~lane0[8]),
+            source.data.eq(Cat(*[Cat(*[fifo.dout[9*j:9*j+8] for j in range(nwords)])
+                                 for fifo in fifos]))
+        ]
+
+        # csrs
+        self.specials += MultiReg(aligned, self.aligned.status)
+        for i in range(nlanes):
+            self.specials += MultiReg(skews[i], getattr(self, "lane{}_skew".format(i)).status)
+        errors_sync = BusSynchronizer(32, "rtio", "sys")
+        self.submodules += errors_sync
+        self.comb += [
+            errors_sync.i.eq(errors),
+            self.errors.status.eq(errors_sync.o)
+        ]
@@ -1,12 +1,15 @@
 from litex.gen import *
 from litex.gen.genlib.resetsync import AsyncResetSynchronizer
-from litex.gen.genlib.cdc import MultiReg
+from litex.gen.genlib.cdc import MultiReg, PulseSynchronizer, BusSynchronizer
 
 from litex.soc.interconnect.csr import *
 from litex.soc.cores.code_8b10b import Encoder, Decoder
 
 from drtio.common import TransceiverInterface, ChannelInterface
-from drtio.gth_ultrascale_init import GTHInit
+from drtio.gth_ultrascale_init import GTHInit, GTHInitStatus
+from drtio.gth_ultrascale_drp import DRPInterface, DRPArbiter, DRPControl
+from drtio.gth_ultrascale_eyescan import GTHEyeScan, get_sdata_mask
+from drtio.prbs import PRBSTX, PRBSRX
 from drtio.clock_aligner import BruteforceClockAligner
 
 
@@ -198,11 +201,23 @@ CLKIN +----> /M  +-->       Charge Pump         | +------------+->/2+--> CLKOUT
         return r
 
 
-class GTHSingle(Module):
+class GTHSingle(Module, AutoCSR):
     def __init__(self, pll, tx_pads, rx_pads, sys_clk_freq, dw=20, mode="master"):
         assert (dw == 20) or (dw == 40)
         assert mode in ["master", "slave"]
 
+        # tx/rx electrical settings (cf ug576)
+        self.txdiffctrl = CSRStorage(4, reset=0b1100)
+        self.txmaincursor = CSRStorage(7, reset=80)
+        self.txprecursor = CSRStorage(5)
+        self.txpostcursor = CSRStorage(5)
+        self.rxlpmen = CSRStorage(reset=1)
+
+        # prbs
+        self.tx_prbs_config = CSRStorage(2)
+        self.rx_prbs_config = CSRStorage(2)
+        self.rx_prbs_errors = CSRStatus(32)
+
         # # #
 
         nwords = dw//10
@@ -227,16 +242,28 @@ class GTHSingle(Module):
         # # #
 
         # TX generates RTIO clock, init must be in system domain
-        tx_init = GTHInit(sys_clk_freq, False)
+        # (PLL is not reset by the init FSMs)
+        tx_init = GTHInit(sys_clk_freq, False, pll_reset=False)
         # RX receives restart commands from RTIO domain
         rx_init = ClockDomainsRenamer("rtio_tx")(
-            GTHInit(self.rtio_clk_freq, True))
+            GTHInit(self.rtio_clk_freq, True, pll_reset=False))
         self.submodules += tx_init, rx_init
+        self.submodules.tx_init_status = GTHInitStatus(tx_init)
+        self.submodules.rx_init_status = GTHInitStatus(rx_init, "rtio_tx")
         self.comb += [
             tx_init.plllock.eq(pll.lock),
             rx_init.plllock.eq(pll.lock)
         ]
 
+        # drp (csr access and eye scan)
+        drp = DRPInterface()
+        drp_control = DRPInterface()
+        drp_eyescan = DRPInterface()
+        self.submodules.drp_arbiter = DRPArbiter([drp_control, drp_eyescan], drp)
+        self.submodules.drp_control = DRPControl(drp_control)
+        self.submodules.eyescan = GTHEyeScan(drp_eyescan)
+        sdata_mask = get_sdata_mask(dw)
+
         txdata = Signal(dw)
         rxdata = Signal(dw)
         rxphaligndone = Signal()
@@ -246,6 +273,31 @@ class GTHSingle(Module):
                 i_GTRESETSEL=0,
                 i_RESETOVRD=0,
 
+                # DRP
+                i_DRPCLK=ClockSignal(),
+                i_DRPADDR=drp.addr,
+                i_DRPDI=drp.di,
+                o_DRPDO=drp.do,
+                i_DRPWE=drp.we,
+                i_DRPEN=drp.en,
+                o_DRPRDY=drp.rdy,
+
+                # Eye scan
+                p_ES_EYE_SCAN_EN="TRUE",
+                p_ES_ERRDET_EN="TRUE",
+                p_ES_PRESCALE=0,
+                p_ES_QUAL_MASK0=0xffff,
+                p_ES_QUAL_MASK1=0xffff,
+                p_ES_QUAL_MASK2=0xffff,
+                p_ES_QUAL_MASK3=0xffff,
+                p_ES_QUAL_MASK4=0xffff,
+                p_ES_SDATA_MASK0=sdata_mask[0],
+                p_ES_SDATA_MASK1=sdata_mask[1],
+                p_ES_SDATA_MASK2=sdata_mask[2],
+                p_ES_SDATA_MASK3=sdata_mask[3],
+                p_ES_SDATA_MASK4=sdata_mask[4],
+                i_EYESCANRESET=0,
+
                 # PMA Attributes
                 p_PMA_RSV1=0xf800,
                 p_RX_BIAS_CFG0=0x0AB4,
@@ -312,7 +364,11 @@ class GTHSingle(Module):
                 i_TXPD=0b00,
                 p_TX_CLKMUX_EN=1,
                 i_TXBUFDIFFCTRL=0b000,
-                i_TXDIFFCTRL=0b1100,
+                i_TXDIFFCTRL=self.txdiffctrl.storage,
+                p_TX_MAINCURSOR_SEL=1,
+                i_TXMAINCURSOR=self.txmaincursor.storage,
+                i_TXPRECURSOR=self.txprecursor.storage,
+                i_TXPOSTCURSOR=self.txpostcursor.storage,
 
                 # RX Startup/Reset
                 i_GTRXRESET=rx_init.gtXxreset,
@@ -328,7 +384,7 @@ class GTHSingle(Module):
                 # RX AFE
                 i_RXDFEAGCCTRL=1,
                 i_RXDFEXYDEN=1,
-                i_RXLPMEN=1,
+                i_RXLPMEN=self.rxlpmen.storage,
                 i_RXOSINTCFG=0xd,
                 i_RXOSINTEN=1,
 
@@ -393,24 +449,48 @@ class GTHSingle(Module):
             AsyncResetSynchronizer(self.cd_rtio_rx, rx_reset_deglitched)
         ]
 
-        # tx data
-        self.comb += txdata.eq(Cat(*[encoder.output[i] for i in range(nwords)]))
-        
-        # rx data
+        # tx data and prbs
+        self.submodules.tx_prbs = ClockDomainsRenamer("rtio_tx")(PRBSTX(dw, True))
+        self.comb += [
+            self.tx_prbs.config.eq(self.tx_prbs_config.storage),
+            self.tx_prbs.i.eq(Cat(*[encoder.output[i] for i in range(nwords)])),
+            txdata.eq(self.tx_prbs.o)
+        ]
+
+        # rx data and prbs
         for i in range(nwords):
             self.comb += decoders[i].input.eq(rxdata[10*i:10*(i+1)])
+        self.submodules.rx_prbs = ClockDomainsRenamer("rtio_rx")(PRBSRX(dw, True))
+        rx_prbs_errors = BusSynchronizer(32, "rtio_rx", "sys")
+        self.submodules += rx_prbs_errors
+        self.comb += [
+            self.rx_prbs.config.eq(self.rx_prbs_config.storage),
+            self.rx_prbs.i.eq(rxdata),
+            rx_prbs_errors.i.eq(self.rx_prbs.errors),
+            self.rx_prbs_errors.status.eq(rx_prbs_errors.o)
+        ]
 
-        # clock alignment
+        # rx equalizer changes (lpm <--> dfe) require a rx reset (cf ug576)
+        rxlpmen_ps = PulseSynchronizer("sys", "rtio_tx")
+        self.submodules += rxlpmen_ps
+        self.comb += rxlpmen_ps.i.eq(self.rxlpmen.re)
+
+        # clock alignment (no commas are received in prbs mode, restarts
+        # are masked to keep the link up)
+        rx_prbs_enabled_sys = Signal()
+        rx_prbs_enabled = Signal()
+        self.comb += rx_prbs_enabled_sys.eq(self.rx_prbs_config.storage != 0)
+        self.specials += MultiReg(rx_prbs_enabled_sys, rx_prbs_enabled, "rtio_tx")
         clock_aligner = BruteforceClockAligner(0b0101111100, self.rtio_clk_freq)
         self.submodules += clock_aligner
         self.comb += [
             clock_aligner.rxdata.eq(rxdata),
-            rx_init.restart.eq(clock_aligner.restart),
+            rx_init.restart.eq((clock_aligner.restart & ~rx_prbs_enabled) | rxlpmen_ps.o),
             self.rx_ready.eq(clock_aligner.ready)
         ]
 
 
-class GTH(Module, TransceiverInterface):
+class GTH(Module, TransceiverInterface, AutoCSR):
     def __init__(self, plls, tx_pads, rx_pads, sys_clk_freq, dw, master=0):
         self.nchannels = nchannels = len(tx_pads)
         self.gths = []
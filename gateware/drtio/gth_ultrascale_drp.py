@@ -0,0 +1,143 @@
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+
+
+# Masters keep en asserted until rdy, the arbiter generates the single
+# cycle en pulse expected by the transceiver DRP.
+class DRPInterface(Record):
+    def __init__(self):
+        Record.__init__(self, [
+            ("addr", 9),
+            ("di",  16),
+            ("do",  16),
+            ("we",   1),
+            ("en",   1),
+            ("rdy",  1)
+        ])
+
+
+class DRPArbiter(Module):
+    def __init__(self, masters, slave):
+        grant = Signal(max=max(2, len(masters)))
+
+        # # #
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+
+        # lowest index wins
+        for i in reversed(range(len(masters))):
+            self.sync += If(fsm.ongoing("IDLE") & masters[i].en, grant.eq(i))
+
+        fsm.act("IDLE",
+            If(Cat(*[m.en for m in masters]) != 0,
+                NextState("REQUEST")
+            )
+        )
+        fsm.act("REQUEST",
+            slave.en.eq(1),
+            NextState("WAIT")
+        )
+        fsm.act("WAIT",
+            If(slave.rdy,
+                NextState("IDLE")
+            )
+        )
+
+        masters_array = Array(masters)
+        self.comb += [
+            slave.addr.eq(masters_array[grant].addr),
+            slave.di.eq(masters_array[grant].di),
+            slave.we.eq(masters_array[grant].we)
+        ]
+        for i, master in enumerate(masters):
+            self.comb += [
+                master.do.eq(slave.do),
+                master.rdy.eq(fsm.ongoing("WAIT") & slave.rdy & (grant == i))
+            ]
+
+
+class DRPAccess(Module):
+    def __init__(self, drp):
+        self.start = Signal()
+        self.write = Signal()
+        self.addr = Signal(9)
+        self.mask = Signal(16)
+        self.value = Signal(16)
+        self.done = Signal()
+        self.rdata = Signal(16)
+
+        # # #
+
+        write = Signal()
+        addr = Signal(9)
+        mask = Signal(16)
+        value = Signal(16)
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+
+        # read register, then optionally write back modified fields
+        fsm.act("IDLE",
+            If(self.start,
+                NextValue(write, self.write),
+                NextValue(addr, self.addr),
+                NextValue(mask, self.mask),
+                NextValue(value, self.value),
+                NextState("READ")
+            )
+        )
+        fsm.act("READ",
+            drp.en.eq(1),
+            drp.addr.eq(addr),
+            If(drp.rdy,
+                NextValue(self.rdata, drp.do),
+                If(write,
+                    NextState("WRITE")
+                ).Else(
+                    NextState("DONE")
+                )
+            )
+        )
+        fsm.act("WRITE",
+            drp.en.eq(1),
+            drp.we.eq(1),
+            drp.addr.eq(addr),
+            drp.di.eq((self.rdata & ~mask) | (value & mask)),
+            If(drp.rdy,
+                NextState("DONE")
+            )
+        )
+        fsm.act("DONE",
+            self.done.eq(1),
+            NextState("IDLE")
+        )
+
+
+class DRPControl(Module, AutoCSR):
+    def __init__(self, drp):
+        self.addr = CSRStorage(9)
+        self.di = CSRStorage(16)
+        self.we = CSRStorage()
+        self.start = CSR()
+        self.done = CSRStatus()
+        self.do = CSRStatus(16)
+
+        # # #
+
+        done = Signal(reset=1)
+        self.comb += [
+            drp.addr.eq(self.addr.storage),
+            drp.di.eq(self.di.storage),
+            drp.we.eq(self.we.storage),
+            drp.en.eq(~done),
+            self.done.status.eq(done)
+        ]
+        self.sync += \
+            If(self.start.re,
+                done.eq(0)
+            ).Elif(drp.rdy,
+                done.eq(1),
+                self.do.status.eq(drp.do)
+            )
@@ -0,0 +1,184 @@
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+
+from drtio.gth_ultrascale_drp import DRPAccess
+
+
+# GTHE3_CHANNEL eye scan DRP registers (cf ug576)
+ES_CONTROL_ADDR        = 0x03c # [15:10]: es_control, [4:0]: es_prescale
+ES_HORZ_OFFSET_ADDR    = 0x04f # [15:4]: es_horz_offset
+RX_EYESCAN_VS_ADDR     = 0x097 # [10]: neg_dir, [9]: ut_sign, [8:2]: code
+ES_ERROR_COUNT_ADDR    = 0x151
+ES_SAMPLE_COUNT_ADDR   = 0x152
+ES_CONTROL_STATUS_ADDR = 0x153 # [0]: done
+
+
+def get_sdata_mask(dw):
+    # 80 bits mask, rx data is compared on bits [40+dw-1:40] (cf ug576)
+    mask = (2**80 - 1) ^ ((2**dw - 1) << 40)
+    return [(mask >> 16*i) & 0xffff for i in range(5)]
+
+
+# Sweeps horizontal/vertical offsets and stores error/sample counts of each
+# point in memory: [15:0]: errors, [31:16]: samples. Both unrolled threshold
+# signs are accumulated since the receiver is used in LPM mode.
+class GTHEyeScan(Module, AutoCSR):
+    def __init__(self, drp, nhorz=32, nvert=16):
+        self.start = CSR()
+        self.done = CSRStatus()
+        self.prescale = CSRStorage(5)
+        self.horz_step = CSRStorage(8, reset=4)
+        self.vert_step = CSRStorage(7, reset=8)
+
+        self.specials.mem = Memory(32, nhorz*nvert)
+
+        # # #
+
+        self.submodules.access = access = DRPAccess(drp)
+
+        h = Signal(max=nhorz)
+        v = Signal(max=nvert)
+        ut_sign = Signal()
+        errors = Signal(17)
+        samples = Signal(17)
+
+        # offsets (horizontal offset saturates at +-1023, vertical code
+        # magnitude at 127: horz_step <= 1023//(nhorz//2) and vert_step <=
+        # 127//(nvert//2) for linear axes)
+        horz_product = Signal((16, True))
+        horz_offset = Signal((12, True))
+        vert_offset = Signal((16, True))
+        vert_magnitude = Signal(15)
+        vert_code = Signal(7)
+        self.comb += [
+            horz_product.eq((h - nhorz//2)*self.horz_step.storage),
+            If(horz_product > 1023,
+                horz_offset.eq(1023)
+            ).Elif(horz_product < -1023,
+                horz_offset.eq(-1023)
+            ).Else(
+                horz_offset.eq(horz_product)
+            ),
+            vert_offset.eq((v - nvert//2)*self.vert_step.storage),
+            If(vert_offset < 0,
+                vert_magnitude.eq(-vert_offset)
+            ).Else(
+                vert_magnitude.eq(vert_offset)
+            ),
+            If(vert_magnitude > 127,
+                vert_code.eq(127)
+            ).Else(
+                vert_code.eq(vert_magnitude)
+            )
+        ]
+
+        # memory
+        mem_port = self.mem.get_port(write_capable=True)
+        self.specials += mem_port
+        self.comb += [
+            mem_port.adr.eq(v*nhorz + h),
+            mem_port.dat_w[:16].eq(Mux(errors[16], 0xffff, errors[:16])),
+            mem_port.dat_w[16:].eq(Mux(samples[16], 0xffff, samples[:16]))
+        ]
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+
+        fsm.act("IDLE",
+            self.done.status.eq(1),
+            If(self.start.re,
+                NextValue(h, 0),
+                NextValue(v, 0),
+                NextState("SET_HORZ_OFFSET")
+            )
+        )
+        fsm.act("SET_HORZ_OFFSET",
+            access.start.eq(1),
+            access.write.eq(1),
+            access.addr.eq(ES_HORZ_OFFSET_ADDR),
+            access.mask.eq(0xfff0),
+            # bit 11 is set for negative offsets (phase unification)
+            access.value.eq(Cat(C(0, 4), horz_offset[:11], horz_offset < 0)),
+            If(access.done,
+                NextValue(ut_sign, 0),
+                NextValue(errors, 0),
+                NextValue(samples, 0),
+                NextState("SET_VERT_OFFSET")
+            )
+        )
+        fsm.act("SET_VERT_OFFSET",
+            access.start.eq(1),
+            access.write.eq(1),
+            access.addr.eq(RX_EYESCAN_VS_ADDR),
+            access.mask.eq(0x07fc),
+            access.value.eq(Cat(C(0, 2), vert_code, ut_sign, vert_offset < 0)),
+            If(access.done,
+                NextState("RUN")
+            )
+        )
+        fsm.act("RUN",
+            access.start.eq(1),
+            access.write.eq(1),
+            access.addr.eq(ES_CONTROL_ADDR),
+            access.mask.eq(0xfc1f),
+            access.value.eq(Cat(self.prescale.storage, C(0, 5), C(0b000001, 6))),
+            If(access.done,
+                NextState("WAIT_DONE")
+            )
+        )
+        fsm.act("WAIT_DONE",
+            access.start.eq(1),
+            access.addr.eq(ES_CONTROL_STATUS_ADDR),
+            If(access.done & access.rdata[0],
+                NextState("READ_ERRORS")
+            )
+        )
+        fsm.act("READ_ERRORS",
+            access.start.eq(1),
+            access.addr.eq(ES_ERROR_COUNT_ADDR),
+            If(access.done,
+                NextValue(errors, errors + access.rdata),
+                NextState("READ_SAMPLES")
+            )
+        )
+        fsm.act("READ_SAMPLES",
+            access.start.eq(1),
+            access.addr.eq(ES_SAMPLE_COUNT_ADDR),
+            If(access.done,
+                NextValue(samples, samples + access.rdata),
+                NextState("STOP")
+            )
+        )
+        fsm.act("STOP",
+            access.start.eq(1),
+            access.write.eq(1),
+            access.addr.eq(ES_CONTROL_ADDR),
+            access.mask.eq(0xfc00),
+            access.value.eq(0),
+            If(access.done,
+                If(ut_sign,
+                    NextState("STORE")
+                ).Else(
+                    NextValue(ut_sign, 1),
+                    NextState("SET_VERT_OFFSET")
+                )
+            )
+        )
+        fsm.act("STORE",
+            mem_port.we.eq(1),
+            NextState("NEXT")
+        )
+        fsm.act("NEXT",
+            NextState("SET_HORZ_OFFSET"),
+            If(h == (nhorz - 1),
+                NextValue(h, 0),
+                If(v == (nvert - 1),
+                    NextState("IDLE")
+                ).Else(
+                    NextValue(v, v + 1)
+                )
+            ).Else(
+                NextValue(h, h + 1)
+            )
+        )
@@ -1,15 +1,25 @@
 from math import ceil
 
 from litex.gen import *
-from litex.gen.genlib.cdc import MultiReg
+from litex.gen.genlib.cdc import MultiReg, BusSynchronizer
 from litex.gen.genlib.misc import WaitTimer
 
+from litex.soc.interconnect.csr import *
+
 
 class GTHInit(Module):
-    def __init__(self, sys_clk_freq, rx):
+    def __init__(self, sys_clk_freq, rx, pll_reset=True):
         self.done = Signal()
         self.restart = Signal()
 
+        # Instrumentation (in cycles of the init clock domain)
+        self.pll_lock_cycles = Signal(32)
+        self.resetdone_cycles = Signal(32)
+        self.align_cycles = Signal(32)
+        self.total_cycles = Signal(32)
+        self.restarts = Signal(16)
+        self.timeouts = Signal(16)
+
         # GTH signals
         self.plllock = Signal()
         self.pllreset = Signal()
@@ -47,8 +57,12 @@ class GTHInit(Module):
             self.Xxuserrdy.eq(Xxuserrdy)
         ]
 
-        # PLL reset must be at least 2us
-        pll_reset_cycles = ceil(2000*sys_clk_freq/1000000000)
+        # PLL reset must be at least 2us, when the PLL is not reset by us
+        # (or shared) only a short GTH reset pulse is generated.
+        if pll_reset:
+            pll_reset_cycles = ceil(2000*sys_clk_freq/1000000000)
+        else:
+            pll_reset_cycles = 16
         pll_reset_timer = WaitTimer(pll_reset_cycles)
         self.submodules += pll_reset_timer
 
@@ -73,7 +87,7 @@ class GTHInit(Module):
 
         startup_fsm.act("RESET_ALL",
             gtXxreset.eq(1),
-            self.pllreset.eq(1),
+            self.pllreset.eq(pll_reset),
             pll_reset_timer.wait.eq(1),
             If(pll_reset_timer.done,
                 NextState("RELEASE_PLL_RESET")
@@ -135,3 +149,59 @@ class GTHInit(Module):
             self.done.eq(1),
             If(self.restart, NextState("RESET_ALL"))
         )
+
+        # Instrumentation
+        elapsed = Signal(32)
+        resetdone_elapsed = Signal(32)
+        self.sync += [
+            If(startup_fsm.reset,
+                elapsed.eq(0)
+            ).Elif(~self.done,
+                elapsed.eq(elapsed + 1)
+            ),
+            If(startup_fsm.before_leaving("RELEASE_PLL_RESET"),
+                self.pll_lock_cycles.eq(elapsed)
+            ),
+            If(startup_fsm.before_leaving("RELEASE_GTH_RESET"),
+                self.resetdone_cycles.eq(elapsed),
+                resetdone_elapsed.eq(elapsed)
+            ),
+            If(startup_fsm.before_entering("READY"),
+                self.align_cycles.eq(elapsed - resetdone_elapsed),
+                self.total_cycles.eq(elapsed)
+            ),
+            If(self.restart & (self.restarts != (2**16-1)),
+                self.restarts.eq(self.restarts + 1)
+            ),
+            If(ready_timer.done & (self.timeouts != (2**16-1)),
+                self.timeouts.eq(self.timeouts + 1)
+            )
+        ]
+
+
+class GTHInitStatus(Module, AutoCSR):
+    def __init__(self, init, cd="sys"):
+        self.done = CSRStatus()
+        self.pll_lock_cycles = CSRStatus(32)
+        self.resetdone_cycles = CSRStatus(32)
+        self.align_cycles = CSRStatus(32)
+        self.total_cycles = CSRStatus(32)
+        self.restarts = CSRStatus(16)
+        self.timeouts = CSRStatus(16)
+
+        # # #
+
+        self.specials += MultiReg(init.done, self.done.status)
+        for name in ["pll_lock_cycles", "resetdone_cycles", "align_cycles",
+                     "total_cycles", "restarts", "timeouts"]:
+            i = getattr(init, name)
+            o = getattr(self, name).status
+            if cd == "sys":
+                self.comb += o.eq(i)
+            else:
+                synchronizer = BusSynchronizer(len(i), cd, "sys")
+                self.submodules += synchronizer
+                self.comb += [
+                    synchronizer.i.eq(i),
+                    o.eq(synchronizer.o)
+                ]
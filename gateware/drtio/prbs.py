@@ -6,12 +6,12 @@ from litex.gen.genlib.cdc import MultiReg
 
 
 class PRBSGenerator(Module):
-    def __init__(self, n_out, n_state=23, taps=[17, 22]):
+    def __init__(self, n_out, n_state=23, taps=[17, 22], seed=1):
         self.o = Signal(n_out)
 
         # # #s
 
-        state = Signal(n_state, reset=1)
+        state = Signal(n_state, reset=seed)
         curval = [state[i] for i in range(n_state)]
         curval += [0]*(n_out - n_state)
         for i in range(n_out):
@@ -26,18 +26,18 @@ class PRBSGenerator(Module):
 
 
 class PRBS7Generator(PRBSGenerator):
-    def __init__(self, n_out):
-        PRBSGenerator.__init__(self, n_out, n_state=7, taps=[5, 6])
+    def __init__(self, n_out, seed=1):
+        PRBSGenerator.__init__(self, n_out, n_state=7, taps=[5, 6], seed=seed)
 
 
 class PRBS15Generator(PRBSGenerator):
-    def __init__(self, n_out):
-        PRBSGenerator.__init__(self, n_out, n_state=15, taps=[13, 14])
+    def __init__(self, n_out, seed=1):
+        PRBSGenerator.__init__(self, n_out, n_state=15, taps=[13, 14], seed=seed)
 
 
 class PRBS31Generator(PRBSGenerator):
-    def __init__(self, n_out):
-        PRBSGenerator.__init__(self, n_out, n_state=31, taps=[27, 30])
+    def __init__(self, n_out, seed=1):
+        PRBSGenerator.__init__(self, n_out, n_state=31, taps=[27, 30], seed=seed)
 
 
 class PRBSTX(Module):
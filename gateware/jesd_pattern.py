@@ -0,0 +1,202 @@
+from math import sin, pi
+
+from litex.gen import *
+from litex.gen.genlib.cdc import MultiReg, PulseSynchronizer
+
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect.csr import *
+
+
+MODE_DDS  = 0
+MODE_AWG  = 1
+MODE_RAMP = 2
+MODE_ZERO = 3
+
+
+def get_sine_table(depth, width=16):
+    amplitude = 2**(width-1) - 1
+    return [int(round(amplitude*sin(2*pi*i/depth))) & (2**width-1)
+        for i in range(depth)]
+
+
+# One converter channel, nsamples 16-bit samples per jesd clock.
+#
+# The phase accumulator advances by nsamples*frequency each jesd clock and
+# the phase of each sample is derived from it, so the whole sample rate is
+# covered without running faster than the jesd clock.
+#
+# Modes:
+#  - MODE_DDS: sine lookup table addressed by the phase.
+#  - MODE_AWG: samples played from the channel memories (awg_length
+#    samples, multiple of nsamples, looped).
+#  - MODE_RAMP: phase msbs (sawtooth, replaces the previous ramp pattern).
+#  - MODE_ZERO: mid-scale.
+#
+# Amplitude is a 1.15 fixed point gain applied on all modes. CSR values are
+# resynchronized to the jesd domain and taken into account on update, which
+# also restarts all accumulators from their phase offset (channels of a
+# generator stay phase coherent).
+class _PatternChannel(Module, AutoCSR):
+    def __init__(self, nsamples, lut_depth, awg_depth, frequency=0):
+        self.mode = CSRStorage(2, reset=MODE_DDS)
+        self.frequency = CSRStorage(32, reset=frequency)
+        self.phase = CSRStorage(32)
+        self.amplitude = CSRStorage(16, reset=2**15-1)
+        self.awg_length = CSRStorage(log2_int(awg_depth) + 1, reset=awg_depth)
+
+        self.update = Signal()               # jesd domain
+        self.source = Signal(16*nsamples)    # jesd domain
+
+        # # #
+
+        # awg memories: each 32-bit word holds 2 samples, word n is stored
+        # at address n//nmems of memory n%nmems so that nsamples samples are
+        # read each jesd clock. Write ports are driven by the generator.
+        nmems = nsamples//2
+        self.awg_ports = []
+        awg_read_ports = []
+        for i in range(nmems):
+            mem = Memory(32, awg_depth//nsamples)
+            write_port = mem.get_port(write_capable=True)
+            read_port = mem.get_port(clock_domain="jesd")
+            self.specials += mem, write_port, read_port
+            self.awg_ports.append(write_port)
+            awg_read_ports.append(read_port)
+
+        # jesd domain configuration
+        mode = Signal(2, reset=MODE_DDS)
+        frequency = Signal(32, reset=frequency)
+        phase = Signal(32)
+        amplitude = Signal((17, True), reset=2**15-1)
+        awg_length = Signal(log2_int(awg_depth) + 1, reset=awg_depth)
+
+        def resync(csr, signal):
+            _signal = Signal(len(csr.storage), reset=csr.storage.reset)
+            self.specials += MultiReg(csr.storage, _signal, "jesd")
+            self.sync.jesd += If(self.update, signal.eq(_signal))
+
+        resync(self.mode, mode)
+        resync(self.frequency, frequency)
+        resync(self.phase, phase)
+        resync(self.amplitude, amplitude)
+        resync(self.awg_length, awg_length)
+
+        # phase accumulator
+        accumulator = Signal(32)
+        self.sync.jesd += \
+            If(self.update,
+                accumulator.eq(phase)
+            ).Else(
+                accumulator.eq(accumulator + (frequency << log2_int(nsamples)))
+            )
+
+        # awg word address
+        awg_address = Signal(log2_int(awg_depth//nsamples))
+        self.sync.jesd += \
+            If(self.update | (awg_address == (awg_length[log2_int(nsamples):] - 1)),
+                awg_address.eq(0)
+            ).Else(
+                awg_address.eq(awg_address + 1)
+            )
+        self.comb += [port.adr.eq(awg_address) for port in awg_read_ports]
+        awg_samples = []
+        for port in awg_read_ports:
+            awg_samples += [port.dat_r[0:16], port.dat_r[16:32]]
+
+        # sine lookup table (read only, replicated by synthesis if needed)
+        lut = Memory(16, lut_depth, init=get_sine_table(lut_depth))
+        self.specials += lut
+
+        # pipeline: phases -> lut / awg read -> mode selection -> gain
+        mode_d = Signal(2)
+        self.sync.jesd += mode_d.eq(mode)
+        samples = []
+        for i in range(nsamples):
+            sample_phase = Signal(32)
+            self.sync.jesd += sample_phase.eq(accumulator + frequency*i)
+
+            lut_port = lut.get_port(clock_domain="jesd")
+            self.specials += lut_port
+            self.comb += lut_port.adr.eq(sample_phase[32-log2_int(lut_depth):])
+
+            ramp = Signal(16)
+            self.sync.jesd += ramp.eq(sample_phase[16:])
+
+            # awg data is one cycle ahead of the lut, delay it
+            awg_sample = Signal(16)
+            self.sync.jesd += awg_sample.eq(awg_samples[i])
+
+            sample = Signal((16, True))
+            self.sync.jesd += \
+                Case(mode_d, {
+                    MODE_DDS:  sample.eq(lut_port.dat_r),
+                    MODE_AWG:  sample.eq(awg_sample),
+                    MODE_RAMP: sample.eq(ramp),
+                    MODE_ZERO: sample.eq(0)
+                })
+
+            product = Signal((33, True))
+            scaled = Signal(16)
+            self.sync.jesd += [
+                product.eq(sample*amplitude),
+                scaled.eq(product[15:31])
+            ]
+            samples.append(scaled)
+        self.comb += self.source.eq(Cat(*samples))
+
+
+# Test pattern generator for a JESD204B core: nconverters channels
+# (channel0..N CSRs), sources to connect to the converters of the core in
+# the jesd domain. Default frequencies are dacclk/32, dacclk/16, dacclk/8
+# and dacclk/4 as the previous ramp patterns.
+#
+# AWG memories are written through bus (write only), channel i samples at
+# byte offset 2*awg_depth*i, 2 samples per word (first sample in the lsbs).
+class JESDPatternGenerator(Module, AutoCSR):
+    def __init__(self, nconverters=4, nsamples=4, lut_depth=1024, awg_depth=4096):
+        assert nconverters & (nconverters - 1) == 0
+        self.bus = bus = wishbone.Interface()
+        self.bus_size = 2*awg_depth*nconverters
+
+        self.update = CSR()
+        self.nsamples = CSRStatus(8, reset=nsamples)
+        self.awg_depth = CSRStatus(32, reset=awg_depth)
+
+        self.sources = []
+
+        # # #
+
+        self.submodules.do_update = PulseSynchronizer("sys", "jesd")
+        self.comb += self.do_update.i.eq(self.update.re)
+
+        # bus address also holds the region bits, only decode the
+        # channel/word bits
+        nmems = nsamples//2
+        word_bits = log2_int(awg_depth//2)
+        mem_bits = log2_int(nmems)
+        channel_bits = log2_int(nconverters)
+        word = bus.adr[:word_bits]
+        channel = bus.adr[word_bits:word_bits+channel_bits]
+
+        ack = Signal()
+        self.sync += ack.eq(bus.stb & bus.cyc & ~ack)
+        self.comb += [
+            bus.ack.eq(ack),
+            bus.dat_r.eq(0)
+        ]
+
+        for i in range(nconverters):
+            _channel = _PatternChannel(nsamples, lut_depth, awg_depth,
+                                       frequency=2**(27+i))
+            setattr(self.submodules, "channel"+str(i), _channel)
+            self.comb += _channel.update.eq(self.do_update.o)
+            for j, port in enumerate(_channel.awg_ports):
+                channel_sel = (channel == i) if channel_bits else 1
+                mem_sel = (word[:mem_bits] == j) if mem_bits else 1
+                self.comb += [
+                    port.adr.eq(word[mem_bits:]),
+                    port.dat_w.eq(bus.dat_w),
+                    port.we.eq(bus.stb & bus.cyc & bus.we & ~ack &
+                               channel_sel & mem_sel)
+                ]
+            self.sources.append(_channel.source)
@@ -0,0 +1,254 @@
+from functools import reduce
+from operator import or_
+
+from litex.gen import *
+from litex.gen.genlib.fifo import SyncFIFO
+
+from litex.soc.interconnect.csr import *
+
+from litedram.frontend.dma import LiteDRAMDMAWriter, LiteDRAMDMAReader
+
+from drtio.prbs import PRBS31Generator
+
+
+# Data of the word n of a run: n-th output of a PRBS31 generator (reset at
+# start) xored with the seed replicated on the word, addresses are in port
+# words.
+def get_data_generator(dw):
+    return ResetInserter()(CEInserter()(PRBS31Generator(dw)))
+
+
+class _BISTGenerator(Module):
+    def __init__(self, port):
+        self.start = Signal()
+        self.done = Signal()
+        self.base = Signal(port.aw)
+        self.length = Signal(port.aw)
+        self.seed = Signal(32)
+        self.ticks = Signal(32)
+
+        # # #
+
+        self.submodules.dma = dma = LiteDRAMDMAWriter(port)
+        self.submodules.data = data = get_data_generator(port.dw)
+
+        counter = Signal(port.aw)
+        self.comb += [
+            dma.sink.address.eq(self.base + counter),
+            dma.sink.data.eq(data.o ^ Replicate(self.seed, port.dw//32))
+        ]
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+        fsm.act("IDLE",
+            self.done.eq(1),
+            If(self.start & (self.length != 0),
+                NextValue(counter, 0),
+                NextValue(self.ticks, 0),
+                data.reset.eq(1),
+                NextState("RUN")
+            )
+        )
+        fsm.act("RUN",
+            dma.sink.valid.eq(1),
+            NextValue(self.ticks, self.ticks + 1),
+            If(dma.sink.ready,
+                data.ce.eq(1),
+                NextValue(counter, counter + 1),
+                If(counter == (self.length - 1),
+                    NextState("IDLE")
+                )
+            )
+        )
+
+
+class _BISTChecker(Module):
+    def __init__(self, port):
+        self.start = Signal()
+        self.done = Signal()
+        self.base = Signal(port.aw)
+        self.length = Signal(port.aw)
+        self.seed = Signal(32)
+        self.ticks = Signal(32)
+        self.errors = Signal(32)
+        self.byte_errors = Signal(port.dw//8) # sticky, per byte of the port word
+
+        # failing words (error_bits set on the bits in error)
+        self.error_valid = Signal()
+        self.error_address = Signal(port.aw)
+        self.error_expected = Signal(port.dw)
+        self.error_actual = Signal(port.dw)
+        self.error_bits = Signal(port.dw)
+
+        # # #
+
+        self.submodules.dma = dma = LiteDRAMDMAReader(port)
+        self.submodules.data = data = get_data_generator(port.dw)
+
+        cmd_counter = Signal(port.aw)
+        data_counter = Signal(port.aw)
+        expected = Signal(port.dw)
+        mismatch = Signal(port.dw//8)
+        self.comb += [
+            dma.sink.address.eq(self.base + cmd_counter),
+            expected.eq(data.o ^ Replicate(self.seed, port.dw//32)),
+            mismatch.eq(Cat(*[dma.source.data[8*i:8*(i+1)] != expected[8*i:8*(i+1)]
+                              for i in range(port.dw//8)])),
+            self.error_address.eq(self.base + data_counter),
+            self.error_expected.eq(expected),
+            self.error_actual.eq(dma.source.data),
+            self.error_bits.eq(dma.source.data ^ expected)
+        ]
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+        fsm.act("IDLE",
+            self.done.eq(1),
+            If(self.start & (self.length != 0),
+                NextValue(cmd_counter, 0),
+                NextValue(data_counter, 0),
+                NextValue(self.ticks, 0),
+                NextValue(self.errors, 0),
+                NextValue(self.byte_errors, 0),
+                data.reset.eq(1),
+                NextState("RUN")
+            )
+        )
+        fsm.act("RUN",
+            NextValue(self.ticks, self.ticks + 1),
+            dma.sink.valid.eq(cmd_counter != self.length),
+            If(dma.sink.valid & dma.sink.ready,
+                NextValue(cmd_counter, cmd_counter + 1)
+            ),
+            dma.source.ready.eq(1),
+            If(dma.source.valid,
+                data.ce.eq(1),
+                NextValue(data_counter, data_counter + 1),
+                If(mismatch != 0,
+                    self.error_valid.eq(1),
+                    NextValue(self.errors, self.errors + 1)
+                ),
+                NextValue(self.byte_errors, self.byte_errors | mismatch),
+                If(data_counter == (self.length - 1),
+                    NextState("IDLE")
+                )
+            )
+        )
+
+
+# CSR interfaces, compatible with LiteDRAMBISTGenerator/LiteDRAMBISTChecker
+# (base and length in bytes).
+class BISTGenerator(Module, AutoCSR):
+    def __init__(self, port):
+        self.reset = CSR()
+        self.start = CSR()
+        self.done = CSRStatus()
+        self.base = CSRStorage(32)
+        self.length = CSRStorage(32)
+        self.seed = CSRStorage(32)
+        self.ticks = CSRStatus(32)
+
+        # # #
+
+        shift = log2_int(port.dw//8)
+
+        core = ResetInserter()(_BISTGenerator(port))
+        self.submodules.core = core
+        self.comb += [
+            core.reset.eq(self.reset.re),
+            core.start.eq(self.start.re),
+            core.base.eq(self.base.storage[shift:]),
+            core.length.eq(self.length.storage[shift:]),
+            core.seed.eq(self.seed.storage),
+            self.done.status.eq(core.done),
+            self.ticks.status.eq(core.ticks)
+        ]
+
+
+# Errors are also counted per dq byte lane and per dq bit (bit n of the
+# dfi data is on dq n % databits), the first failing words are captured
+# in a fifo (address in bytes, expected and actual data) that is read
+# with failure_pop.
+class BISTChecker(Module, AutoCSR):
+    def __init__(self, port, databits, nfailures=16):
+        nlanes = databits//8
+
+        self.reset = CSR()
+        self.start = CSR()
+        self.done = CSRStatus()
+        self.base = CSRStorage(32)
+        self.length = CSRStorage(32)
+        self.seed = CSRStorage(32)
+        self.ticks = CSRStatus(32)
+        self.errors = CSRStatus(32)
+
+        self.nlanes = CSRStatus(8, reset=nlanes)
+        for i in range(nlanes):
+            setattr(self, "lane{}_errors".format(i), CSRStatus(32, name="lane{}_errors".format(i)))
+        for i in range(databits):
+            setattr(self, "bit{}_errors".format(i), CSRStatus(32, name="bit{}_errors".format(i)))
+
+        self.failure_readable = CSRStatus()
+        self.failure_pop = CSR()
+        self.failure_address = CSRStatus(32)
+        self.failure_expected = CSRStatus(port.dw)
+        self.failure_actual = CSRStatus(port.dw)
+
+        # # #
+
+        shift = log2_int(port.dw//8)
+
+        core = ResetInserter()(_BISTChecker(port))
+        self.submodules.core = core
+        self.comb += [
+            core.reset.eq(self.reset.re),
+            core.start.eq(self.start.re),
+            core.base.eq(self.base.storage[shift:]),
+            core.length.eq(self.length.storage[shift:]),
+            core.seed.eq(self.seed.storage),
+            self.done.status.eq(core.done),
+            self.ticks.status.eq(core.ticks),
+            self.errors.status.eq(core.errors)
+        ]
+
+        clear = Signal()
+        self.comb += clear.eq(self.reset.re | (self.start.re & core.done))
+
+        # per bit / per lane error counters
+        bit_errors = Signal(databits)
+        for i in range(databits):
+            self.comb += bit_errors[i].eq(reduce(or_,
+                [core.error_bits[j] for j in range(i, port.dw, databits)]))
+            counter = getattr(self, "bit{}_errors".format(i)).status
+            self.sync += \
+                If(clear,
+                    counter.eq(0)
+                ).Elif(core.error_valid & bit_errors[i],
+                    counter.eq(counter + 1)
+                )
+        for i in range(nlanes):
+            counter = getattr(self, "lane{}_errors".format(i)).status
+            self.sync += \
+                If(clear,
+                    counter.eq(0)
+                ).Elif(core.error_valid & (bit_errors[8*i:8*(i+1)] != 0),
+                    counter.eq(counter + 1)
+                )
+
+        # first failures
+        failure_address = Signal(32)
+        self.comb += failure_address.eq(core.error_address << shift)
+        fifo = ResetInserter()(SyncFIFO(32 + 2*port.dw, nfailures))
+        self.submodules.fifo = fifo
+        self.comb += [
+            fifo.reset.eq(clear),
+            fifo.we.eq(core.error_valid),
+            fifo.din.eq(Cat(failure_address,
+                            core.error_expected,
+                            core.error_actual)),
+            self.failure_readable.status.eq(fifo.readable),
+            self.failure_address.status.eq(fifo.dout[:32]),
+            self.failure_expected.status.eq(fifo.dout[32:32+port.dw]),
+            self.failure_actual.status.eq(fifo.dout[32+port.dw:]),
+            fifo.re.eq(self.failure_pop.re)
+        ]
@@ -0,0 +1,279 @@
+from litex.gen import *
+from litex.gen.genlib.fifo import SyncFIFO
+
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect.csr import *
+
+from litedram.frontend.dma import LiteDRAMDMAWriter
+
+
+FLAG_MASKED   = 0b01
+FLAG_OVERFLOW = 0b10
+
+
+# Captures a group of signals to the sdram through a native port, with
+# run length encoding: a record is written (one port word) each time the
+# sample changes, data in bits [0:dw-34], flags in bits [dw-34:dw-32],
+# number of cycles the sample was held in bits [dw-32:dw]. Capture starts
+# when (sample & trigger_mask) == trigger_value or on the trigger input and
+# stops when length bytes are written or on stop.
+#
+# Records are queued until burst records are available, then written in
+# one burst. Since the capture writes through the controller it observes,
+# samples are ignored while writes are in flight (from the first command
+# to holdoff cycles after the last write data), the window is written as
+# a single record with FLAG_MASKED. This also masks the traffic of other
+# ports during the window but keeps the capture from recording its own
+# writes. burst (up to fifo_depth - 1) sets the length of the contiguous
+# windows between masked ones, cycles/masked_cycles report the masked
+# ratio.
+#
+# Records that do not fit in the fifo are dropped and counted in
+# overflows, their cycles are added to the next record which gets
+# FLAG_OVERFLOW (the timeline keeps its length).
+#
+# Records are read back through bus (offset 0 is base) with native reads
+# on read_port, bypassing the L2 cache of the main_ram which can hold
+# stale lines of a previous capture.
+class StreamingCapture(Module, AutoCSR):
+    def __init__(self, groups, port, read_port, fifo_depth=512, burst=64, holdoff=16,
+                 bus_size=2**28):
+        self.groups = groups
+        data_width = max(len(Cat(*signals)) for signals in groups.values())
+        assert data_width <= port.dw - 34
+        assert burst < fifo_depth
+        shift = log2_int(port.dw//8)
+
+        self.trigger = Signal()
+        self.bus = bus = wishbone.Interface()
+        self.bus_size = bus_size
+
+        self.group = CSRStorage(8)
+        self.trigger_value = CSRStorage(data_width)
+        self.trigger_mask = CSRStorage(data_width)
+        self.base = CSRStorage(32)
+        self.length = CSRStorage(32)
+        self.burst = CSRStorage(bits_for(fifo_depth - 1), reset=burst)
+        self.holdoff = CSRStorage(8, reset=holdoff)
+        self.start = CSR()
+        self.stop = CSR()
+        self.done = CSRStatus()
+        self.triggered = CSRStatus()
+        self.records = CSRStatus(32)
+        self.overflows = CSRStatus(32)
+        self.cycles = CSRStatus(64)
+        self.masked_cycles = CSRStatus(64)
+        self.word_bytes = CSRStatus(8, reset=port.dw//8)
+
+        # # #
+
+        # sample
+        data = Signal(data_width)
+        sample = Signal(data_width)
+        self.comb += Case(self.group.storage,
+            {n: data.eq(Cat(*signals)) for n, signals in groups.items()})
+        self.sync += sample.eq(data)
+
+        # records fifo and dma
+        self.submodules.fifo = fifo = SyncFIFO(port.dw, fifo_depth)
+        self.submodules.dma = dma = LiteDRAMDMAWriter(port)
+        dma_counter = Signal(32)
+        drain = Signal()
+        flush = Signal()
+        self.comb += [
+            dma.sink.valid.eq(fifo.readable & drain),
+            dma.sink.address.eq(self.base.storage[shift:] + dma_counter),
+            dma.sink.data.eq(fifo.dout),
+            fifo.re.eq(dma.sink.ready & drain)
+        ]
+        self.sync += [
+            If(self.start.re,
+                dma_counter.eq(0)
+            ).Elif(dma.sink.valid & dma.sink.ready,
+                dma_counter.eq(dma_counter + 1)
+            ),
+            If(~fifo.readable,
+                drain.eq(0)
+            ).Elif((fifo.level >= self.burst.storage) | flush,
+                drain.eq(1)
+            )
+        ]
+
+        # writes in flight: commands accepted by the port and not yet
+        # followed by their data, then holdoff cycles for the data to be
+        # seen on the dfi
+        pending = Signal(16)
+        holdoff_counter = Signal(8)
+        busy = Signal()
+        self.sync += [
+            If(port.cmd.valid & port.cmd.ready & ~(port.wdata.valid & port.wdata.ready),
+                pending.eq(pending + 1)
+            ).Elif(~(port.cmd.valid & port.cmd.ready) & port.wdata.valid & port.wdata.ready,
+                pending.eq(pending - 1)
+            ),
+            If(port.cmd.valid | (pending != 0),
+                holdoff_counter.eq(self.holdoff.storage)
+            ).Elif(holdoff_counter != 0,
+                holdoff_counter.eq(holdoff_counter - 1)
+            )
+        ]
+        self.comb += busy.eq(port.cmd.valid | (pending != 0) | (holdoff_counter != 0))
+
+        # run length encoding
+        run_data = Signal(data_width)
+        run_flags = Signal(2)
+        run_count = Signal(32)
+        run_end = Signal()
+        records = Signal(32)
+        overflows = Signal(32)
+        stop = Signal()
+        done = Signal(reset=1)
+        triggered = Signal()
+        cycles = Signal(64)
+        masked_cycles = Signal(64)
+        self.comb += [
+            fifo.din.eq(Cat(run_data, C(0, port.dw - 34 - data_width), run_flags, run_count)),
+            If(run_flags & FLAG_MASKED,
+                run_end.eq(~busy)
+            ).Else(
+                run_end.eq(busy | (sample != run_data))
+            ),
+            self.done.status.eq(done),
+            self.triggered.status.eq(triggered),
+            self.records.status.eq(records),
+            self.overflows.status.eq(overflows),
+            self.cycles.status.eq(cycles),
+            self.masked_cycles.status.eq(masked_cycles)
+        ]
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+        fsm.act("IDLE",
+            If(self.start.re,
+                NextValue(done, 0),
+                NextValue(triggered, 0),
+                NextValue(stop, 0),
+                NextValue(records, 0),
+                NextValue(overflows, 0),
+                NextState("WAIT_TRIGGER")
+            )
+        )
+        fsm.act("WAIT_TRIGGER",
+            If(((sample & self.trigger_mask.storage) ==
+                (self.trigger_value.storage & self.trigger_mask.storage)) | self.trigger,
+                NextValue(triggered, 1),
+                NextValue(run_data, sample),
+                NextValue(run_flags, Mux(busy, FLAG_MASKED, 0)),
+                NextValue(run_count, 1),
+                NextState("CAPTURE")
+            ),
+            If(self.stop.re,
+                NextState("FLUSH")
+            )
+        )
+        fsm.act("CAPTURE",
+            If(self.stop.re,
+                NextValue(stop, 1)
+            ),
+            If(run_end | (run_count == (2**32-1)) | stop,
+                fifo.we.eq(1),
+                NextValue(run_data, sample),
+                If(fifo.writable,
+                    NextValue(records, records + 1),
+                    NextValue(run_flags, Mux(busy, FLAG_MASKED, 0)),
+                    NextValue(run_count, 1),
+                    If(stop | (records == ((self.length.storage >> shift) - 1)),
+                        NextState("FLUSH")
+                    )
+                ).Else(
+                    NextValue(overflows, overflows + 1),
+                    NextValue(run_flags, Mux(busy, FLAG_MASKED, 0) | FLAG_OVERFLOW),
+                    If(run_count != (2**32-1),
+                        NextValue(run_count, run_count + 1)
+                    )
+                )
+            ).Else(
+                NextValue(run_count, run_count + 1)
+            )
+        )
+        # done when the records are written: fifo empty and no write in
+        # flight in the dma
+        fsm.act("FLUSH",
+            flush.eq(1),
+            If(~fifo.readable & ~busy,
+                NextValue(done, 1),
+                NextState("IDLE")
+            )
+        )
+        self.sync += \
+            If(self.start.re,
+                cycles.eq(0),
+                masked_cycles.eq(0)
+            ).Elif(fsm.ongoing("CAPTURE"),
+                cycles.eq(cycles + 1),
+                If(busy,
+                    masked_cycles.eq(masked_cycles + 1)
+                )
+            )
+
+        # readback (the last port word read is kept for the next 32-bit
+        # accesses, bus address also holds the region bits)
+        nwords = port.dw//32
+        offset = bus.adr[:log2_int(bus_size//4)]
+        readback_adr = Signal(read_port.aw)
+        readback_data = Signal(read_port.dw)
+        readback_valid = Signal()
+        readback_load = Signal()
+        word_adr = Signal(read_port.aw)
+        self.comb += word_adr.eq(self.base.storage[shift:] + offset[log2_int(nwords):])
+        self.sync += \
+            If(self.start.re,
+                readback_valid.eq(0)
+            ).Elif(readback_load,
+                readback_valid.eq(1),
+                readback_adr.eq(word_adr),
+                readback_data.eq(read_port.rdata.data)
+            )
+        readback_words = Array(readback_data[32*i:32*(i+1)] for i in range(nwords))
+        self.comb += bus.dat_r.eq(readback_words[offset[:log2_int(nwords)]])
+
+        readback_fsm = FSM(reset_state="IDLE")
+        self.submodules += readback_fsm
+        readback_fsm.act("IDLE",
+            If(bus.cyc & bus.stb,
+                If(bus.we | (readback_valid & (readback_adr == word_adr)),
+                    NextState("ACK")
+                ).Else(
+                    NextState("CMD")
+                )
+            )
+        )
+        readback_fsm.act("CMD",
+            read_port.cmd.valid.eq(1),
+            read_port.cmd.we.eq(0),
+            read_port.cmd.adr.eq(word_adr),
+            If(read_port.cmd.ready,
+                NextState("DATA")
+            )
+        )
+        readback_fsm.act("DATA",
+            read_port.rdata.ready.eq(1),
+            If(read_port.rdata.valid,
+                readback_load.eq(1),
+                NextState("ACK")
+            )
+        )
+        readback_fsm.act("ACK",
+            bus.ack.eq(1),
+            NextState("IDLE")
+        )
+
+    def export_csv(self, vns, filename):
+        def format_line(*args):
+            return ",".join(args) + "\n"
+        r = format_line("config", "None", "data_width", str(len(self.trigger_value.storage)))
+        for n, signals in sorted(self.groups.items()):
+            for s in signals:
+                r += format_line("signal", str(n), vns.get_name(s), str(len(s)))
+        with open(filename, "w") as f:
+            f.write(r)
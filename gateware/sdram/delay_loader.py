@@ -0,0 +1,121 @@
+from litex.gen import *
+
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect.csr import *
+
+
+TARGET_WDLY_DQ  = 0
+TARGET_WDLY_DQS = 1
+TARGET_RDLY_DQ  = 2
+
+
+# Loads delay values in the phy: a write to load selects the modules of
+# the mask, resets the delay of the target and increments it to value
+# (stepped through the phy CSRs, addresses provided by the host), a
+# setting is then applied with a single write instead of value + 2.
+#
+# load:
+#  - value (bits 0-8).
+#  - bitslip (bits 9-11, TARGET_RDLY_DQ only, the phy resets it with the
+#    read delay).
+#  - module mask (bits 16-23).
+#  - target (bits 24-25).
+class DDRDelayLoader(Module, AutoCSR):
+    def __init__(self):
+        self.bus = bus = wishbone.Interface()
+
+        self.load = CSRStorage(32)
+        self.done = CSRStatus()
+
+        self.dly_sel_addr = CSRStorage(32)
+        self.wdly_dq_rst_addr = CSRStorage(32)
+        self.wdly_dq_inc_addr = CSRStorage(32)
+        self.wdly_dqs_rst_addr = CSRStorage(32)
+        self.wdly_dqs_inc_addr = CSRStorage(32)
+        self.rdly_dq_rst_addr = CSRStorage(32)
+        self.rdly_dq_inc_addr = CSRStorage(32)
+        self.rdly_dq_bitslip_addr = CSRStorage(32)
+
+        # # #
+
+        value = Signal(9)
+        bitslip = Signal(3)
+        mask = Signal(8)
+        target = Signal(2)
+        count = Signal(9)
+        done = Signal(reset=1)
+        self.comb += self.done.status.eq(done)
+
+        rst_addr = Signal(32)
+        inc_addr = Signal(32)
+        self.comb += \
+            Case(target, {
+                TARGET_WDLY_DQ: [
+                    rst_addr.eq(self.wdly_dq_rst_addr.storage),
+                    inc_addr.eq(self.wdly_dq_inc_addr.storage)
+                ],
+                TARGET_WDLY_DQS: [
+                    rst_addr.eq(self.wdly_dqs_rst_addr.storage),
+                    inc_addr.eq(self.wdly_dqs_inc_addr.storage)
+                ],
+                "default": [
+                    rst_addr.eq(self.rdly_dq_rst_addr.storage),
+                    inc_addr.eq(self.rdly_dq_inc_addr.storage)
+                ]
+            })
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+
+        def bus_write(addr, dat_w, next_state, *ack_statements):
+            return [
+                bus.stb.eq(1),
+                bus.cyc.eq(1),
+                bus.we.eq(1),
+                bus.sel.eq(0xf),
+                bus.adr.eq(addr[2:]),
+                bus.dat_w.eq(dat_w),
+                If(bus.ack,
+                    *ack_statements,
+                    NextState(next_state)
+                )
+            ]
+
+        fsm.act("IDLE",
+            If(self.load.re,
+                NextValue(done, 0),
+                NextValue(value, self.load.storage[0:9]),
+                NextValue(bitslip, self.load.storage[9:12]),
+                NextValue(mask, self.load.storage[16:24]),
+                NextValue(target, self.load.storage[24:26]),
+                NextState("SELECT")
+            )
+        )
+        fsm.act("SELECT",
+            bus_write(self.dly_sel_addr.storage, mask, "RESET")
+        )
+        fsm.act("RESET",
+            bus_write(rst_addr, 1, "BITSLIP",
+                NextValue(count, 0)
+            )
+        )
+        fsm.act("BITSLIP",
+            If((target != TARGET_RDLY_DQ) | (count == bitslip),
+                NextValue(count, 0),
+                NextState("INC")
+            ).Else(
+                bus_write(self.rdly_dq_bitslip_addr.storage, 1, "BITSLIP",
+                    NextValue(count, count + 1)
+                )
+            )
+        )
+        fsm.act("INC",
+            If(count == value,
+                NextValue(done, 1),
+                NextState("IDLE")
+            ).Else(
+                bus_write(inc_addr, 1, "INC",
+                    NextValue(count, count + 1)
+                )
+            )
+        )
@@ -0,0 +1,121 @@
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+
+from drtio.prbs import PRBS31Generator
+
+
+# Issues count single reads (one at a time) on a native port and builds
+# an histogram of the command to data latency (cycles from the command
+# handshake to the read data) in memory: bin n counts the reads with a
+# latency of n cycles, last bin also counts longer latencies. Addresses
+# (in port words, relative to base) are sequential or random & (length - 1)
+# (length must then be a power of two). Latencies under load are obtained
+# by running the traffic generator or the soak test concurrently.
+class LatencyProbe(Module, AutoCSR):
+    def __init__(self, port, nbins=256):
+        self.start = CSR()
+        self.done = CSRStatus()
+        self.count = CSRStorage(32, reset=1024)
+        self.random = CSRStorage()
+        self.base = CSRStorage(port.aw)
+        self.length = CSRStorage(port.aw + 1, reset=2**port.aw)
+        self.nbins = CSRStatus(16, reset=nbins)
+        self.word_bytes = CSRStatus(8, reset=port.dw//8)
+        self.min = CSRStatus(32)
+        self.max = CSRStatus(32)
+
+        self.specials.mem = Memory(32, nbins, name="histogram")
+
+        # # #
+
+        self.submodules.prbs = prbs = PRBS31Generator(32)
+
+        counter = Signal(32)
+        offset = Signal(port.aw + 1)
+        latency = Signal(32)
+        latency_min = Signal(32)
+        latency_max = Signal(32)
+        index = Signal(max=nbins)
+        clear = Signal()
+        self.comb += [
+            self.min.status.eq(latency_min),
+            self.max.status.eq(latency_max)
+        ]
+
+        # memory
+        mem_port = self.mem.get_port(write_capable=True)
+        self.specials += mem_port
+        self.comb += [
+            mem_port.adr.eq(index),
+            mem_port.dat_w.eq(Mux(clear, 0, mem_port.dat_r + 1))
+        ]
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+        fsm.act("IDLE",
+            self.done.status.eq(1),
+            If(self.start.re,
+                NextValue(index, 0),
+                NextValue(counter, 0),
+                NextValue(offset, 0),
+                NextValue(latency_min, 2**32-1),
+                NextValue(latency_max, 0),
+                NextState("CLEAR")
+            )
+        )
+        fsm.act("CLEAR",
+            clear.eq(1),
+            mem_port.we.eq(1),
+            NextValue(index, index + 1),
+            If(index == (nbins - 1),
+                NextState("CMD")
+            )
+        )
+        fsm.act("CMD",
+            If(counter == self.count.storage,
+                NextState("IDLE")
+            ).Else(
+                port.cmd.valid.eq(1),
+                port.cmd.we.eq(0),
+                port.cmd.adr.eq(self.base.storage + offset),
+                If(port.cmd.ready,
+                    NextValue(latency, 0),
+                    If(self.random.storage,
+                        NextValue(offset, prbs.o & (self.length.storage - 1))
+                    ).Elif(offset == (self.length.storage - 1),
+                        NextValue(offset, 0)
+                    ).Else(
+                        NextValue(offset, offset + 1)
+                    ),
+                    NextState("WAIT")
+                )
+            )
+        )
+        fsm.act("WAIT",
+            port.rdata.ready.eq(1),
+            NextValue(latency, latency + 1),
+            If(port.rdata.valid,
+                If(latency < latency_min,
+                    NextValue(latency_min, latency)
+                ),
+                If(latency > latency_max,
+                    NextValue(latency_max, latency)
+                ),
+                If(latency >= (nbins - 1),
+                    NextValue(index, nbins - 1)
+                ).Else(
+                    NextValue(index, latency)
+                ),
+                NextState("READ_BIN")
+            )
+        )
+        # memory read latency is 1 cycle
+        fsm.act("READ_BIN",
+            NextState("WRITE_BIN")
+        )
+        fsm.act("WRITE_BIN",
+            mem_port.we.eq(1),
+            NextValue(counter, counter + 1),
+            NextState("CMD")
+        )
@@ -0,0 +1,142 @@
+from functools import reduce
+from operator import or_
+
+from litex.gen import *
+
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect.csr import *
+
+from sdram.bist import _BISTGenerator, _BISTChecker
+
+
+# Read leveling sweep: writes a pattern once, then for each bitslip and
+# read delay of the phy (stepped through its CSRs, addresses provided by
+# the host) reads the pattern back and stores the pass bitmap of the lanes
+# in memory at index bitslip*ndelays + delay.
+class LevelingSweep(Module, AutoCSR):
+    def __init__(self, write_port, read_port, nlanes, ndelays=512, nbitslips=8):
+        self.bus = bus = wishbone.Interface()
+
+        self.start = CSR()
+        self.done = CSRStatus()
+        self.length = CSRStorage(16, reset=64)
+        self.nlanes = CSRStatus(8, reset=nlanes)
+        self.ndelays = CSRStatus(16, reset=ndelays)
+        self.nbitslips = CSRStatus(8, reset=nbitslips)
+
+        self.dly_sel_addr = CSRStorage(32)
+        self.rdly_dq_rst_addr = CSRStorage(32)
+        self.rdly_dq_inc_addr = CSRStorage(32)
+        self.rdly_dq_bitslip_addr = CSRStorage(32)
+
+        # # #
+
+        self.submodules.generator = generator = _BISTGenerator(write_port)
+        self.submodules.checker = checker = _BISTChecker(read_port)
+        self.comb += [
+            generator.length.eq(self.length.storage),
+            checker.length.eq(self.length.storage)
+        ]
+
+        # results memory (host access through sram)
+        mem = Memory(32, ndelays*nbitslips)
+        self.submodules.sram = wishbone.SRAM(mem, read_only=True)
+        mem_port = mem.get_port(write_capable=True)
+        self.specials += mem_port
+
+        # lane i carries bytes i, i + nlanes, ... of the port word
+        lane_errors = Signal(nlanes)
+        for i in range(nlanes):
+            self.comb += lane_errors[i].eq(reduce(or_,
+                [checker.byte_errors[j] for j in range(i, len(checker.byte_errors), nlanes)]))
+
+        delay = Signal(max=ndelays)
+        bitslip = Signal(max=nbitslips)
+        count = Signal(max=nbitslips)
+        done = Signal(reset=1)
+        self.comb += [
+            mem_port.adr.eq(bitslip*ndelays + delay),
+            mem_port.dat_w.eq(~lane_errors),
+            self.done.status.eq(done)
+        ]
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+
+        def bus_write(addr, dat_w, next_state, *ack_statements):
+            return [
+                bus.stb.eq(1),
+                bus.cyc.eq(1),
+                bus.we.eq(1),
+                bus.sel.eq(0xf),
+                bus.adr.eq(addr[2:]),
+                bus.dat_w.eq(dat_w),
+                If(bus.ack,
+                    *ack_statements,
+                    NextState(next_state)
+                )
+            ]
+
+        fsm.act("IDLE",
+            If(self.start.re,
+                NextValue(done, 0),
+                NextValue(bitslip, 0),
+                NextState("WRITE")
+            )
+        )
+        # pattern is written once, read delays do not affect writes
+        fsm.act("WRITE",
+            generator.start.eq(1),
+            NextState("WRITE_WAIT")
+        )
+        fsm.act("WRITE_WAIT",
+            If(generator.done,
+                NextState("SELECT")
+            )
+        )
+        fsm.act("SELECT",
+            bus_write(self.dly_sel_addr.storage, 2**nlanes-1, "RESET")
+        )
+        fsm.act("RESET",
+            bus_write(self.rdly_dq_rst_addr.storage, 1, "BITSLIP",
+                NextValue(count, 0),
+                NextValue(delay, 0)
+            )
+        )
+        fsm.act("BITSLIP",
+            If(count == bitslip,
+                NextState("CHECK")
+            ).Else(
+                bus_write(self.rdly_dq_bitslip_addr.storage, 1, "BITSLIP",
+                    NextValue(count, count + 1)
+                )
+            )
+        )
+        fsm.act("CHECK",
+            checker.start.eq(1),
+            NextState("CHECK_WAIT")
+        )
+        fsm.act("CHECK_WAIT",
+            If(checker.done,
+                NextState("STORE")
+            )
+        )
+        fsm.act("STORE",
+            mem_port.we.eq(1),
+            If(delay == (ndelays - 1),
+                If(bitslip == (nbitslips - 1),
+                    NextValue(done, 1),
+                    NextState("IDLE")
+                ).Else(
+                    NextValue(bitslip, bitslip + 1),
+                    NextState("RESET")
+                )
+            ).Else(
+                NextState("INC")
+            )
+        )
+        fsm.act("INC",
+            bus_write(self.rdly_dq_inc_addr.storage, 1, "CHECK",
+                NextValue(delay, delay + 1)
+            )
+        )
@@ -0,0 +1,125 @@
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+
+from sdram.bist import _BISTGenerator, _BISTChecker
+
+
+# Free-running BIST: memory is walked in chunks (lengths in port words),
+# the generator writes chunk k while the checker verifies chunk k - 1.
+# The seed is incremented on each chunk so that a location gets different
+# data on each pass. Statistics are latched on update without stopping
+# the traffic.
+class BISTSoak(Module, AutoCSR):
+    def __init__(self, write_port, read_port):
+        aw = write_port.aw
+        bytes_per_word = write_port.dw//8
+
+        self.enable = CSRStorage()
+        self.word_bytes = CSRStatus(8, reset=bytes_per_word)
+        self.chunk_length = CSRStorage(aw + 1, reset=min(2**15, 2**aw))
+        self.memory_length = CSRStorage(aw + 1, reset=2**aw)
+
+        self.update = CSR()
+        self.ticks = CSRStatus(64)
+        self.written = CSRStatus(64)
+        self.read = CSRStatus(64)
+        self.errors = CSRStatus(32)
+        self.passes = CSRStatus(32)
+        self.pass_ticks = CSRStatus(32)
+
+        # # #
+
+        self.submodules.generator = generator = _BISTGenerator(write_port)
+        self.submodules.checker = checker = _BISTChecker(read_port)
+
+        chunk_length = self.chunk_length.storage
+        memory_length = self.memory_length.storage
+
+        generator_base = Signal(aw + 1)
+        generator_seed = Signal(32)
+        checker_base = Signal(aw + 1)
+        checker_seed = Signal(32)
+        checker_valid = Signal()
+        self.comb += [
+            generator.base.eq(generator_base),
+            generator.length.eq(chunk_length),
+            generator.seed.eq(generator_seed),
+            checker.base.eq(checker_base),
+            checker.length.eq(chunk_length),
+            checker.seed.eq(checker_seed)
+        ]
+
+        ticks = Signal(64)
+        written = Signal(64)
+        read = Signal(64)
+        errors = Signal(32)
+        passes = Signal(32)
+        pass_ticks = Signal(32)
+        pass_counter = Signal(32)
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+        fsm.act("IDLE",
+            If(self.enable.storage,
+                NextValue(generator_base, 0),
+                NextValue(checker_valid, 0),
+                NextValue(ticks, 0),
+                NextValue(written, 0),
+                NextValue(read, 0),
+                NextValue(errors, 0),
+                NextValue(passes, 0),
+                NextValue(pass_ticks, 0),
+                NextValue(pass_counter, 0),
+                NextState("START")
+            )
+        )
+        fsm.act("START",
+            generator.start.eq(1),
+            checker.start.eq(checker_valid),
+            NextState("WAIT")
+        )
+        fsm.act("WAIT",
+            If(generator.done & checker.done,
+                NextValue(written, written + chunk_length*bytes_per_word),
+                If(checker_valid,
+                    NextValue(read, read + chunk_length*bytes_per_word),
+                    NextValue(errors, errors + checker.errors),
+                    If(checker_base + chunk_length >= memory_length,
+                        NextValue(passes, passes + 1),
+                        NextValue(pass_ticks, pass_counter),
+                        NextValue(pass_counter, 0)
+                    )
+                ),
+                NextValue(checker_base, generator_base),
+                NextValue(checker_seed, generator_seed),
+                NextValue(checker_valid, 1),
+                If(generator_base + chunk_length >= memory_length,
+                    NextValue(generator_base, 0)
+                ).Else(
+                    NextValue(generator_base, generator_base + chunk_length)
+                ),
+                NextValue(generator_seed, generator_seed + 1),
+                If(self.enable.storage,
+                    NextState("START")
+                ).Else(
+                    NextState("IDLE")
+                )
+            )
+        )
+        self.sync += \
+            If(~fsm.ongoing("IDLE"),
+                ticks.eq(ticks + 1),
+                pass_counter.eq(pass_counter + 1)
+            )
+
+        # statistics
+        self.sync += \
+            If(self.update.re,
+                self.ticks.status.eq(ticks),
+                self.written.status.eq(written),
+                self.read.status.eq(read),
+                self.errors.status.eq(errors),
+                self.passes.status.eq(passes),
+                self.pass_ticks.status.eq(pass_ticks)
+            )
@@ -0,0 +1,188 @@
+from litex.gen import *
+from litex.gen.genlib.fifo import SyncFIFO
+
+from litex.soc.interconnect.csr import *
+
+from drtio.prbs import PRBS31Generator
+
+
+PATTERN_SEQUENTIAL = 0
+PATTERN_STRIDED    = 1
+PATTERN_RANDOM     = 2
+
+
+# Traffic on a native port (mode="both"): bursts of burst_length accesses
+# at consecutive addresses, each burst is a read burst with a probability
+# of read_ratio/256. Burst start offsets (in port words, relative to base):
+#  - sequential: continue after the previous burst.
+#  - strided: previous burst start + stride.
+#  - random: random & (length - 1), length must be a power of two.
+# Offsets wrap at length. Read latency is measured from command to data.
+class _TrafficPort(Module, AutoCSR):
+    def __init__(self, port, max_pending_reads=64, seed=1):
+        self.run = Signal()
+        self.clear = Signal()
+        self.update = Signal()
+
+        self.enable = CSRStorage()
+        self.read_ratio = CSRStorage(9, reset=128)
+        self.pattern = CSRStorage(2)
+        self.stride = CSRStorage(port.aw, reset=1)
+        self.burst_length = CSRStorage(16, reset=1)
+        self.base = CSRStorage(port.aw)
+        self.length = CSRStorage(port.aw + 1, reset=2**port.aw)
+
+        self.reads = CSRStatus(64)
+        self.writes = CSRStatus(64)
+        self.latency_sum = CSRStatus(64)
+        self.latency_max = CSRStatus(32)
+
+        # # #
+
+        self.submodules.prbs = prbs = PRBS31Generator(32, seed)
+
+        length = self.length.storage
+
+        # read timestamps
+        timestamp = Signal(32)
+        self.sync += timestamp.eq(timestamp + 1)
+        self.submodules.pending = pending = SyncFIFO(32, max_pending_reads)
+
+        we = Signal()
+        count = Signal(16)
+        offset = Signal(port.aw + 1)
+        burst_offset = Signal(port.aw + 1)
+        burst_start = Signal(port.aw + 1)
+        strided = Signal(port.aw + 2)
+        self.comb += [
+            strided.eq(burst_offset + self.stride.storage),
+            Case(self.pattern.storage, {
+                PATTERN_SEQUENTIAL: burst_start.eq(offset),
+                PATTERN_STRIDED:
+                    If(strided >= length,
+                        burst_start.eq(strided - length)
+                    ).Else(
+                        burst_start.eq(strided)
+                    ),
+                "default": burst_start.eq(prbs.o & (length - 1))
+            })
+        ]
+
+        reads = Signal(64)
+        writes = Signal(64)
+        latency = Signal(32)
+        latency_sum = Signal(64)
+        latency_max = Signal(32)
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+        fsm.act("IDLE",
+            If(self.run & self.enable.storage,
+                NextValue(offset, 0),
+                NextValue(burst_offset, 0),
+                NextState("BURST")
+            )
+        )
+        fsm.act("BURST",
+            NextValue(we, prbs.o[:8] >= self.read_ratio.storage),
+            NextValue(count, 0),
+            NextValue(offset, burst_start),
+            NextValue(burst_offset, burst_start),
+            NextState("ACCESS")
+        )
+        fsm.act("ACCESS",
+            port.cmd.valid.eq(pending.writable),
+            port.cmd.we.eq(we),
+            port.cmd.adr.eq(self.base.storage + offset),
+            If(port.cmd.valid & port.cmd.ready,
+                pending.we.eq(~we),
+                NextValue(count, count + 1),
+                If(offset == (length - 1),
+                    NextValue(offset, 0)
+                ).Else(
+                    NextValue(offset, offset + 1)
+                ),
+                If(count == (self.burst_length.storage - 1),
+                    If(self.run & self.enable.storage,
+                        NextState("BURST")
+                    ).Else(
+                        NextState("IDLE")
+                    )
+                )
+            )
+        )
+        self.comb += [
+            pending.din.eq(timestamp),
+            port.wdata.valid.eq(1),
+            port.wdata.we.eq(2**(port.dw//8)-1),
+            port.wdata.data.eq(Replicate(timestamp, port.dw//32)),
+            port.rdata.ready.eq(1),
+            pending.re.eq(port.rdata.valid),
+            latency.eq(timestamp - pending.dout)
+        ]
+
+        # statistics
+        self.sync += [
+            If(self.clear,
+                reads.eq(0),
+                writes.eq(0),
+                latency_sum.eq(0),
+                latency_max.eq(0)
+            ).Else(
+                If(port.cmd.valid & port.cmd.ready,
+                    If(we,
+                        writes.eq(writes + 1)
+                    ).Else(
+                        reads.eq(reads + 1)
+                    )
+                ),
+                If(port.rdata.valid,
+                    latency_sum.eq(latency_sum + latency),
+                    If(latency > latency_max,
+                        latency_max.eq(latency)
+                    )
+                )
+            ),
+            If(self.update,
+                self.reads.status.eq(reads),
+                self.writes.status.eq(writes),
+                self.latency_sum.status.eq(latency_sum),
+                self.latency_max.status.eq(latency_max)
+            )
+        ]
+
+
+# Concurrent traffic on several native ports, ports selected with their
+# enable run together while enable is set. Statistics are cleared when
+# enable is written and latched for all ports on update.
+class TrafficGenerator(Module, AutoCSR):
+    def __init__(self, ports):
+        self.enable = CSRStorage()
+        self.update = CSR()
+        self.nports = CSRStatus(8, reset=len(ports))
+        self.word_bytes = CSRStatus(8, reset=ports[0].dw//8)
+        self.ticks = CSRStatus(64)
+
+        # # #
+
+        ticks = Signal(64)
+        self.sync += [
+            If(self.enable.re,
+                ticks.eq(0)
+            ).Elif(self.enable.storage,
+                ticks.eq(ticks + 1)
+            ),
+            If(self.update.re,
+                self.ticks.status.eq(ticks)
+            )
+        ]
+
+        for i, port in enumerate(ports):
+            # distinct seeds: uncorrelated read/write decisions and offsets
+            traffic_port = _TrafficPort(port, seed=(i + 1)*0x1234567)
+            setattr(self.submodules, "port" + str(i), traffic_port)
+            self.comb += [
+                traffic_port.run.eq(self.enable.storage),
+                traffic_port.clear.eq(self.enable.re),
+                traffic_port.update.eq(self.update.re)
+            ]
@@ -0,0 +1,245 @@
+from litex.gen import *
+from litex.gen.genlib.fifo import SyncFIFO
+
+from litex.soc.interconnect.csr import *
+
+from gateware.serwb.etherbone import etherbone_magic, etherbone_version
+from gateware.serwb.etherbone import etherbone_packet_header_length
+from gateware.serwb.etherbone import etherbone_record_header_length
+
+
+serwb_preamble = 0x5aa55aa5
+
+ERROR_PREAMBLE = 0
+ERROR_LENGTH   = 1
+ERROR_MAGIC    = 2
+ERROR_VERSION  = 3
+ERROR_COUNT    = 4
+ERROR_PAIRING  = 5
+
+# payload: etherbone packet header, record header, base address + 255 writes,
+# base address + 255 reads
+max_length = (etherbone_packet_header_length + etherbone_record_header_length +
+              2*4 + 2*4*255)
+
+
+# Checks the serwb packets (preamble, length, etherbone packet and record
+# headers) of a 32-bit stream in the sys clock domain. The words of the
+# current packet are recorded in a buffer that is frozen on the first
+# error (or on pairing_error at the end of the packet), the buffer is read
+# through buffer_index/buffer_data.
+class _SERWBStreamChecker(Module, AutoCSR):
+    def __init__(self, buffer_depth=32):
+        self.valid = Signal()
+        self.data = Signal(32)
+        self.pairing_error = Signal()
+        self.packet_done = Signal()
+        self.wcount = Signal(8)
+        self.rcount = Signal(8)
+        self.error = Signal()
+
+        self.packets = CSRStatus(32)
+        self.errors = CSRStatus(32)
+        self.error_flags = CSRStatus(6)
+        self.buffer_length = CSRStatus(8)
+        self.buffer_index = CSRStorage(8)
+        self.buffer_data = CSRStatus(32)
+
+        # # #
+
+        length = Signal(32)
+        counter = Signal(16)
+        last = Signal()
+        record_length = Signal(16)
+        errors = Signal(6)
+        self.comb += [
+            last.eq(counter == (length[2:] - 1)),
+            record_length.eq(etherbone_packet_header_length + etherbone_record_header_length +
+                (self.data[16:24] != 0)*4 + self.data[16:24]*4 +
+                (self.data[24:32] != 0)*4 + self.data[24:32]*4),
+            self.error.eq(errors != 0)
+        ]
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+
+        # buffer
+        mem = Memory(32, buffer_depth)
+        write_port = mem.get_port(write_capable=True)
+        read_port = mem.get_port(async_read=True)
+        self.specials += mem, write_port, read_port
+        index = Signal(max=buffer_depth)
+        frozen = Signal()
+        self.comb += [
+            # preamble (or unexpected idle word) at 0
+            write_port.adr.eq(Mux(fsm.ongoing("IDLE"), 0, index)),
+            write_port.dat_w.eq(self.data),
+            write_port.we.eq(self.valid & ~frozen),
+            read_port.adr.eq(self.buffer_index.storage),
+            self.buffer_data.status.eq(read_port.dat_r)
+        ]
+
+        def word(*statements):
+            return If(self.valid, *statements)
+
+        fsm.act("IDLE",
+            word(
+                If(self.data == serwb_preamble,
+                    NextState("LENGTH")
+                # idle words are 0 on the serdes
+                ).Elif(self.data != 0,
+                    errors[ERROR_PREAMBLE].eq(1)
+                )
+            )
+        )
+        fsm.act("LENGTH",
+            word(
+                NextValue(length, self.data),
+                NextValue(counter, 0),
+                If((self.data[:2] != 0) |
+                   (self.data < (etherbone_packet_header_length + etherbone_record_header_length)) |
+                   (self.data > max_length),
+                    errors[ERROR_LENGTH].eq(1),
+                    NextState("IDLE")
+                ).Else(
+                    NextState("PACKET_HEADER")
+                )
+            )
+        )
+        fsm.act("PACKET_HEADER",
+            word(
+                NextValue(counter, counter + 1),
+                If(counter == 0,
+                    # magic is sent msb first
+                    If(self.data[:16] != Cat(C(etherbone_magic >> 8, 8), C(etherbone_magic & 0xff, 8)),
+                        errors[ERROR_MAGIC].eq(1)
+                    ),
+                    If(self.data[20:24] != etherbone_version,
+                        errors[ERROR_VERSION].eq(1)
+                    )
+                ).Else(
+                    NextState("RECORD_HEADER")
+                )
+            )
+        )
+        fsm.act("RECORD_HEADER",
+            word(
+                NextValue(counter, counter + 1),
+                NextValue(self.wcount, self.data[16:24]),
+                NextValue(self.rcount, self.data[24:32]),
+                If(record_length != length,
+                    errors[ERROR_COUNT].eq(1),
+                    NextState("IDLE")
+                ).Elif(last,
+                    self.packet_done.eq(1),
+                    NextState("IDLE")
+                ).Else(
+                    NextState("PAYLOAD")
+                )
+            )
+        )
+        fsm.act("PAYLOAD",
+            word(
+                NextValue(counter, counter + 1),
+                If(last,
+                    self.packet_done.eq(1),
+                    NextState("IDLE")
+                )
+            )
+        )
+        self.comb += errors[ERROR_PAIRING].eq(self.pairing_error)
+
+        # statistics / buffer control
+        self.sync += [
+            If(self.packet_done,
+                self.packets.status.eq(self.packets.status + 1)
+            ),
+            If(self.error,
+                self.errors.status.eq(self.errors.status + 1)
+            ),
+            If(~frozen,
+                If(self.valid,
+                    If(fsm.ongoing("IDLE"),
+                        index.eq(1)
+                    ).Elif(index != (buffer_depth - 1),
+                        index.eq(index + 1)
+                    )
+                ),
+                If(self.error,
+                    frozen.eq(1),
+                    self.error_flags.status.eq(errors),
+                    self.buffer_length.status.eq(Mux(fsm.ongoing("IDLE"), 1, index + 1))
+                )
+            )
+        ]
+
+
+# Monitors the streams of a SERWBCore: the packets of each direction are
+# checked and each read request must be followed by a response with as
+# many words. error is set on the first violation (until reset) and can
+# be used as an analyzer trigger.
+class SERWBChecker(Module, AutoCSR):
+    def __init__(self, core, mode, buffer_depth=32, max_pending=4):
+        self.error = Signal()
+
+        self.reset = CSR()
+        self.error_status = CSRStatus(name="error")
+        self.pairing_errors = CSRStatus(32)
+
+        # # #
+
+        tx = ResetInserter()(_SERWBStreamChecker(buffer_depth))
+        rx = ResetInserter()(_SERWBStreamChecker(buffer_depth))
+        self.submodules.tx = tx
+        self.submodules.rx = rx
+        self.comb += [
+            tx.reset.eq(self.reset.re),
+            tx.valid.eq(core.packetizer.source.valid & core.packetizer.source.ready),
+            tx.data.eq(core.packetizer.source.data),
+            rx.reset.eq(self.reset.re),
+            rx.valid.eq(core.depacketizer.sink.valid & core.depacketizer.sink.ready),
+            rx.data.eq(core.depacketizer.sink.data)
+        ]
+
+        # requests are sent by the slave (wishbone accesses of the design)
+        # and received by the master
+        if mode == "slave":
+            requests, responses = tx, rx
+        elif mode == "master":
+            requests, responses = rx, tx
+        else:
+            raise ValueError
+
+        pending = ResetInserter()(SyncFIFO(8, max_pending))
+        self.submodules.pending = pending
+        pairing_error = Signal()
+        self.comb += [
+            pending.reset.eq(self.reset.re),
+            pending.din.eq(requests.rcount),
+            pending.we.eq(requests.packet_done & (requests.rcount != 0)),
+            pending.re.eq(responses.packet_done & (responses.wcount != 0)),
+            If(responses.packet_done,
+                # responses only carry writes, matching a pending read
+                If(responses.rcount != 0,
+                    pairing_error.eq(1)
+                ).Elif(responses.wcount != 0,
+                    pairing_error.eq(~pending.readable | (pending.dout != responses.wcount))
+                )
+            ),
+            responses.pairing_error.eq(pairing_error)
+        ]
+
+        self.sync += [
+            If(self.reset.re,
+                self.error.eq(0),
+                self.pairing_errors.status.eq(0)
+            ).Else(
+                If(tx.error | rx.error,
+                    self.error.eq(1)
+                ),
+                If(pairing_error,
+                    self.pairing_errors.status.eq(self.pairing_errors.status + 1)
+                )
+            )
+        ]
+        self.comb += self.error_status.status.eq(self.error)
@@ -9,9 +9,8 @@ from gateware.serwb.etherbone import Etherbone
 class SERWBCore(Module):
     def __init__(self, phy, clk_freq, mode):
         self.submodules.etherbone = etherbone = Etherbone(mode)
-        depacketizer = Depacketizer(clk_freq)
-        packetizer = Packetizer()
-        self.submodules += depacketizer, packetizer
+        self.submodules.depacketizer = depacketizer = Depacketizer(clk_freq)
+        self.submodules.packetizer = packetizer = Packetizer()
         tx_cdc = stream.AsyncFIFO([("data", 32)], 8)
         tx_cdc = ClockDomainsRenamer({"write": "sys", "read": "serwb_serdes"})(tx_cdc)
         self.submodules += tx_cdc
@@ -0,0 +1,159 @@
+from litex.gen import *
+
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect.csr import *
+
+
+# Executes a list of SPI transfers stored in memory through the CSRs of an
+# existing SPIMaster (addresses provided by the host), avoiding a serial
+# round trip per register access.
+#
+# Each transfer is described by 4 words:
+#  - xfer value (chip select, write length, read length).
+#  - mosi_data value.
+#  - expected miso_data value.
+#  - miso_data compare mask (0: no readback).
+class SPISequencer(Module, AutoCSR):
+    def __init__(self, depth=8192):
+        self.bus = bus = wishbone.Interface()
+
+        self.start = CSR()
+        self.length = CSRStorage(16)
+        self.done = CSRStatus()
+        self.errors = CSRStatus(16)
+        self.first_error = CSRStatus(16)
+        self.first_error_data = CSRStatus(32)
+
+        self.xfer_addr = CSRStorage(32)
+        self.mosi_data_addr = CSRStorage(32)
+        self.miso_data_addr = CSRStorage(32)
+        self.start_addr = CSRStorage(32)
+        self.pending_addr = CSRStorage(32)
+
+        # # #
+
+        # transfers memory (host access through sram)
+        mem = Memory(32, depth)
+        self.submodules.sram = wishbone.SRAM(mem)
+        mem_port = mem.get_port()
+        self.specials += mem_port
+
+        index = Signal(16)
+        word = Signal(2)
+        xfer = Signal(32)
+        mosi_data = Signal(32)
+        expected = Signal(32)
+        pending = Signal()
+        mask = Signal(32)
+        done = Signal(reset=1)
+        errors = Signal(16)
+        first_error = Signal(16)
+        first_error_data = Signal(32)
+        self.comb += [
+            mem_port.adr.eq(Cat(word, index)),
+            self.done.status.eq(done),
+            self.errors.status.eq(errors),
+            self.first_error.status.eq(first_error),
+            self.first_error_data.status.eq(first_error_data)
+        ]
+
+        fsm = FSM(reset_state="IDLE")
+        self.submodules += fsm
+
+        def bus_access(addr, we, dat_w, next_state, *ack_statements):
+            return [
+                bus.stb.eq(1),
+                bus.cyc.eq(1),
+                bus.we.eq(we),
+                bus.sel.eq(0xf),
+                bus.adr.eq(addr[2:]),
+                bus.dat_w.eq(dat_w),
+                If(bus.ack,
+                    *ack_statements,
+                    NextState(next_state)
+                )
+            ]
+
+        fsm.act("IDLE",
+            If(self.start.re,
+                NextValue(done, 0),
+                NextValue(index, 0),
+                NextValue(word, 0),
+                NextValue(errors, 0),
+                NextValue(first_error, 0),
+                NextValue(first_error_data, 0),
+                If(self.length.storage != 0,
+                    NextState("FETCH")
+                ).Else(
+                    NextValue(done, 1)
+                )
+            )
+        )
+        # memory read latency is 1 cycle, word 0 is presented in FETCH
+        fsm.act("FETCH",
+            NextValue(word, 1),
+            NextState("FETCH_XFER")
+        )
+        fsm.act("FETCH_XFER",
+            NextValue(xfer, mem_port.dat_r),
+            NextValue(word, 2),
+            NextState("FETCH_MOSI_DATA")
+        )
+        fsm.act("FETCH_MOSI_DATA",
+            NextValue(mosi_data, mem_port.dat_r),
+            NextValue(word, 3),
+            NextState("FETCH_EXPECTED")
+        )
+        fsm.act("FETCH_EXPECTED",
+            NextValue(expected, mem_port.dat_r),
+            NextState("FETCH_MASK")
+        )
+        fsm.act("FETCH_MASK",
+            NextValue(mask, mem_port.dat_r),
+            NextValue(word, 0),
+            NextState("WRITE_XFER")
+        )
+        fsm.act("WRITE_XFER",
+            bus_access(self.xfer_addr.storage, 1, xfer, "WRITE_MOSI_DATA")
+        )
+        fsm.act("WRITE_MOSI_DATA",
+            bus_access(self.mosi_data_addr.storage, 1, mosi_data, "WRITE_START")
+        )
+        fsm.act("WRITE_START",
+            bus_access(self.start_addr.storage, 1, 1, "WAIT_PENDING")
+        )
+        fsm.act("WAIT_PENDING",
+            bus_access(self.pending_addr.storage, 0, 0, "CHECK_PENDING",
+                NextValue(pending, bus.dat_r[0]))
+        )
+        fsm.act("CHECK_PENDING",
+            If(pending,
+                NextState("WAIT_PENDING")
+            ).Elif(mask != 0,
+                NextState("READ_MISO_DATA")
+            ).Else(
+                NextState("NEXT")
+            )
+        )
+        fsm.act("READ_MISO_DATA",
+            bus_access(self.miso_data_addr.storage, 0, 0, "NEXT",
+                If((bus.dat_r & mask) != (expected & mask),
+                    If(errors == 0,
+                        NextValue(first_error, index),
+                        NextValue(first_error_data, bus.dat_r & mask)
+                    ),
+                    If(errors != (2**16-1),
+                        NextValue(errors, errors + 1)
+                    )
+                )
+            )
+        )
+        fsm.act("NEXT",
+            NextValue(index, index + 1),
+            If(index == (self.length.storage - 1),
+                NextValue(done, 1),
+                NextState("IDLE")
+            ).Else(
+                NextState("FETCH")
+            )
+        )
@@ -0,0 +1,64 @@
+from litex.gen import *
+from litex.gen.genlib.misc import WaitTimer
+
+from litex.soc.interconnect.csr import *
+from litex.soc.cores.uart import RS232PHYTX, RS232PHYRX, WishboneStreamingBridge
+
+
+def get_tuning_word(clk_freq, baudrate):
+    return int((baudrate/clk_freq)*2**32)
+
+
+class RS232PHY(Module):
+    def __init__(self, pads, tuning_word):
+        self.submodules.tx = RS232PHYTX(pads, tuning_word)
+        self.submodules.rx = RS232PHYRX(pads, tuning_word)
+        self.sink, self.source = self.tx.sink, self.rx.source
+
+
+# UARTWishboneBridge with a runtime tuning word (driven by a
+# UARTBaudrateControl).
+class UARTWishboneBridge(WishboneStreamingBridge):
+    def __init__(self, pads, clk_freq, baudrate=115200):
+        self.tuning_word = Signal(32, reset=get_tuning_word(clk_freq, baudrate))
+
+        # # #
+
+        self.submodules.phy = RS232PHY(pads, self.tuning_word)
+        WishboneStreamingBridge.__init__(self, self.phy, clk_freq)
+
+
+# Baudrate negotiation: a tuning word written by the host is applied
+# immediately (writes are not acknowledged by the bridge) and must be
+# confirmed at the new baudrate before timeout, otherwise the default
+# baudrate is restored and the host can reconnect.
+class UARTBaudrateControl(Module, AutoCSR):
+    def __init__(self, bridge, clk_freq, baudrate=115200, timeout=1.0):
+        default_tuning_word = get_tuning_word(clk_freq, baudrate)
+        self.tuning_word = CSRStorage(32, reset=default_tuning_word)
+        self.confirm = CSR()
+        self.confirmed = CSRStatus()
+
+        # # #
+
+        tuning_word = Signal(32, reset=default_tuning_word)
+        pending = Signal()
+        self.comb += bridge.tuning_word.eq(tuning_word)
+
+        timer = WaitTimer(int(timeout*clk_freq))
+        self.submodules += timer
+        self.comb += timer.wait.eq(pending)
+
+        self.sync += [
+            If(self.tuning_word.re,
+                tuning_word.eq(self.tuning_word.storage),
+                pending.eq(1)
+            ).Elif(self.confirm.re,
+                pending.eq(0)
+            ).Elif(timer.done,
+                tuning_word.eq(default_tuning_word),
+                pending.eq(0)
+            )
+        ]
+        self.comb += self.confirmed.status.eq(~pending &
+            (tuning_word == self.tuning_word.storage))
@@ -12,13 +12,10 @@ from litex.build.xilinx import XilinxPlatform
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc_sdram import *
 from litex.soc.integration.builder import *
-from litex.soc.cores.uart import UARTWishboneBridge
 from litex.soc.interconnect import stream
 
 from litedram.modules import MT41J256M16
 from litedram.phy import kusddrphy
-from litedram.frontend.bist import LiteDRAMBISTGenerator
-from litedram.frontend.bist import LiteDRAMBISTChecker
 
 from litejesd204b.common import *
 from litejesd204b.phy.gth import GTHQuadPLL as JESD204BGTHQuadPLL
@@ -28,11 +25,23 @@ from litejesd204b.core import LiteJESD204BCoreTX
 from litejesd204b.core import LiteJESD204BCoreTXControl
 
 from drtio.gth_ultrascale import GTHChannelPLL, GTHQuadPLL, GTH
+from drtio.bonding import BondingTX, BondingRX
 
 from serwb.phy import SERWBPLL, SERWBPHY
 from serwb.core import SERWBCore
+from serwb.checker import SERWBChecker
 
 from gateware import firmware
+from uart import UARTWishboneBridge, UARTBaudrateControl
+from command_processor import CommandProcessor
+from jesd_pattern import JESDPatternGenerator
+from sdram.bist import BISTGenerator, BISTChecker
+from sdram.delay_loader import DDRDelayLoader
+from sdram.leveling import LevelingSweep
+from sdram.soak import BISTSoak
+from sdram.traffic import TrafficGenerator
+from sdram.latency import LatencyProbe
+from sdram.capture import StreamingCapture
 
 from litescope import LiteScopeAnalyzer
 
@@ -311,19 +320,31 @@ def _build_version(with_time=True):
 
 class SDRAMTestSoC(SoCSDRAM):
     csr_map = {
+        "capture":   19,
         "ddrphy":    20,
         "generator": 21,
         "checker":   22,
-        "analyzer":  30
+        "command_processor": 23,
+        "leveling":          24,
+        "soak":              25,
+        "traffic":           26,
+        "latency":           27,
+        "latency_histogram": 28,
+        "uart_baudrate":     29,
+        "analyzer":  30,
+        "delay_loader":      31
     }
     csr_map.update(SoCSDRAM.csr_map)
 
     mem_map = {
-        "firmware_ram": 0x20000000,
+        "firmware_ram":      0x20000000,
+        "leveling":          0x30000000,
+        "command_processor": 0x50000000,
+        "capture":           0x70000000,
     }
     mem_map.update(SoCSDRAM.mem_map)
 
-    def __init__(self, platform, ddram="ddram_32", with_cpu=False):
+    def __init__(self, platform, ddram="ddram_32", with_cpu=False, uart_baudrate=115200):
         clk_freq = int(125e6)
         SoCSDRAM.__init__(self, platform, clk_freq,
             cpu_type="lm32" if with_cpu else None,
@@ -338,8 +359,10 @@ class SDRAMTestSoC(SoCSDRAM):
         self.submodules.crg = _CRG(platform)
         if not with_cpu:
             self.add_cpu_or_bridge(UARTWishboneBridge(platform.request("serial"),
-                                                      clk_freq, baudrate=115200))
+                                                      clk_freq, baudrate=uart_baudrate))
             self.add_wb_master(self.cpu_or_bridge.wishbone)
+            self.submodules.uart_baudrate = UARTBaudrateControl(self.cpu_or_bridge,
+                                                                clk_freq, uart_baudrate)
 
         self.crg.cd_sys.clk.attr.add("keep")
         platform.add_period_constraint(self.crg.cd_sys.clk, 8.0)
@@ -358,14 +381,50 @@ class SDRAMTestSoC(SoCSDRAM):
                             sdram_module.geom_settings,
                             sdram_module.timing_settings)
 
-        # sdram bist
+        databits = self.ddrphy.settings.dfi_databits//2
+
+        # sdram phy delays loader
+        self.submodules.delay_loader = DDRDelayLoader()
+        self.add_wb_master(self.delay_loader.bus)
+
+        # sdram bist (also used by the firmware memtest)
+        generator_user_port = self.sdram.crossbar.get_port(mode="write")
+        self.submodules.generator = BISTGenerator(generator_user_port)
+        checker_user_port = self.sdram.crossbar.get_port(mode="read")
+        self.submodules.checker = BISTChecker(checker_user_port, databits)
+
+        # sdram read leveling sweep
+        if not with_cpu:
+            self.submodules.leveling = LevelingSweep(
+                self.sdram.crossbar.get_port(mode="write"),
+                self.sdram.crossbar.get_port(mode="read"),
+                databits//8)
+            self.add_wb_master(self.leveling.bus)
+            self.register_mem("leveling", self.mem_map["leveling"], self.leveling.sram.bus,
+                4*self.leveling.sram.mem.depth)
+
+        # sdram continuous bist
+        if not with_cpu:
+            self.submodules.soak = BISTSoak(
+                self.sdram.crossbar.get_port(mode="write"),
+                self.sdram.crossbar.get_port(mode="read"))
+
+        # sdram concurrent traffic
         if not with_cpu:
-            generator_user_port = self.sdram.crossbar.get_port(mode="write")
-            self.submodules.generator = LiteDRAMBISTGenerator(
-                generator_user_port, random=True)
-            checker_user_port = self.sdram.crossbar.get_port(mode="read")
-            self.submodules.checker = LiteDRAMBISTChecker(
-                checker_user_port, random=True)
+            self.submodules.traffic = TrafficGenerator(
+                [self.sdram.crossbar.get_port() for i in range(4)])
+
+        # sdram latency histogram
+        if not with_cpu:
+            self.submodules.latency = LatencyProbe(
+                self.sdram.crossbar.get_port(mode="read"))
+
+        # command processor
+        if not with_cpu:
+            self.submodules.command_processor = CommandProcessor()
+            self.add_wb_master(self.command_processor.bus)
+            self.add_wb_slave(mem_decoder(self.mem_map["command_processor"]),
+                self.command_processor.mem_bus)
 
         # leds
         led_counter = Signal(32)
@@ -407,9 +466,19 @@ class SDRAMTestSoC(SoCSDRAM):
             if not with_cpu:
                 self.submodules.analyzer = LiteScopeAnalyzer(analyzer_signals, 64)
 
+            # long captures to sdram (dfi masked while the capture writes)
+            self.submodules.capture = StreamingCapture(analyzer_signals,
+                self.sdram.crossbar.get_port(mode="write"),
+                self.sdram.crossbar.get_port(mode="read"),
+                fifo_depth=2048, burst=1024)
+            self.register_mem("capture", self.mem_map["capture"], self.capture.bus,
+                self.capture.bus_size)
+
     def do_exit(self, vns):
         if hasattr(self, "analyzer"):
             self.analyzer.export_csv(vns, "test/sayma_amc/analyzer.csv")
+        if hasattr(self, "capture"):
+            self.capture.export_csv(vns, "test/sayma_amc/capture.csv")
 
 
 def get_phy_pads(jesd_pads, n):
@@ -426,11 +495,20 @@ class JESDTestSoC(SoCCore):
         "dac0_core":    21,
         "dac1_control": 22,
         "dac1_core":    23,        
+        "dac0_pattern": 24,
+        "dac1_pattern": 25,
+        "uart_baudrate": 29,
         "analyzer":     30
     }
     csr_map.update(SoCCore.csr_map)
 
-    def __init__(self, platform, dac=0):
+    mem_map = {
+        "dac0_pattern": 0x20000000,
+        "dac1_pattern": 0x30000000,
+    }
+    mem_map.update(SoCCore.mem_map)
+
+    def __init__(self, platform, dac=0, uart_baudrate=115200):
         clk_freq = int(125e6)
         SoCCore.__init__(self, platform, clk_freq,
             cpu_type=None,
@@ -443,8 +521,10 @@ class JESDTestSoC(SoCCore):
 
         # uart <--> wishbone
         self.add_cpu_or_bridge(UARTWishboneBridge(platform.request("serial"),
-                                                  clk_freq, baudrate=115200))
+                                                  clk_freq, baudrate=uart_baudrate))
         self.add_wb_master(self.cpu_or_bridge.wishbone)
+        self.submodules.uart_baudrate = UARTBaudrateControl(self.cpu_or_bridge,
+                                                            clk_freq, uart_baudrate)
 
         self.crg.cd_sys.clk.attr.add("keep")
         platform.add_period_constraint(self.crg.cd_sys.clk, 8.0)
@@ -502,23 +582,13 @@ class JESDTestSoC(SoCCore):
             setattr(self.submodules, "dac"+str(dac)+"_control", control)
             core.register_jsync(platform.request("dac_sync", dac))
 
-            # jesd pattern (ramp)
-            data0 = Signal(16)
-            data1 = Signal(16)
-            data2 = Signal(16)
-            data3 = Signal(16)
-            self.sync.jesd += [
-                data0.eq(data0 + 4096),   # freq = dacclk/32
-                data1.eq(data1 + 8192),   # freq = dacclk/16
-                data2.eq(data2 + 16384),  # freq = dacclk/8
-                data3.eq(data3 + 32768)   # freq = dacclk/4
-            ]
-            self.comb += [
-                core.sink.converter0.eq(Cat(data0, data0)),
-                core.sink.converter1.eq(Cat(data1, data1)),
-                core.sink.converter2.eq(Cat(data2, data2)),
-                core.sink.converter3.eq(Cat(data3, data3))
-            ]
+            # jesd pattern
+            pattern = JESDPatternGenerator(nconverters=4, nsamples=4)
+            setattr(self.submodules, "dac"+str(dac)+"_pattern", pattern)
+            self.register_mem("dac"+str(dac)+"_pattern",
+                self.mem_map["dac"+str(dac)+"_pattern"], pattern.bus, pattern.bus_size)
+            for i in range(4):
+                self.comb += getattr(core.sink, "converter"+str(i)).eq(pattern.sources[i])
 
         jesd_dac0_phy0_counter = Signal(32)
         self.sync.dac0_core_phy0_tx += jesd_dac0_phy0_counter.eq(jesd_dac0_phy0_counter + 1)
@@ -536,11 +606,15 @@ class JESDTestSoC(SoCCore):
 
 class DRTIOTestSoC(SoCCore):
     csr_map = {
-        "drtio_phy": 20
+        "drtio_phy":                  20,
+        "drtio_phy_gth0_eyescan_mem": 21,
+        "drtio_phy_gth1_eyescan_mem": 22,
+        "drtio_bonding":              23,
+        "uart_baudrate":              29
     }
     csr_map.update(SoCCore.csr_map)
 
-    def __init__(self, platform, pll="cpll", dw=20):
+    def __init__(self, platform, pll="cpll", dw=20, bonded=False, uart_baudrate=115200):
         clk_freq = int(125e6)
         SoCCore.__init__(self, platform, clk_freq,
             cpu_type=None,
@@ -551,8 +625,10 @@ class DRTIOTestSoC(SoCCore):
         )
         self.submodules.crg = _CRG(platform)
         self.add_cpu_or_bridge(UARTWishboneBridge(platform.request("serial"),
-                                                  clk_freq, baudrate=115200))
+                                                  clk_freq, baudrate=uart_baudrate))
         self.add_wb_master(self.cpu_or_bridge.wishbone)
+        self.submodules.uart_baudrate = UARTBaudrateControl(self.cpu_or_bridge,
+                                                            clk_freq, uart_baudrate)
 
         self.crg.cd_sys.clk.attr.add("keep")
         platform.add_period_constraint(self.crg.cd_sys.clk, 8.0)
@@ -596,15 +672,29 @@ class DRTIOTestSoC(SoCCore):
         counter = Signal(32)
         self.sync.rtio += counter.eq(counter + 1)
 
-        for i, channel in enumerate(drtio_phy.channels):
+        if bonded:
+            # lanes carry a single word, transmit counter on all bytes
+            drtio_bonding_tx = BondingTX(drtio_phy.channels)
+            self.submodules += drtio_bonding_tx
+            self.submodules.drtio_bonding = drtio_bonding = BondingRX(drtio_phy.channels)
             self.comb += [
-                channel.encoder.k[0].eq(1),
-                channel.encoder.d[0].eq((5 << 5) | 28),
-                channel.encoder.k[1].eq(0)
+                drtio_bonding_tx.sink.valid.eq(1),
+                drtio_bonding_tx.sink.data.eq(Replicate(counter[24:], 4))
             ]
-            self.comb += channel.encoder.d[1].eq(counter[26:])
-            for j in range(2):
-                self.comb += platform.request("user_led", 2*i + j).eq(channel.decoders[1].d[j])
+            rx_data = Signal(8)
+            self.sync.rtio += If(drtio_bonding.source.valid, rx_data.eq(drtio_bonding.source.data[-8:]))
+            for i in range(4):
+                self.comb += platform.request("user_led", i).eq(rx_data[2 + i])
+        else:
+            for i, channel in enumerate(drtio_phy.channels):
+                self.comb += [
+                    channel.encoder.k[0].eq(1),
+                    channel.encoder.d[0].eq((5 << 5) | 28),
+                    channel.encoder.k[1].eq(0)
+                ]
+                self.comb += channel.encoder.d[1].eq(counter[26:])
+                for j in range(2):
+                    self.comb += platform.request("user_led", 2*i + j).eq(channel.decoders[1].d[j])
 
         for gth in drtio_phy.gths:
             gth.cd_rtio_tx.clk.attr.add("keep")
@@ -622,8 +712,10 @@ class DRTIOTestSoC(SoCCore):
 
 class SERWBTestSoC(SoCCore):
     csr_map = {
-        "serwb_phy": 20,
-        "analyzer":  30
+        "serwb_phy":     20,
+        "serwb_checker": 21,
+        "uart_baudrate": 29,
+        "analyzer":      30
     }
     csr_map.update(SoCCore.csr_map)
 
@@ -632,7 +724,7 @@ class SERWBTestSoC(SoCCore):
     }
     mem_map.update(SoCCore.mem_map)
 
-    def __init__(self, platform, with_analyzer=True):
+    def __init__(self, platform, with_analyzer=True, uart_baudrate=115200):
         clk_freq = int(125e6)
         SoCCore.__init__(self, platform, clk_freq,
             cpu_type=None,
@@ -645,8 +737,10 @@ class SERWBTestSoC(SoCCore):
 
         # uart <--> wishbone
         self.add_cpu_or_bridge(UARTWishboneBridge(platform.request("serial"),
-                                                  clk_freq, baudrate=115200))
+                                                  clk_freq, baudrate=uart_baudrate))
         self.add_wb_master(self.cpu_or_bridge.wishbone)
+        self.submodules.uart_baudrate = UARTBaudrateControl(self.cpu_or_bridge,
+                                                            clk_freq, uart_baudrate)
 
         self.crg.cd_sys.clk.attr.add("keep")
         platform.add_period_constraint(self.crg.cd_sys.clk, 8.0)
@@ -683,6 +777,9 @@ class SERWBTestSoC(SoCCore):
         self.submodules += serwb_core
         self.add_wb_slave(mem_decoder(self.mem_map["serwb"]), serwb_core.etherbone.wishbone.bus)
 
+        # protocol checker
+        self.submodules.serwb_checker = SERWBChecker(serwb_core, mode="slave")
+
         # analyzer
         if with_analyzer:
             wishbone_access = Signal()
@@ -690,6 +787,7 @@ class SERWBTestSoC(SoCCore):
                                             serwb_core.etherbone.wishbone.bus.cyc)
             init_group = [
                 wishbone_access,
+                self.serwb_checker.error,
                 serwb_phy.init.ready,
                 serwb_phy.init.error,
                 serwb_phy.init.delay_min,
@@ -699,6 +797,7 @@ class SERWBTestSoC(SoCCore):
             ]
             serdes_group = [
                 wishbone_access,
+                self.serwb_checker.error,
                 serwb_phy.serdes.encoder.k[0],
                 serwb_phy.serdes.encoder.d[0],
                 serwb_phy.serdes.encoder.k[1],
@@ -719,14 +818,17 @@ class SERWBTestSoC(SoCCore):
             ]
             etherbone_source_group = [
                 wishbone_access,
+                self.serwb_checker.error,
                 serwb_core.etherbone.wishbone.source
             ]
             etherbone_sink_group = [
                 wishbone_access,
+                self.serwb_checker.error,
                 serwb_core.etherbone.wishbone.sink
             ]
             wishbone_group = [
                 wishbone_access,
+                self.serwb_checker.error,
                 serwb_core.etherbone.wishbone.bus
             ]
             analyzer_signals = {
@@ -761,7 +863,8 @@ def main():
     elif sys.argv[1] == "jesd":
         soc = JESDTestSoC(platform)
     elif sys.argv[1] == "drtio":
-        soc = DRTIOTestSoC(platform)
+        bonded = len(sys.argv) > 2 and sys.argv[2] == "bonded"
+        soc = DRTIOTestSoC(platform, bonded=bonded)
     elif sys.argv[1] == "serwb":
         soc = SERWBTestSoC(platform)
     builder = Builder(soc, output_dir="build_sayma_amc", csr_csv="test/sayma_amc/csr.csv",
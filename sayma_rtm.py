@@ -11,14 +11,17 @@ from litex.build.xilinx import XilinxPlatform
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
-from litex.soc.cores.uart import UARTWishboneBridge
 from litex.soc.cores.spi import SPIMaster
 from litex.soc.cores.gpio import GPIOOut
 from litex.soc.interconnect import stream
 from litex.soc.interconnect import wishbone
 
+from uart import UARTWishboneBridge, UARTBaudrateControl
+from spi_sequencer import SPISequencer
+from command_processor import CommandProcessor
 from serwb.phy import SERWBPLL, SERWBPHY
 from serwb.core import SERWBCore
+from serwb.checker import SERWBChecker
 
 from litescope import LiteScopeAnalyzer
 
@@ -157,11 +160,20 @@ class JESDTestSoC(SoCCore):
         "dac_reset":    22,
         "dac0_spi":     23,
         "dac1_spi":     24,
+        "spi_sequencer": 25,
+        "command_processor": 26,
+        "uart_baudrate": 29,
         "analyzer":     30,
     }
     csr_map.update(SoCCore.csr_map)
 
-    def __init__(self, platform):
+    mem_map = {
+        "spi_sequencer":     0x30000000,  # (default shadow @0xb0000000)
+        "command_processor": 0x50000000,  # (default shadow @0xd0000000)
+    }
+    mem_map.update(SoCCore.mem_map)
+
+    def __init__(self, platform, uart_baudrate=115200):
         clk_freq = int(125e6)
         SoCCore.__init__(self, platform, clk_freq,
             cpu_type=None,
@@ -174,8 +186,10 @@ class JESDTestSoC(SoCCore):
 
         # uart <--> wishbone
         self.add_cpu_or_bridge(UARTWishboneBridge(platform.request("serial"),
-                                                  clk_freq, baudrate=115200))
+                                                  clk_freq, baudrate=uart_baudrate))
         self.add_wb_master(self.cpu_or_bridge.wishbone)
+        self.submodules.uart_baudrate = UARTBaudrateControl(self.cpu_or_bridge,
+                                                            clk_freq, uart_baudrate)
 
         # clock mux : 125MHz ext SMA clock to HMC830 input
         self.comb += [
@@ -219,6 +233,16 @@ class JESDTestSoC(SoCCore):
         # dac1 control
         self.comb += platform.request("dac1_txen").eq(0b11)
 
+        # spi sequencer
+        self.submodules.spi_sequencer = SPISequencer()
+        self.add_wb_master(self.spi_sequencer.bus)
+        self.add_wb_slave(mem_decoder(self.mem_map["spi_sequencer"]), self.spi_sequencer.sram.bus)
+
+        # command processor
+        self.submodules.command_processor = CommandProcessor()
+        self.add_wb_master(self.command_processor.bus)
+        self.add_wb_slave(mem_decoder(self.mem_map["command_processor"]), self.command_processor.mem_bus)
+
         # analyzer
         hmc_spi_group = [
             hmc_spi_pads.clk,
@@ -255,8 +279,10 @@ class JESDTestSoC(SoCCore):
 
 class SERWBTestSoC(SoCCore):
     csr_map = {
-        "serwb_phy": 20,
-        "analyzer":  30
+        "serwb_phy":     20,
+        "serwb_checker": 21,
+        "uart_baudrate": 29,
+        "analyzer":      30
     }
     csr_map.update(SoCCore.csr_map)
 
@@ -265,7 +291,7 @@ class SERWBTestSoC(SoCCore):
     }
     mem_map.update(SoCCore.mem_map)
 
-    def __init__(self, platform, with_analyzer=True):
+    def __init__(self, platform, with_analyzer=True, uart_baudrate=115200):
         clk_freq = int(125e6)
         SoCCore.__init__(self, platform, clk_freq,
             cpu_type=None,
@@ -278,8 +304,10 @@ class SERWBTestSoC(SoCCore):
 
         # uart <--> wishbone
         self.add_cpu_or_bridge(UARTWishboneBridge(platform.request("serial"),
-                                                  clk_freq, baudrate=115200))
+                                                  clk_freq, baudrate=uart_baudrate))
         self.add_wb_master(self.cpu_or_bridge.wishbone)
+        self.submodules.uart_baudrate = UARTBaudrateControl(self.cpu_or_bridge,
+                                                            clk_freq, uart_baudrate)
 
         self.crg.cd_sys.clk.attr.add("keep")
         platform.add_period_constraint(self.crg.cd_sys.clk, 8.0)
@@ -309,6 +337,9 @@ class SERWBTestSoC(SoCCore):
         self.submodules += serwb_core
         self.add_wb_master(serwb_core.etherbone.wishbone.bus)
 
+        # protocol checker
+        self.submodules.serwb_checker = SERWBChecker(serwb_core, mode="master")
+
         # wishbone test memory
         self.submodules.serwb_sram = wishbone.SRAM(8192, init=[i for i in range(8192//4)])
         self.register_mem("serwb_sram", self.mem_map["serwb"], self.serwb_sram.bus, 8192)
@@ -320,6 +351,7 @@ class SERWBTestSoC(SoCCore):
                                             (serwb_phy.serdes.decoders[1].d == 0x5a))
             init_group = [
                 wishbone_access,
+                self.serwb_checker.error,
                 serwb_phy.init.ready,
                 serwb_phy.init.error,
                 serwb_phy.init.delay_min,
@@ -329,6 +361,7 @@ class SERWBTestSoC(SoCCore):
             ]
             serdes_group = [
                 wishbone_access,
+                self.serwb_checker.error,
                 serwb_phy.serdes.encoder.k[0],
                 serwb_phy.serdes.encoder.d[0],
                 serwb_phy.serdes.encoder.k[1],
@@ -349,14 +382,17 @@ class SERWBTestSoC(SoCCore):
             ]
             etherbone_source_group = [
                 wishbone_access,
+                self.serwb_checker.error,
                 serwb_core.etherbone.wishbone.source
             ]
             etherbone_sink_group = [
                 wishbone_access,
+                self.serwb_checker.error,
                 serwb_core.etherbone.wishbone.sink
             ]
             wishbone_group = [
                 wishbone_access,
+                self.serwb_checker.error,
                 serwb_core.etherbone.wishbone.bus
             ]
             analyzer_signals = {
@@ -2,11 +2,18 @@
 
 import sys
 import time
+import math
 
 from litex.soc.tools.remote import RemoteClient
 
 from litescope.software.driver.analyzer import LiteScopeAnalyzerDriver
 
+sys.path.append("../sayma_both") # FIXME
+from libbase.memtest import *
+from libbase.poll import poll_csr
+from libbase.command_processor import CommandScript, ScriptRegs, run_script
+from libbase.capture import StreamingCaptureDriver
+
 # DDR3 init and test for sayma ddr3 test design
 
 dfii_control_sel     = 0x01
@@ -26,54 +33,60 @@ wb.open()
 
 # # #
 
-wb.regs.sdram_dfii_control.write(0)
+# init sequence executed by the command processor
+script = CommandScript(wb.constants.config_clock_frequency)
+regs = ScriptRegs(script, wb.regs)
+
+regs.sdram_dfii_control.write(0)
 
 # release reset
-wb.regs.sdram_dfii_pi0_address.write(0x0)
-wb.regs.sdram_dfii_pi0_baddress.write(0)
-wb.regs.sdram_dfii_control.write(dfii_control_odt|dfii_control_reset_n)
-time.sleep(0.1)
+regs.sdram_dfii_pi0_address.write(0x0)
+regs.sdram_dfii_pi0_baddress.write(0)
+regs.sdram_dfii_control.write(dfii_control_odt|dfii_control_reset_n)
+script.wait(0.1)
 
 # bring cke high
-wb.regs.sdram_dfii_pi0_address.write(0x0)
-wb.regs.sdram_dfii_pi0_baddress.write(0)
-wb.regs.sdram_dfii_control.write(dfii_control_cke|dfii_control_odt|dfii_control_reset_n)
-time.sleep(0.1)
+regs.sdram_dfii_pi0_address.write(0x0)
+regs.sdram_dfii_pi0_baddress.write(0)
+regs.sdram_dfii_control.write(dfii_control_cke|dfii_control_odt|dfii_control_reset_n)
+script.wait(0.1)
 
 # load mode register 2
-wb.regs.sdram_dfii_pi0_address.write(0x408)
-wb.regs.sdram_dfii_pi0_baddress.write(2)
-wb.regs.sdram_dfii_pi0_command.write(dfii_command_ras|dfii_command_cas|dfii_command_we|dfii_command_cs)
-wb.regs.sdram_dfii_pi0_command_issue.write(1)
+regs.sdram_dfii_pi0_address.write(0x408)
+regs.sdram_dfii_pi0_baddress.write(2)
+regs.sdram_dfii_pi0_command.write(dfii_command_ras|dfii_command_cas|dfii_command_we|dfii_command_cs)
+regs.sdram_dfii_pi0_command_issue.write(1)
 
 # load mode register 3
-wb.regs.sdram_dfii_pi0_address.write(0x000)
-wb.regs.sdram_dfii_pi0_baddress.write(3)
-wb.regs.sdram_dfii_pi0_command.write(dfii_command_ras|dfii_command_cas|dfii_command_we|dfii_command_cs)
-wb.regs.sdram_dfii_pi0_command_issue.write(1)
+regs.sdram_dfii_pi0_address.write(0x000)
+regs.sdram_dfii_pi0_baddress.write(3)
+regs.sdram_dfii_pi0_command.write(dfii_command_ras|dfii_command_cas|dfii_command_we|dfii_command_cs)
+regs.sdram_dfii_pi0_command_issue.write(1)
 
 # load mode register 1
-wb.regs.sdram_dfii_pi0_address.write(0x006);
-wb.regs.sdram_dfii_pi0_baddress.write(1);
-wb.regs.sdram_dfii_pi0_command.write(dfii_command_ras|dfii_command_cas|dfii_command_we|dfii_command_cs)
-wb.regs.sdram_dfii_pi0_command_issue.write(1)
+regs.sdram_dfii_pi0_address.write(0x006);
+regs.sdram_dfii_pi0_baddress.write(1);
+regs.sdram_dfii_pi0_command.write(dfii_command_ras|dfii_command_cas|dfii_command_we|dfii_command_cs)
+regs.sdram_dfii_pi0_command_issue.write(1)
 
 # load mode register 0, cl=7, bl=8
-wb.regs.sdram_dfii_pi0_address.write(0x930);
-wb.regs.sdram_dfii_pi0_baddress.write(0);
-wb.regs.sdram_dfii_pi0_command.write(dfii_command_ras|dfii_command_cas|dfii_command_we|dfii_command_cs)
-wb.regs.sdram_dfii_pi0_command_issue.write(1)
-time.sleep(0.1)
+regs.sdram_dfii_pi0_address.write(0x930);
+regs.sdram_dfii_pi0_baddress.write(0);
+regs.sdram_dfii_pi0_command.write(dfii_command_ras|dfii_command_cas|dfii_command_we|dfii_command_cs)
+regs.sdram_dfii_pi0_command_issue.write(1)
+script.wait(0.1)
 
 # zq calibration
-wb.regs.sdram_dfii_pi0_address.write(0x400);
-wb.regs.sdram_dfii_pi0_baddress.write(0);
-wb.regs.sdram_dfii_pi0_command.write(dfii_command_we|dfii_command_cs)
-wb.regs.sdram_dfii_pi0_command_issue.write(1)
-time.sleep(0.1)
+regs.sdram_dfii_pi0_address.write(0x400);
+regs.sdram_dfii_pi0_baddress.write(0);
+regs.sdram_dfii_pi0_command.write(dfii_command_we|dfii_command_cs)
+regs.sdram_dfii_pi0_command_issue.write(1)
+script.wait(0.1)
 
 # hardware control
-wb.regs.sdram_dfii_control.write(dfii_control_sel)
+regs.sdram_dfii_control.write(dfii_control_sel)
+
+run_script(wb, script)
 
 #
 
@@ -90,8 +103,7 @@ def write_test(base, length, blocking=True):
     wb.regs.generator_length.write(length)
     wb.regs.generator_start.write(1)
     if blocking:
-        while(not wb.regs.generator_done.read()):
-            pass
+        poll_csr(wb.regs.generator_done, "generator", timeout=60.0)
         ticks = wb.regs.generator_ticks.read()
         speed = wb.constants.config_clock_frequency*length/ticks
         return speed
@@ -106,8 +118,7 @@ def read_test(base, length, blocking=True):
     start = time.time()
     wb.regs.checker_start.write(1)
     if blocking:
-        while(not wb.regs.checker_done.read()):
-            pass
+        poll_csr(wb.regs.checker_done, "checker", timeout=60.0)
         ticks = wb.regs.checker_ticks.read()
         speed = wb.constants.config_clock_frequency*length/ticks
         errors = wb.regs.checker_errors.read()
@@ -115,30 +126,59 @@ def read_test(base, length, blocking=True):
     else:
         return None, None
 
+def read_lane_errors():
+    nlanes = wb.regs.checker_nlanes.read()
+    return [getattr(wb.regs, "checker_lane{:d}_errors".format(i)).read() for i in range(nlanes)]
+
+def read_bit_errors():
+    nlanes = wb.regs.checker_nlanes.read()
+    return [getattr(wb.regs, "checker_bit{:d}_errors".format(i)).read() for i in range(8*nlanes)]
+
+def checker_report(max_failures=4):
+    """Print the errors of the last read_test per lane and per bit, and the
+    first failing words."""
+    for lane, errors in enumerate(read_lane_errors()):
+        print("lane{:d}: {:d} errors".format(lane, errors))
+    bit_errors = read_bit_errors()
+    print("dq errors: " + " ".join("{:d}:{:d}".format(i, e) for i, e in enumerate(bit_errors) if e))
+    for i in range(max_failures):
+        if not wb.regs.checker_failure_readable.read():
+            break
+        address = wb.regs.checker_failure_address.read()
+        expected = wb.regs.checker_failure_expected.read()
+        actual = wb.regs.checker_failure_actual.read()
+        print("0x{:08x}: expected 0x{:x}".format(address, expected))
+        print("            actual   0x{:x}".format(actual))
+        print("            diff     0x{:x}".format(expected ^ actual))
+        wb.regs.checker_failure_pop.write(1)
+
 #
 
-def seed_to_data(seed, random=False):
-    if random:
-        return (1664525*seed + 1013904223) & 0xffffffff
-    else:
-        return seed
+DELAY_LOADER_TARGET_WDLY_DQ  = 0
+DELAY_LOADER_TARGET_WDLY_DQS = 1
+DELAY_LOADER_TARGET_RDLY_DQ  = 2
+
+def delay_loader_init():
+    for name in ["dly_sel", "wdly_dq_rst", "wdly_dq_inc", "wdly_dqs_rst", "wdly_dqs_inc",
+                 "rdly_dq_rst", "rdly_dq_inc", "rdly_dq_bitslip"]:
+        getattr(wb.regs, "delay_loader_" + name + "_addr").write(getattr(wb.regs, "ddrphy_" + name).addr)
+
+def load_delay(target, mask, value, bitslip=0):
+    """Reset the delay of target on the modules of mask and set it to value
+    (and bitslip for DELAY_LOADER_TARGET_RDLY_DQ) in a single write."""
+    wb.regs.delay_loader_load.write(value | (bitslip << 9) | (mask << 16) | (target << 24))
+    poll_csr(wb.regs.delay_loader_done, "delay_loader", timeout=1.0)
+
+#
 
 def write_pattern(length):
-    for i in range(length):
-        wb.write(wb.mems.main_ram.base + 4*i, seed_to_data(i))
+    write_memory_pattern(wb, wb.mems.main_ram.base, length, random=False)
 
 def check_pattern(length, debug=False):
-    errors = 0
-    for i in range(length):
-        error = 0
-        if wb.read(wb.mems.main_ram.base + 4*i) != seed_to_data(i):
-            error = 1
-            if debug:
-                print("{}: 0x{:08x}, 0x{:08x} KO".format(i, wb.read(wb.mems.main_ram.base + 4*i), seed_to_data(i)))
-        else:
-            if debug:
-                print("{}: 0x{:08x}, 0x{:08x} OK".format(i, wb.read(wb.mems.main_ram.base + 4*i), seed_to_data(i)))
-        errors += error
+    errors, bitmap = check_memory_pattern(wb, wb.mems.main_ram.base, length,
+        random=False, debug=debug)
+    if debug and errors:
+        print_bitmap(bitmap)
     return errors
 
 #
@@ -152,70 +192,105 @@ def bruteforce_delay_finder():
     debug = False
 
     dqs_delay = 40
-    for module in range(nmodules):
-        wb.regs.ddrphy_dly_sel.write(1<<module)
-        wb.regs.ddrphy_wdly_dqs_rst.write(1)
-    for delay in range(dqs_delay):
-        for module in range(nmodules):
-            wb.regs.ddrphy_dly_sel.write(1<<module)
-            wb.regs.ddrphy_wdly_dqs_inc.write(1)
+    mask = 2**nmodules-1
+    load_delay(DELAY_LOADER_TARGET_WDLY_DQS, mask, dqs_delay)
 
     for bitslip in bitslip_range:
-        print("bitslip {:d}: |".format(bitslip), end="")
-        for module in range(nmodules):
-            wb.regs.ddrphy_dly_sel.write(1<<module)
-            wb.regs.ddrphy_rdly_dq_rst.write(1)
-            for i in range(bitslip):
-                wb.regs.ddrphy_rdly_dq_bitslip.write(1)
+        passes = [[] for module in range(nmodules)]
+        load_delay(DELAY_LOADER_TARGET_RDLY_DQ, mask, 0, bitslip)
         for delay in delay_range:
-            for module in range(nmodules):
-                wb.regs.ddrphy_dly_sel.write(1<<module)
-                wb.regs.ddrphy_rdly_dq_inc.write(1)
+            # all modules are swept at once
+            wb.regs.ddrphy_dly_sel.write(mask)
+            wb.regs.ddrphy_rdly_dq_inc.write(1)
             if use_bist:
+                # lanes are localised by the checker, modules are swept at once
                 write_test(0x00000000, 1*MB)
                 speed, errors = read_test(0x00000000, 1*MB)
+                lane_errors = read_lane_errors()
+                lanes_per_module = len(lane_errors)//nmodules
+                module_errors = [sum(lane_errors[module*lanes_per_module:(module+1)*lanes_per_module])
+                                 for module in range(nmodules)]
             else:
                 write_pattern(nwords)
                 errors = check_pattern(nwords, debug)
-            if errors:
-                print("..|", end="")
-            else:
-                print("{:02d}|".format(delay), end="")
-            sys.stdout.flush()
-        print("")
+                module_errors = [errors]*nmodules
+            for module in range(nmodules):
+                passes[module].append(not module_errors[module])
+        for module in range(nmodules):
+            print("bitslip {:d} module {:d}: |".format(bitslip, module), end="")
+            for delay, ok in zip(delay_range, passes[module]):
+                print("{:02d}|".format(delay) if ok else "..|", end="")
+            print("")
 
 #
 
-def bist(test_base, test_length, test_increment):
-    bitslip = 0
-    dqs_odelay = 40
-    dq_idelay = 280
-    nmodules = 2
-
-    # reset delays
-    for module in range(nmodules):
-        wb.regs.ddrphy_dly_sel.write(1<<module)
-        wb.regs.ddrphy_wdly_dqs_rst.write(1)
-        wb.regs.ddrphy_rdly_dq_rst.write(1)
+def find_window(passes):
+    """Return (start, end) of the longest run of passing delays or None."""
+    best = None
+    start = None
+    for i, ok in enumerate(list(passes) + [0]):
+        if ok and start is None:
+            start = i
+        elif not ok and start is not None:
+            if best is None or (i - 1 - start) > (best[1] - best[0]):
+                best = (start, i - 1)
+            start = None
+    return best
+
+def leveling(length=64, dqs_odelay=40, apply=True):
+    nlanes = wb.regs.leveling_nlanes.read()
+    ndelays = wb.regs.leveling_ndelays.read()
+    nbitslips = wb.regs.leveling_nbitslips.read()
+
+    # configure dqs delay (read delays and bitslips are swept by the gateware)
+    load_delay(DELAY_LOADER_TARGET_WDLY_DQS, 2**nlanes-1, dqs_odelay)
+
+    # sweep
+    for name in ["dly_sel", "rdly_dq_rst", "rdly_dq_inc", "rdly_dq_bitslip"]:
+        getattr(wb.regs, "leveling_" + name + "_addr").write(getattr(wb.regs, "ddrphy_" + name).addr)
+    wb.regs.leveling_length.write(length)
+    wb.regs.leveling_start.write(1)
+    poll_csr(wb.regs.leveling_done, "leveling", timeout=60.0)
+    results = burst_read(wb, wb.mems.leveling.base, ndelays*nbitslips)
+
+    # select for each lane the bitslip with the largest window, and its centre
+    settings = []
+    for lane in range(nlanes):
+        best = None
+        for bitslip in range(nbitslips):
+            passes = (results[bitslip*ndelays:(bitslip+1)*ndelays] >> lane) & 0x1
+            window = find_window(passes)
+            if window is None:
+                print("lane{:d} bitslip {:d}: no window".format(lane, bitslip))
+                continue
+            print("lane{:d} bitslip {:d}: {:03d}-{:03d}".format(lane, bitslip, *window))
+            if best is None or (window[1] - window[0]) > (best[1][1] - best[1][0]):
+                best = (bitslip, window)
+        if best is None:
+            print("lane{:d}: leveling failed".format(lane))
+            continue
+        bitslip, window = best
+        delay = (window[0] + window[1])//2
+        print("lane{:d}: bitslip {:d}, delay {:d}".format(lane, bitslip, delay))
+        settings.append((lane, bitslip, delay))
+
+    # apply
+    if apply:
+        for lane, bitslip, delay in settings:
+            load_delay(DELAY_LOADER_TARGET_RDLY_DQ, 1<<lane, delay, bitslip)
+
+    return settings
 
-    # configure dqs delay
-    for delay in range(dqs_odelay):
-        for module in range(nmodules):
-            wb.regs.ddrphy_dly_sel.write(1<<module)
-            wb.regs.ddrphy_wdly_dqs_inc.write(1)
-
-    # configure dq idelay
-    for delay in range(dq_idelay):
-        for module in range(nmodules):
-            wb.regs.ddrphy_dly_sel.write(1<<module)
-            wb.regs.ddrphy_rdly_dq_inc.write(1)
+#
 
-    # configure bitslip
-    for module in range(nmodules):
-        wb.regs.ddrphy_dly_sel.write(1<<module)
-        for i in range(bitslip):
-            wb.regs.ddrphy_rdly_dq_bitslip.write(1)
+def configure_delays(bitslip=0, dqs_odelay=40, dq_idelay=280, nmodules=2):
+    # all modules are loaded at once
+    mask = 2**nmodules-1
+    load_delay(DELAY_LOADER_TARGET_WDLY_DQS, mask, dqs_odelay)
+    load_delay(DELAY_LOADER_TARGET_RDLY_DQ, mask, dq_idelay, bitslip)
 
+def bist(test_base, test_length, test_increment):
+    configure_delays()
 
     # verify we are able to detect errors
     print("write base error check...", end="")
@@ -251,6 +326,8 @@ def bist(test_base, test_length, test_increment):
         length = test_length
         write_speed = write_test(base, length)
         read_speed, read_errors = read_test(base, length)
+        if read_errors:
+            checker_report()
         tested_errors = tested_errors + read_errors
         tested_length = tested_length + test_length
         print("{:14.2f} {:14.2f} {:9d} {:12d}".format(
@@ -262,6 +339,167 @@ def bist(test_base, test_length, test_increment):
 
 #
 
+def soak(duration=None, chunk_length=1*MB, interval=1.0):
+    configure_delays()
+
+    # lengths are in port words
+    word_bytes = wb.regs.soak_word_bytes.read()
+    memory_length = wb.regs.soak_memory_length.read()
+    wb.regs.soak_enable.write(0)
+    wb.regs.soak_chunk_length.write(chunk_length//word_bytes)
+    wb.regs.soak_enable.write(1)
+
+    start = time.time()
+    i = 0
+    try:
+        while duration is None or time.time() - start < duration:
+            time.sleep(interval)
+            wb.regs.soak_update.write(1)
+            ticks = wb.regs.soak_ticks.read()
+            written = wb.regs.soak_written.read()
+            read = wb.regs.soak_read.read()
+            errors = wb.regs.soak_errors.read()
+            passes = wb.regs.soak_passes.read()
+            pass_ticks = wb.regs.soak_pass_ticks.read()
+            elapsed = ticks/wb.constants.config_clock_frequency
+            if i%10 == 0:
+                print("  TIME(s) WRITTEN(MB)    READ(MB)  PASSES   ERRORS BW(Gbps) PASS_BW(Gbps)")
+            print("{:9.1f} {:11d} {:11d} {:7d} {:8d} {:8.2f} {:13.2f}".format(
+                elapsed,
+                written//MB,
+                read//MB,
+                passes,
+                errors,
+                8*(written + read)/elapsed/GB if elapsed else 0,
+                # a pass writes and reads the whole memory
+                2*8*memory_length*word_bytes*wb.constants.config_clock_frequency/pass_ticks/GB if pass_ticks else 0))
+            i += 1
+    except KeyboardInterrupt:
+        pass
+    wb.regs.soak_enable.write(0)
+
+#
+
+TRAFFIC_PATTERNS = {
+    "sequential": 0,
+    "strided":    1,
+    "random":     2
+}
+
+def traffic(configs, duration=1.0):
+    """Run concurrent traffic, configs: one dict per port with read_ratio
+    (0.0 to 1.0), pattern, stride, burst_length, base and length (in
+    bytes), unused ports are disabled."""
+    configure_delays()
+
+    nports = wb.regs.traffic_nports.read()
+    word_bytes = wb.regs.traffic_word_bytes.read()
+    clk_freq = wb.constants.config_clock_frequency
+    assert len(configs) <= nports
+
+    wb.regs.traffic_enable.write(0)
+    for i in range(nports):
+        def write(name, value):
+            getattr(wb.regs, "traffic_port{:d}_".format(i) + name).write(value)
+        if i >= len(configs):
+            write("enable", 0)
+            continue
+        config = configs[i]
+        write("read_ratio", int(256*config.get("read_ratio", 0.5)))
+        write("pattern", TRAFFIC_PATTERNS[config.get("pattern", "sequential")])
+        write("stride", config.get("stride", word_bytes)//word_bytes)
+        write("burst_length", config.get("burst_length", 1))
+        write("base", config.get("base", 0)//word_bytes)
+        write("length", config.get("length", 64*MB)//word_bytes)
+        write("enable", 1)
+
+    wb.regs.traffic_enable.write(1)
+    time.sleep(duration)
+    wb.regs.traffic_update.write(1)
+    wb.regs.traffic_enable.write(0)
+
+    elapsed = wb.regs.traffic_ticks.read()/clk_freq
+    total = 0
+    print("PORT   READS(MB)  WRITES(MB) BW(Gbps) LAT_AVG(ns) LAT_MAX(ns)")
+    for i in range(len(configs)):
+        def read(name):
+            return getattr(wb.regs, "traffic_port{:d}_".format(i) + name).read()
+        reads = read("reads")
+        writes = read("writes")
+        latency_sum = read("latency_sum")
+        latency_max = read("latency_max")
+        nbytes = (reads + writes)*word_bytes
+        total += nbytes
+        print("{:4d} {:11d} {:11d} {:8.2f} {:11.1f} {:11.1f}".format(
+            i,
+            reads*word_bytes//MB,
+            writes*word_bytes//MB,
+            8*nbytes/elapsed/GB,
+            1e9*latency_sum/reads/clk_freq if reads else 0,
+            1e9*latency_max/clk_freq))
+    print(" all {:32.2f}".format(8*total/elapsed/GB))
+
+#
+
+def latency(count=100000, random=True, length=64*MB, plot=False):
+    configure_delays()
+
+    word_bytes = wb.regs.latency_word_bytes.read()
+    nbins = wb.regs.latency_nbins.read()
+    clk_freq = wb.constants.config_clock_frequency
+
+    wb.regs.latency_count.write(count)
+    wb.regs.latency_random.write(random)
+    wb.regs.latency_base.write(0)
+    wb.regs.latency_length.write(length//word_bytes)
+    wb.regs.latency_start.write(1)
+    poll_csr(wb.regs.latency_done, "latency", timeout=60.0)
+    histogram = [int(x) for x in burst_read(wb, wb.bases.latency_histogram, nbins)]
+
+    def ns(cycles):
+        return 1e9*cycles/clk_freq
+
+    def percentile(p):
+        threshold = p*sum(histogram)
+        total = 0
+        for i, n in enumerate(histogram):
+            total += n
+            if total >= threshold:
+                return i
+        return nbins - 1
+
+    # last bin also counts longer latencies, mean is a lower bound when used
+    latency_min = wb.regs.latency_min.read()
+    latency_max = wb.regs.latency_max.read()
+    mean = sum(i*n for i, n in enumerate(histogram))/sum(histogram)
+    print("reads: {:d}".format(sum(histogram)))
+    print("min:   {:4d} cycles {:8.1f}ns".format(latency_min, ns(latency_min)))
+    print("mean:  {:6.1f} cycles {:8.1f}ns".format(mean, ns(mean)))
+    for p in [0.5, 0.9, 0.99, 0.999]:
+        print("p{:<4g} {:4d} cycles {:8.1f}ns".format(100*p, percentile(p), ns(percentile(p))))
+    print("max:   {:4d} cycles {:8.1f}ns".format(latency_max, ns(latency_max)))
+
+    # ascii histogram of the used bins (log scale)
+    used = [i for i, n in enumerate(histogram) if n]
+    peak = math.log10(max(histogram) + 1)
+    for i in range(used[0], used[-1] + 1):
+        bar = int(50*math.log10(histogram[i] + 1)/peak)
+        print("{:s}{:3d} {:8d} |{:s}".format(
+            ">" if i == nbins - 1 else " ", i, histogram[i], "#"*bar))
+
+    if plot:
+        import matplotlib.pyplot as plt
+        plt.bar([ns(i) for i in range(nbins)], histogram, width=ns(1))
+        plt.yscale("log")
+        plt.xlabel("latency (ns)")
+        plt.ylabel("reads")
+        plt.title("sdram read latency")
+        plt.show()
+
+    return histogram
+
+#
+
 def analyzer():
     groups = {
         "dfi_phase0": 0,
@@ -283,16 +521,58 @@ def analyzer():
     analyzer.upload()
     analyzer.save("dump.vcd")
 
+#
+
+def capture(base=512*MB, length=16*MB):
+    groups = {
+        "dfi_phase0": 0,
+        "dfi_phase1": 1,
+        "dfi_phase2": 2,
+        "dfi_phase3": 3
+    }
+
+    configure_delays()
+
+    capture = StreamingCaptureDriver(wb, "capture", "capture.csv", debug=True)
+    capture.configure_group(groups["dfi_phase0"])
+    capture.configure_trigger() # immediate
+    capture.run(base, length)
+
+    # traffic outside of the capture region
+    write_test(0x00000000, 128*MB)
+    read_test(0x00000000, 128*MB)
+
+    capture.stop()
+    capture.wait_done()
+    capture.upload()
+    capture.save("capture.vcd")
+
 if len(sys.argv) < 2:
-    print("missing test (delay or bist or analyzer)")
+    print("missing test (delay or leveling or bist or soak or traffic or latency or analyzer or capture)")
     wb.close()
     exit()
+delay_loader_init()
 if sys.argv[1] == "delay":
     bruteforce_delay_finder()
+elif sys.argv[1] == "leveling":
+    leveling()
 elif sys.argv[1] == "bist":
     bist(0x00000000, 128*MB, 0)
+elif sys.argv[1] == "soak":
+    soak(float(sys.argv[2]) if len(sys.argv) > 2 else None)
+elif sys.argv[1] == "traffic":
+    traffic([
+        {"read_ratio": 0.0, "pattern": "sequential", "burst_length": 64, "base": 0*64*MB},
+        {"read_ratio": 1.0, "pattern": "sequential", "burst_length": 64, "base": 1*64*MB},
+        {"read_ratio": 0.5, "pattern": "strided", "stride": 4*KB, "burst_length": 8, "base": 2*64*MB},
+        {"read_ratio": 0.5, "pattern": "random", "burst_length": 1, "base": 3*64*MB}
+    ])
+elif sys.argv[1] == "latency":
+    latency(plot=len(sys.argv) > 2 and sys.argv[2] == "plot")
 elif sys.argv[1] == "analyzer":
     analyzer()
+elif sys.argv[1] == "capture":
+    capture()
 else:
     raise ValueError
 
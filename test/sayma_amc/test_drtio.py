@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+
+import sys
+import math
+import time
+
+from litex.soc.tools.remote import RemoteClient
+
+sys.path.append("../sayma_both") # FIXME
+from libbase.txeq import TXEqualization, DRTIO_LANE_CSRS
+from libbase.poll import poll_csr
+
+# DRTIO transceivers test for sayma drtio test design
+
+nchannels = 2
+dw = 20
+linerate = 1.25e9
+sys_clk_freq = 125e6
+rtio_clk_freq = linerate/dw
+
+eyescan_nhorz = 32
+eyescan_nvert = 16
+
+wb = RemoteClient(port=1234, debug=False)
+wb.open()
+
+# # #
+
+def read_memory(base, length):
+    datas = []
+    while len(datas) < length:
+        n = min(length - len(datas), 255)
+        datas += wb.read(base + 4*len(datas), n)
+    return datas
+
+#
+
+def eyescan(channel, prescale=4, horz_step=4, vert_step=8, plot=False):
+    if horz_step > 1023//(eyescan_nhorz//2):
+        raise ValueError("horz_step must be <= {:d}".format(1023//(eyescan_nhorz//2)))
+    if vert_step > 127//(eyescan_nvert//2):
+        raise ValueError("vert_step must be <= {:d}".format(127//(eyescan_nvert//2)))
+    gth = "drtio_phy_gth{:d}".format(channel)
+    getattr(wb.regs, gth + "_eyescan_prescale").write(prescale)
+    getattr(wb.regs, gth + "_eyescan_horz_step").write(horz_step)
+    getattr(wb.regs, gth + "_eyescan_vert_step").write(vert_step)
+    getattr(wb.regs, gth + "_eyescan_start").write(1)
+    poll_csr(getattr(wb.regs, gth + "_eyescan_done"), gth + "_eyescan", timeout=600.0)
+
+    # retrieve the whole eye in one burst
+    datas = read_memory(getattr(wb.bases, gth + "_eyescan_mem"),
+                        eyescan_nhorz*eyescan_nvert)
+
+    # ber = errors / (samples x 2^(1 + prescale) x dw) (cf ug576)
+    ber = [[0.0]*eyescan_nhorz for v in range(eyescan_nvert)]
+    for v in range(eyescan_nvert):
+        for h in range(eyescan_nhorz):
+            data = datas[v*eyescan_nhorz + h]
+            errors = data & 0xffff
+            samples = (data >> 16) & 0xffff
+            bits = samples*2**(1 + prescale)*dw
+            ber[v][h] = errors/bits if bits else 1.0
+
+    print("channel {:d} eye (log10(ber), '.' < 1e-9):".format(channel))
+    for v in reversed(range(eyescan_nvert)):
+        line = "{:+4d} |".format((v - eyescan_nvert//2)*vert_step)
+        for h in range(eyescan_nhorz):
+            if ber[v][h] == 0 or ber[v][h] < 1e-9:
+                line += " ."
+            else:
+                line += "{:2d}".format(min(-int(math.log10(ber[v][h])), 9))
+        print(line)
+    print("      " + "-"*2*eyescan_nhorz)
+
+    if plot:
+        import matplotlib.pyplot as plt
+        min_ber = 1/(2**16*2**(1 + prescale)*dw)
+        z = [[math.log10(max(x, min_ber)) for x in line] for line in ber]
+        plt.imshow(z, origin="lower", aspect="auto",
+            extent=[(-eyescan_nhorz//2)*horz_step, (eyescan_nhorz//2)*horz_step,
+                    (-eyescan_nvert//2)*vert_step, (eyescan_nvert//2)*vert_step])
+        plt.colorbar(label="log10(ber)")
+        plt.title("channel {:d} eye".format(channel))
+        plt.show()
+
+    return ber
+
+#
+
+def init_status(channel):
+    print("channel {:d} init:".format(channel))
+    for init, clk_freq in [("tx", sys_clk_freq), ("rx", rtio_clk_freq)]:
+        prefix = "drtio_phy_gth{:d}_{:s}_init_status_".format(channel, init)
+        def read(name):
+            return getattr(wb.regs, prefix + name).read()
+        def us(name):
+            return read(name)*1e6/clk_freq
+        print("  {:s}: done: {:d} pll lock: {:8.2f}us resetdone: {:8.2f}us align: {:8.2f}us "
+              "total: {:8.2f}us restarts: {:d} timeouts: {:d}".format(init,
+              read("done"), us("pll_lock_cycles"), us("resetdone_cycles"), us("align_cycles"),
+              us("total_cycles"), read("restarts"), read("timeouts")))
+
+#
+
+def bonding(realign=False):
+    if realign:
+        wb.regs.drtio_bonding_realign.write(1)
+    print("bonding:")
+    print("  aligned: {:d}".format(wb.regs.drtio_bonding_aligned.read()))
+    print("  errors:  {:d}".format(wb.regs.drtio_bonding_errors.read()))
+    for i in range(nchannels):
+        skew = getattr(wb.regs, "drtio_bonding_lane{:d}_skew".format(i)).read()
+        print("  lane{:d} skew: {:d} cycles".format(i, skew))
+
+#
+
+prbs_configs = {
+    "prbs7" : 0b01,
+    "prbs15": 0b10,
+    "prbs31": 0b11
+}
+
+def prbs_configure(prbs):
+    # rx first: masks clock aligner restarts while commas are lost
+    for i in range(nchannels):
+        getattr(wb.regs, "drtio_phy_gth{:d}_rx_prbs_config".format(i)).write(prbs_configs.get(prbs, 0))
+    for i in range(nchannels):
+        getattr(wb.regs, "drtio_phy_gth{:d}_tx_prbs_config".format(i)).write(prbs_configs.get(prbs, 0))
+
+def prbs_errors():
+    return [getattr(wb.regs, "drtio_phy_gth{:d}_rx_prbs_errors".format(i)).read()
+            for i in range(nchannels)]
+
+def prbs_test(prbs, duration):
+    prbs_configure(prbs)
+    time.sleep(0.1) # let checkers lock on received data
+    errors_start = prbs_errors()
+    start = time.time()
+    time.sleep(duration)
+    errors_end = prbs_errors()
+    duration = time.time() - start
+    prbs_configure(None)
+    return [e - s for s, e in zip(errors_start, errors_end)], duration
+
+def normal_quantile(p):
+    lo, hi = -10.0, 10.0
+    for i in range(100):
+        mid = (lo + hi)/2
+        if 0.5*(1 + math.erf(mid/math.sqrt(2))) < p:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi)/2
+
+def poisson_cdf(k, mu):
+    term = math.exp(-mu)
+    cdf = term
+    for i in range(1, k + 1):
+        term *= mu/i
+        cdf += term
+    return cdf
+
+def poisson_interval(k, cl=0.95):
+    # exact (Garwood) interval on the mean of a poisson variable with k
+    # observed events, normal approximation for large counts
+    alpha = 1 - cl
+    if k > 100:
+        z = normal_quantile(1 - alpha/2)
+        return max(k - z*math.sqrt(k), 0), k + z*math.sqrt(k)
+    def solve(f, target, lo, hi):
+        for i in range(100):
+            mid = (lo + hi)/2
+            if f(mid) > target:
+                lo = mid
+            else:
+                hi = mid
+        return (lo + hi)/2
+    if k == 0:
+        return 0, -math.log(alpha) # one-sided upper limit
+    upper = solve(lambda mu: poisson_cdf(k, mu), alpha/2, k, 10*k + 100)
+    lower = solve(lambda mu: poisson_cdf(k - 1, mu), 1 - alpha/2, 0, k)
+    return lower, upper
+
+def ber(prbs="prbs31", duration=10, cl=0.95):
+    errors, duration = prbs_test(prbs, duration)
+    nbits = linerate*duration
+    print("{:s} ber test ({:3.1f}s, {:d}% confidence):".format(prbs, duration, int(100*cl)))
+    for i in range(nchannels):
+        # errors are counted per word, ber is a lower bound on bursts
+        lower, upper = poisson_interval(errors[i], cl)
+        print("  lane{:d}: {:d} errors, ber: {:3.2e} [{:3.2e}, {:3.2e}]".format(
+            i, errors[i], errors[i]/nbits, lower/nbits, upper/nbits))
+    return errors
+
+def txeq(duration=1):
+    txeq = TXEqualization(wb.regs, "drtio_phy", nchannels, DRTIO_LANE_CSRS)
+    settings = txeq.sweep(lambda: prbs_test("prbs31", duration)[0])
+    txeq.save("txeq_drtio.json", settings)
+
+#
+
+if len(sys.argv) < 2:
+    print("missing test (eyescan, init, bonding, ber, txeq)")
+    wb.close()
+    exit()
+if sys.argv[1] == "eyescan":
+    for i in range(nchannels):
+        eyescan(i, plot=len(sys.argv) > 2 and sys.argv[2] == "plot")
+elif sys.argv[1] == "init":
+    for i in range(nchannels):
+        init_status(i)
+elif sys.argv[1] == "bonding":
+    bonding(len(sys.argv) > 2 and sys.argv[2] == "realign")
+elif sys.argv[1] == "ber":
+    duration = 10
+    if len(sys.argv) > 2:
+        duration = float(sys.argv[2])
+    for prbs in ["prbs7", "prbs15", "prbs31"]:
+        ber(prbs, duration)
+elif sys.argv[1] == "txeq":
+    txeq()
+else:
+    raise ValueError
+
+# # #
+
+wb.close()
@@ -3,6 +3,9 @@ import time
 from litejesd204b.transport import seed_to_data
 
 from libbase.ad9154_regs import *
+from libbase.poll import poll_csr_clear
+from libbase.spi_sequencer import spi_write_many
+from libbase.shadow import ShadowedSPIDevice, get_ad9154_volatile
 
 # config mapping
 OFFLINE      = (1 << 0)
@@ -18,10 +21,11 @@ DIV_WRITE    = (1 << 24)
 WRITE_LENGTH = (1 << 16)
 READ_LENGTH  = (1 << 24)
 
-class AD9154SPI:
-    def __init__(self, regs, n):
+class AD9154SPI(ShadowedSPIDevice):
+    def __init__(self, regs, n, sequencer=None):
         self.regs = regs
         self.n = n
+        self.sequencer = sequencer
 
     def configure(self):
         config = 0*OFFLINE
@@ -30,31 +34,42 @@ class AD9154SPI:
         config |= 8*DIV_READ | 8*DIV_WRITE
         getattr(self.regs, "dac"+str(self.n)+"_spi_config").write(config)
 
-    def write(self, addr, byte):
-        self.configure()
+    def write_xfer(self, addr, byte):
         cmd = (0 << 15) | (addr & 0x7ff)
         val = (cmd << 8) | (byte & 0xff)
-        getattr(self.regs, "dac"+str(self.n)+"_spi_xfer").write(0b01 | 24*WRITE_LENGTH)
-        getattr(self.regs, "dac"+str(self.n)+"_spi_mosi_data").write(val << (32-24))
-        getattr(self.regs, "dac"+str(self.n)+"_spi_start").write(1)
-        while (getattr(self.regs, "dac"+str(self.n)+"_spi_pending").read() & 0x1):
-            pass
+        return (0b01 | 24*WRITE_LENGTH, val << (32-24), 0, 0)
 
-    def read(self, addr):
-        self.configure()
+    def read_xfer(self, addr, expected=0):
         cmd = (1 << 15) | (addr & 0x7ff)
         val = (cmd << 8)
-        getattr(self.regs, "dac"+str(self.n)+"_spi_xfer").write(0b01 | 16*WRITE_LENGTH | 8*READ_LENGTH)
-        getattr(self.regs, "dac"+str(self.n)+"_spi_mosi_data").write(val << (32-24))
+        return (0b01 | 16*WRITE_LENGTH | 8*READ_LENGTH, val << (32-24), expected, 0xff)
+
+    def xfer(self, xfer, mosi_data):
+        getattr(self.regs, "dac"+str(self.n)+"_spi_xfer").write(xfer)
+        getattr(self.regs, "dac"+str(self.n)+"_spi_mosi_data").write(mosi_data)
         getattr(self.regs, "dac"+str(self.n)+"_spi_start").write(1)
-        while (getattr(self.regs, "dac"+str(self.n)+"_spi_pending").read() & 0x1):
-            pass
+        poll_csr_clear(getattr(self.regs, "dac"+str(self.n)+"_spi_pending"),
+            "dac"+str(self.n)+"_spi", timeout=1.0)
+
+    def raw_write(self, addr, byte):
+        self.configure()
+        self.xfer(*self.write_xfer(addr, byte)[:2])
+
+    def raw_read(self, addr):
+        self.configure()
+        self.xfer(*self.read_xfer(addr)[:2])
         return getattr(self.regs, "dac"+str(self.n)+"_spi_miso_data").read() & 0xff
 
+    def raw_write_many(self, writes, verify=False):
+        return spi_write_many(self, "dac"+str(self.n)+"_spi", writes, verify)
+
 
 class AD9154(AD9154SPI):
-    def __init__(self, regs, n=0):
-        AD9154SPI.__init__(self, regs, n)
+    def __init__(self, regs, n=0, sequencer=None, shadow=False, write_back=False):
+        AD9154SPI.__init__(self, regs, n, sequencer)
+        if shadow:
+            self.enable_shadow(get_ad9154_volatile(), write_back,
+                resets=[AD9154_SPI_INTFCONFA])
 
     def check_presence(self):
         errors = 0
@@ -63,6 +78,17 @@ class AD9154(AD9154SPI):
         errors += self.read(AD9154_PRODIDH) != 0x91
         return errors == 0
 
+    def check_serdes_pll_lock(self):
+        return AD9154_SERDES_PLL_LOCK_RB_GET(self.read(AD9154_PLL_STATUS)) == 1
+
+    def check_link(self, lanes=0xff):
+        # code group, frame and initial lane synchronization
+        for address in [AD9154_CODEGRPSYNCFLG, AD9154_FRAMESYNCFLG,
+                        AD9154_INITLANESYNCFLG]:
+            if self.read(address) & lanes != lanes:
+                return False
+        return True
+
     def reset(self):
         self.write(AD9154_SPI_INTFCONFA,
             AD9154_SOFTRESET_SET(1) |
@@ -405,57 +431,32 @@ class AD9154(AD9154SPI):
 
         return status
 
+    def write_fields(self, values):
+        # single read-modify-write for fields of the same register
+        address, data = ad9154_pack(values, 0)
+        mask = 0
+        for name in values.keys():
+            field = ad9154_fields[name]
+            mask |= field.mask << field.offset
+        self.modify(address, mask, data)
+
+    def write_defaults(self):
+        self.write_many(ad9154_defaults())
+
+    def print_fields(self, address, prefix=""):
+        fields = ad9154_unpack(address, self.read(address))
+        print(", ".join("{:s}: {:d}".format(name[len(prefix):], value)
+            for name, value in fields.items()))
+
     def print_status(self):
-        x = self.read(AD9154_IRQ_STATUS0)
-        print("LANEFIFOERR: {:d}, SERPLLLOCK: {:d}, SERPLLLOST: {:d}, "
-                "DACPLLLOCK: {:d}, DACPLLLOST: {:d}".format(
-                AD9154_LANEFIFOERR_GET(x), AD9154_SERPLLLOCK_GET(x),
-                AD9154_SERPLLLOST_GET(x), AD9154_DACPLLLOCK_GET(x),
-                AD9154_DACPLLLOST_GET(x)))
-        x = self.read(AD9154_IRQ_STATUS1)
-        print("PRBS0: {:d}, PRBS1: {:d}, PRBS2: {:d}, PRBS3: {:d}".format(
-                AD9154_PRBS0_GET(x), AD9154_PRBS1_GET(x),
-                AD9154_PRBS2_GET(x), AD9154_PRBS3_GET(x)))
-        x = self.read(AD9154_IRQ_STATUS2)
-        print("SYNC_TRIP0: {:d}, SYNC_WLIM0: {:d}, SYNC_ROTATE0: {:d}, "
-                "SYNC_LOCK0: {:d}, NCO_ALIGN0: {:d}, BLNKDONE0: {:d}, "
-                "PDPERR0: {:d}".format(
-                AD9154_SYNC_TRIP0_GET(x), AD9154_SYNC_WLIM0_GET(x),
-                AD9154_SYNC_ROTATE0_GET(x), AD9154_SYNC_LOCK0_GET(x),
-                AD9154_NCO_ALIGN0_GET(x), AD9154_BLNKDONE0_GET(x),
-                AD9154_PDPERR0_GET(x)))
-        x = self.read(AD9154_IRQ_STATUS3)
-        print("SYNC_TRIP1: {:d}, SYNC_WLIM1: {:d}, SYNC_ROTATE1: {:d}, "
-                "SYNC_LOCK1: {:d}, NCO_ALIGN1: {:d}, BLNKDONE1: {:d}, "
-                "PDPERR1: {:d}".format(
-                AD9154_SYNC_TRIP1_GET(x), AD9154_SYNC_WLIM1_GET(x),
-                AD9154_SYNC_ROTATE1_GET(x), AD9154_SYNC_LOCK1_GET(x),
-                AD9154_NCO_ALIGN1_GET(x), AD9154_BLNKDONE1_GET(x),
-                AD9154_PDPERR1_GET(x)))
-        x = self.read(AD9154_JESD_CHECKS)
-        print("ERR_INTSUPP: {:d}, ERR_SUBCLASS: {:d}, ERR_KUNSUPP: {:d}, "
-                "ERR_JESDBAD: {:d}, ERR_WINLIMIT: {:d}, ERR_DLYOVER: {:d}".format(
-                AD9154_ERR_INTSUPP_GET(x), AD9154_ERR_SUBCLASS_GET(x),
-                AD9154_ERR_KUNSUPP_GET(x), AD9154_ERR_JESDBAD_GET(x),
-                AD9154_ERR_WINLIMIT_GET(x), AD9154_ERR_DLYOVER_GET(x)))
-
-        x = self.read(AD9154_DACPLLSTATUS)
-        print("DACPLL_LOCK: {:d}, VCO_CAL_PROGRESS: {:d}, CP_CAL_VALID: {:d}, "
-                "CP_OVERRANGE_L: {:d}, CP_OVERRANGE_H: {:d}".format(
-                AD9154_DACPLL_LOCK_GET(x), AD9154_VCO_CAL_PROGRESS_GET(x),
-                AD9154_CP_CAL_VALID_GET(x), AD9154_CP_OVERRANGE_L_GET(x),
-                AD9154_CP_OVERRANGE_H_GET(x)))
-
-        x = self.read(AD9154_PLL_STATUS)
-        print("PLL_LOCK_RB: {:d}, CURRENTS_READY_RB: {:d}, "
-                "VCO_CAL_IN_PROGRESS_RB: {:d}, PLL_CAL_VALID_RB: {:d}, "
-                "PLL_OVERRANGE_L_RB: {:d}, PLL_OVERRANGE_H_RB: {:d}".format(
-                AD9154_SERDES_PLL_LOCK_RB_GET(x),
-                AD9154_SERDES_CURRENTS_READY_RB_GET(x),
-                AD9154_SERDES_VCO_CAL_IN_PROGRESS_RB_GET(x),
-                AD9154_SERDES_PLL_CAL_VALID_RB_GET(x),
-                AD9154_SERDES_PLL_OVERRANGE_L_RB_GET(x),
-                AD9154_SERDES_PLL_OVERRANGE_H_RB_GET(x)))
+        for address in [AD9154_IRQ_STATUS0, AD9154_IRQ_STATUS1,
+                        AD9154_IRQ_STATUS2, AD9154_IRQ_STATUS3,
+                        AD9154_JESD_CHECKS]:
+            self.print_fields(address)
+
+        self.print_fields(AD9154_DACPLLSTATUS)
+
+        self.print_fields(AD9154_PLL_STATUS, prefix="SERDES_")
 
         print("CODEGRPSYNC: 0x{:02x}".format(self.read(AD9154_CODEGRPSYNCFLG)))
         print("FRAMESYNC: 0x{:02x}".format(self.read(AD9154_FRAMESYNCFLG)))
@@ -467,12 +468,7 @@ class AD9154(AD9154SPI):
                     (AD9154_LASTERROR_H_GET(x) << 8)))
         print("SYNC_LASTOVER: {:d}, SYNC_LASTUNDER: {:d}".format(
                 AD9154_LASTOVER_GET(x), AD9154_LASTUNDER_GET(x)))
-        x = self.read(AD9154_SYNC_STATUS)
-        print("SYNC_TRIP: {:d}, SYNC_WLIM: {:d}, SYNC_ROTATE: {:d}, "
-                "SYNC_LOCK: {:d}, SYNC_BUSY: {:d}".format(
-                AD9154_SYNC_TRIP_GET(x), AD9154_SYNC_WLIM_GET(x),
-                AD9154_SYNC_ROTATE_GET(x), AD9154_SYNC_LOCK_GET(x),
-                AD9154_SYNC_BUSY_GET(x)))
+        self.print_fields(AD9154_SYNC_STATUS)
 
         print("LANE_FIFO_FULL: 0x{:02x}".format(self.read(AD9154_FIFO_STATUS_REG_0)))
         print("LANE_FIFO_EMPTY: 0x{:02x}".format(self.read(AD9154_FIFO_STATUS_REG_1)))
@@ -1,1900 +1,670 @@
-AD9154_SPI_INTFCONFA = 0x000
-# default: 0x00, access: R/W
-def AD9154_SOFTRESET_SET(x):
-    return (((x) & 0x1) << 0)
-def AD9154_SOFTRESET_GET(x):
-    return (((x) >> 0) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_LSBFIRST_SET(x):
-    return (((x) & 0x1) << 1)
-def AD9154_LSBFIRST_GET(x):
-    return (((x) >> 1) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_ADDRINC_SET(x):
-    return (((x) & 0x1) << 2)
-def AD9154_ADDRINC_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SDOACTIVE_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_SDOACTIVE_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R
-def AD9154_SDOACTIVE_M_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R
-def AD9154_ADDRINC_M_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x00, access: R
-def AD9154_LSBFIRST_M_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x00, access: R
-def AD9154_SOFTRESET_M_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_CHIPTYPE = 0x003
-
-AD9154_PRODIDL = 0x004
-
-AD9154_PRODIDH = 0x005
-
-AD9154_CHIPGRADE = 0x006
-# default: 0x02, access: R
-def AD9154_DEV_REVISION_GET(x):
-    return(((x) >> 0) & 0xf)
-# default: 0x00, access: R
-def AD9154_PROD_GRADE_GET(x):
-    return(((x) >> 4) & 0xf)
-
-AD9154_SPI_PAGEINDX = 0x008
-
-AD9154_PWRCNTRL0 = 0x011
-# default: 0x01, access: R/W
-def AD9154_PD_DAC3_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_PD_DAC3_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_PD_DAC2_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_PD_DAC2_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_PD_DAC1_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_PD_DAC1_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_PD_DAC0_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_PD_DAC0_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_PD_BG_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_PD_BG_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_TXENMASK1  = 0x012
-# default: 0x00, access: R/W
-def AD9154_DACA_MASK_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_DACA_MASK_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_DACB_MASK_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_DACB_MASK_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_PWRCNTRL3 = 0x013
-# default: 0x00, access: R/W
-def AD9154_SPI_TXEN_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_SPI_TXEN_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_ENA_SPI_TXEN_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_ENA_SPI_TXEN_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SPI_PA_CTRL_SET(x):
-    return(((x) & 0x1) << 2)
-def AD9154_SPI_PA_CTRL_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_ENA_PA_CTRL_FROM_SPI_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_ENA_PA_CTRL_FROM_SPI_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_ENA_PA_CTRL_FROM_BLSM_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_ENA_PA_CTRL_FROM_BLSM_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_ENA_PA_CTRL_FROM_TXENSM_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_ENA_PA_CTRL_FROM_TXENSM_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_ENA_PA_CTRL_FROM_PARROT_ERR_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_ENA_PA_CTRL_FROM_PARROT_ERR_GET(x):
-    return(((x) >> 6) & 0x1)
-
-AD9154_GROUP_DLY = 0x014
-# default: 0x08, access: R/W
-def AD9154_COARSE_GROUP_DELAY_SET(x):
-    return(((x) & 0xf) << 0)
-def AD9154_COARSE_GROUP_DELAY_GET(x):
-    return(((x) >> 0) & 0xf)
-# default: 0x08, access: R/W
-def AD9154_GROUP_DELAY_RESERVED_SET(x):
-    return(((x) & 0xf) << 4)
-def AD9154_GROUP_DELAY_RESERVED_GET(x):
-    return(((x) >> 4) & 0xf)
-
-AD9154_IRQEN_STATUSMODE0 = 0x01f
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_LANEFIFOERR_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_IRQEN_SMODE_LANEFIFOERR_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_SERPLLLOCK_SET(x):
-    return(((x) & 0x1) << 2)
-def AD9154_IRQEN_SMODE_SERPLLLOCK_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_SERPLLLOST_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_IRQEN_SMODE_SERPLLLOST_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_DACPLLLOCK_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_IRQEN_SMODE_DACPLLLOCK_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_DACPLLLOST_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_IRQEN_SMODE_DACPLLLOST_GET(x):
-    return(((x) >> 5) & 0x1)
-
-AD9154_IRQEN_STATUSMODE1 = 0x020
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_PRBS0_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_IRQEN_SMODE_PRBS0_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_PRBS1_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_IRQEN_SMODE_PRBS1_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_PRBS2_SET(x):
-    return(((x) & 0x1) << 2)
-def AD9154_IRQEN_SMODE_PRBS2_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_PRBS3_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_IRQEN_SMODE_PRBS3_GET(x):
-    return(((x) >> 3) & 0x1)
-
-AD9154_IRQEN_STATUSMODE2 = 0x021
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_SYNC_TRIP0_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_IRQEN_SMODE_SYNC_TRIP0_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_SYNC_WLIM0_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_IRQEN_SMODE_SYNC_WLIM0_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_SYNC_ROTATE0_SET(x):
-    return (((x) & 0x1) << 2)
-def AD9154_IRQEN_SMODE_SYNC_ROTATE0_GET(x):
-    return (((x) >> 2) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_SYNC_LOCK0_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_IRQEN_SMODE_SYNC_LOCK0_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_NCO_ALIGN0_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_IRQEN_SMODE_NCO_ALIGN0_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_BLNKDONE0_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_IRQEN_SMODE_BLNKDONE0_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_PDPERR0_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_IRQEN_SMODE_PDPERR0_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_IRQEN_STATUSMODE3 = 0x022
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_SYNC_TRIP1_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_IRQEN_SMODE_SYNC_TRIP1_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_SYNC_WLIM1_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_IRQEN_SMODE_SYNC_WLIM1_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_SYNC_ROTATE1_SET(x):
-    return (((x) & 0x1) << 2)
-def AD9154_IRQEN_SMODE_SYNC_ROTATE1_GET(x):
-    return (((x) >> 2) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_SYNC_LOCK1_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_IRQEN_SMODE_SYNC_LOCK1_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_NCO_ALIGN1_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_IRQEN_SMODE_NCO_ALIGN1_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_BLNKDONE1_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_IRQEN_SMODE_BLNKDONE1_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_IRQEN_SMODE_PDPERR1_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_IRQEN_SMODE_PDPERR1_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_IRQ_STATUS0 = 0x023
-# default: 0x00, access: R
-def AD9154_LANEFIFOERR_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R
-def AD9154_SERPLLLOCK_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R
-def AD9154_SERPLLLOST_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R
-def AD9154_DACPLLLOCK_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R
-def AD9154_DACPLLLOST_GET(x):
-    return(((x) >> 5) & 0x1)
-
-AD9154_IRQ_STATUS1 = 0x024
-# default: 0x00, access: R
-def AD9154_PRBS0_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R
-def AD9154_PRBS1_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R
-def AD9154_PRBS2_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R
-def AD9154_PRBS3_GET(x):
-    return(((x) >> 3) & 0x1)
-
-AD9154_IRQ_STATUS2 = 0x025
-# default: 0x00, access: R
-def AD9154_SYNC_TRIP0_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R
-def AD9154_SYNC_WLIM0_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R
-def AD9154_SYNC_ROTATE0_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R
-def AD9154_SYNC_LOCK0_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R
-def AD9154_NCO_ALIGN0_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R
-def AD9154_BLNKDONE0_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x00, access: R
-def AD9154_PDPERR0_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_IRQ_STATUS3 = 0x026
-# default: 0x00, access: R
-def AD9154_SYNC_TRIP1_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R
-def AD9154_SYNC_WLIM1_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R
-def AD9154_SYNC_ROTATE1_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R
-def AD9154_SYNC_LOCK1_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R
-def AD9154_NCO_ALIGN1_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R
-def AD9154_BLNKDONE1_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x00, access: R
-def AD9154_PDPERR1_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_JESD_CHECKS = 0x030
-# default: 0x00, access: R
-def AD9154_ERR_INTSUPP_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R
-def AD9154_ERR_SUBCLASS_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R
-def AD9154_ERR_KUNSUPP_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R
-def AD9154_ERR_JESDBAD_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R
-def AD9154_ERR_WINLIMIT_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R
-def AD9154_ERR_DLYOVER_GET(x):
-    return(((x) >> 5) & 0x1)
-
-AD9154_SYNC_ERRWINDOW = 0x034
-
-AD9154_SYNC_LASTERR_L = 0x038
-
-AD9154_SYNC_LASTERR_H = 0x039
-# default: 0x00, access: R
-def AD9154_LASTERROR_H_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R
-def AD9154_LASTOVER_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x00, access: R
-def AD9154_LASTUNDER_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_SYNC_CONTROL =  0x03a
-# default: 0x00, access: R/W
-def AD9154_SYNCMODE_SET(x):
-    return(((x) & 0xf) << 0)
-def AD9154_SYNCMODE_GET(x):
-    return(((x) >> 0) & 0xf)
-# default: 0x00, access: R/W
-def AD9154_SYNCCLRLAST_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_SYNCCLRLAST_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SYNCCLRSTKY_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_SYNCCLRSTKY_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SYNCARM_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_SYNCARM_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SYNCENABLE_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_SYNCENABLE_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_SYNC_STATUS = 0x03b
-# default: 0x00, access: R
-def AD9154_SYNC_TRIP_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R
-def AD9154_SYNC_WLIM_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R
-def AD9154_SYNC_ROTATE_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R
-def AD9154_SYNC_LOCK_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R
-def AD9154_SYNC_BUSY_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_SYNC_CURRERR_L = 0x03c
-
-AD9154_SYNC_CURRERR_H = 0x03d
-# default: 0x00, access: R
-def AD9154_CURRERROR_H_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R
-def AD9154_CURROVER_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x00, access: R
-def AD9154_CURRUNDER_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_DACGAIN0_I = 0x040
-
-AD9154_DACGAIN1_I = 0x041
-
-AD9154_DACGAIN0_Q = 0x042
-
-AD9154_DACGAIN1_Q = 0x043
-
-AD9154_GROUPDELAY_COMP_I = 0x044
-
-AD9154_GROUPDELAY_COMP_Q = 0x045
-
-AD9154_GROUPDELAY_COMP_BYP = 0x046
-# default: 0x01, access: R/W
-def AD9154_GROUPCOMP_BYPQ_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_GROUPCOMP_BYPQ_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_GROUPCOMP_BYPI_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_GROUPCOMP_BYPI_GET(x):
-    return(((x) >> 1) & 0x1)
-
-AD9154_MIX_MODE = 0x047
-
-AD9154_NCOALIGN_MODE = 0x050
-# default: 0x00, access: R/W
-def AD9154_NCO_ALIGN_MODE_SET(x):
-    return(((x) & 0x3) << 0)
-def AD9154_NCO_ALIGN_MODE_GET(x):
-    return(((x) >> 0) & 0x3)
-# default: 0x00, access: R
-def AD9154_NCO_ALIGN_FAIL_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R
-def AD9154_NCO_ALIGN_PASS_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R
-def AD9154_NCO_ALIGN_MTCH_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_NCO_ALIGN_ARM_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_NCO_ALIGN_ARM_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_NCOKEY_ILSB = 0x051
-
-AD9154_NCOKEY_IMSB = 0x052
-
-AD9154_NCOKEY_QLSB = 0x053
-
-AD9154_NCOKEY_QMSB = 0x054
-
-AD9154_PDP_THRES0 = 0x060
-
-AD9154_PDP_THRES1 = 0x061
-
-AD9154_PDP_AVG_TIME = 0x062
-# default: 0x00, access: R/W
-def AD9154_PDP_AVG_TIME__SET(x):
-    return(((x) & 0xf) << 0)
-def AD9154_PDP_AVG_TIME__GET(x):
-    return(((x) >> 0) & 0xf)
-# default: 0x00, access: R/W
-def AD9154_PA_BUS_SWAP_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_PA_BUS_SWAP_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_PDP_ENABLE_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_PDP_ENABLE_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_PDP_POWER0 = 0x063
-
-AD9154_PDP_POWER1 = 0x064
-
-AD9154_CLKCFG0 = 0x080
-# default: 0x00, access: R/W
-def AD9154_REF_CLKDIV_EN_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_REF_CLKDIV_EN_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_RF_SYNC_EN_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_RF_SYNC_EN_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_DUTY_EN_SET(x):
-    return(((x) & 0x1) << 2)
-def AD9154_DUTY_EN_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_PD_CLK_REC_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_PD_CLK_REC_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_PD_SERDES_PCLK_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_PD_SERDES_PCLK_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_PD_CLK_DIG_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_PD_CLK_DIG_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_PD_CLK23_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_PD_CLK23_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_PD_CLK01_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_PD_CLK01_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_SYSREF_ACTRL0 = 0x081
-# default: 0x00, access: R/W
-def AD9154_HYS_CNTRL1_SET(x):
-    return(((x) & 0x3) << 0)
-def AD9154_HYS_CNTRL1_GET(x):
-    return(((x) >> 0) & 0x3)
-# default: 0x00, access: R/W
-def AD9154_SYSREF_RISE_SET(x):
-    return(((x) & 0x1) << 2)
-def AD9154_SYSREF_RISE_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_HYS_ON_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_HYS_ON_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_PD_SYSREF_BUFFER_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_PD_SYSREF_BUFFER_GET(x):
-    return(((x) >> 4) & 0x1)
-
-AD9154_SYSREF_ACTRL1 = 0x082
-
-AD9154_DACPLLCNTRL = 0x083
-# default: 0x00, access: R/W
-def AD9154_ENABLE_DACPLL_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_ENABLE_DACPLL_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_RECAL_DACPLL_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_RECAL_DACPLL_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_DACPLLSTATUS = 0x084
-# default: 0x00, access: R
-def AD9154_DACPLL_LOCK_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R
-def AD9154_VCO_CAL_PROGRESS_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R
-def AD9154_CP_CAL_VALID_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R
-def AD9154_CP_OVERRANGE_L_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x00, access: R
-def AD9154_CP_OVERRANGE_H_GET(x):
-    return(((x) >> 6) & 0x3)
-
-AD9154_DACINTEGERWORD0 = 0x085
-
-AD9154_DACLOOPFILT1 = 0x087
-# default: 0x08, access: R/W
-def AD9154_LF_C1_WORD_SET(x):
-    return(((x) & 0xf) << 0)
-def AD9154_LF_C1_WORD_GET(x):
-    return(((x) >> 0) & 0xf)
-# default: 0x08, access: R/W
-def AD9154_LF_C2_WORD_SET(x):
-    return(((x) & 0xf) << 4)
-def AD9154_LF_C2_WORD_GET(x):
-    return(((x) >> 4) & 0xf)
-
-AD9154_DACLOOPFILT2 = 0x088
-# default: 0x08, access: R/W
-def AD9154_LF_C3_WORD_SET(x):
-    return(((x) & 0xf) << 0)
-def AD9154_LF_C3_WORD_GET(x):
-    return(((x) >> 0) & 0xf)
-# default: 0x08, access: R/W
-def AD9154_LF_R1_WORD_SET(x):
-    return(((x) & 0xf) << 4)
-def AD9154_LF_R1_WORD_GET(x):
-    return(((x) >> 4) & 0xf)
-
-AD9154_DACLOOPFILT3 = 0x089
-# default: 0x08, access: R/W
-def AD9154_LF_R3_WORD_SET(x):
-    return(((x) & 0xf) << 0)
-def AD9154_LF_R3_WORD_GET(x):
-    return(((x) >> 0) & 0xf)
-# default: 0x00, access: R/W
-def AD9154_LF_BYPASS_C1_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_LF_BYPASS_C1_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_LF_BYPASS_C2_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_LF_BYPASS_C2_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_LF_BYPASS_R1_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_LF_BYPASS_R1_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_LF_BYPASS_R3_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_LF_BYPASS_R3_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_DACCPCNTRL = 0x08a
-# default: 0x20, access: R/W
-def AD9154_CP_CURRENT_SET(x):
-    return(((x) & 0x3f) << 0)
-def AD9154_CP_CURRENT_GET(x):
-    return(((x) >> 0) & 0x3f)
-# default: 0x00, access: R/W
-def AD9154_VT_FORCE_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_VT_FORCE_GET(x):
-    return(((x) >> 6) & 0x1)
-
-AD9154_DACLOGENCNTRL = 0x08b
-# default: 0x00, access: R/W
-def AD9154_LODIVMODE_SET(x):
-    return(((x) & 0x3) << 0)
-def AD9154_LODIVMODE_GET(x):
-    return(((x) >> 0) & 0x3)
-# default: 0x00, access: R/W
-def AD9154_LO_POWER_MODE_SET(x):
-    return(((x) & 0x3) << 4)
-def AD9154_LO_POWER_MODE_GET(x):
-    return(((x) >> 4) & 0x3)
-
-AD9154_DACLDOCNTRL1 = 0x08c
-# default: 0x00, access: R/W
-def AD9154_REFDIVMODE_SET(x):
-    return(((x) & 0x7) << 0)
-def AD9154_REFDIVMODE_GET(x):
-    return(((x) >> 0) & 0x7)
-# default: 0x00, access: R/W
-def AD9154_LDO_BYPASS_FLT_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_LDO_BYPASS_FLT_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_LDO_REF_SEL_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_LDO_REF_SEL_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_DACLDOCNTRL2 = 0x08d
-# default: 0x03, access: R/W
-def AD9154_LDO_VDROP_SET(x):
-    return(((x) & 0x3) << 0)
-def AD9154_LDO_VDROP_GET(x):
-    return(((x) >> 0) & 0x3)
-# default: 0x02, access: R/W
-def AD9154_LDO_SEL_SET(x):
-    return(((x) & 0x7) << 2)
-def AD9154_LDO_SEL_GET(x):
-    return(((x) >> 2) & 0x7)
-# default: 0x01, access: R/W
-def AD9154_LDO_INRUSH_SET(x):
-    return(((x) & 0x3) << 5)
-def AD9154_LDO_INRUSH_GET(x):
-    return(((x) >> 5) & 0x3)
-# default: 0x00, access: R/W
-def AD9154_LDO_BYPASS_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_LDO_BYPASS_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_DATA_FORMAT = 0x110
-# default: 0x00, access: R/W
-def AD9154_BINARY_FORMAT_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_BINARY_FORMAT_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_DATAPATH_CTRL = 0x111
-# default: 0x00, access: R/W
-def AD9154_I_TO_Q_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_I_TO_Q_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SEL_SIDEBAND_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_SEL_SIDEBAND_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_MODULATION_TYPE_SET(x):
-    return(((x) & 0x3) << 2)
-def AD9154_MODULATION_TYPE_GET(x):
-    return(((x) >> 2) & 0x3)
-# default: 0x00, access: R/W
-def AD9154_PHASE_ADJ_ENABLE_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_PHASE_ADJ_ENABLE_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_DIG_GAIN_ENABLE_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_DIG_GAIN_ENABLE_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_INVSINC_ENABLE_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_INVSINC_ENABLE_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_INTERP_MODE = 0x112
-
-AD9154_NCO_FTW_UPDATE = 0x113
-# default: 0x00, access: R/W
-def AD9154_FTW_UPDATE_REQ_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_FTW_UPDATE_REQ_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R
-def AD9154_FTW_UPDATE_ACK_GET(x):
-    return(((x) >> 1) & 0x1)
-
-AD9154_FTW0 = 0x114
-
-AD9154_FTW1 = 0x115
-
-AD9154_FTW2 = 0x116
-
-AD9154_FTW3 = 0x117
-
-AD9154_FTW4 = 0x118
-
-AD9154_FTW5 = 0x119
-
-AD9154_NCO_PHASE_OFFSET0 = 0x11a
-
-AD9154_NCO_PHASE_OFFSET1 = 0x11b
-
-AD9154_PHASE_ADJ0 = 0x11c
-
-AD9154_PHASE_ADJ1 = 0x11d
-
-AD9154_TXEN_SM_0 = 0x11f
-# default: 0x01, access: R/W
-def AD9154_TXEN_SM_EN_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_TXEN_SM_EN_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_GP_PA_CTRL_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_GP_PA_CTRL_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_GP_PA_ON_INVERT_SET(x):
-    return(((x) & 0x0) << 2)
-def AD9154_GP_PA_ON_INVERT_GET(x):
-    return(((x) >> 2) & 0x0)
-# default: 0x00, access: R/W
-def AD9154_RISE_COUNTERS_SET(x):
-    return(((x) & 0x3) << 4)
-def AD9154_RISE_COUNTERS_GET(x):
-    return(((x) >> 4) & 0x3)
-# default: 0x02, access: R/W
-def AD9154_FALL_COUNTERS_SET(x):
-    return(((x) & 0x3) << 6)
-def AD9154_FALL_COUNTERS_GET(x):
-    return(((x) >> 6) & 0x3)
-
-AD9154_TXEN_RISE_COUNT_0 = 0x121
-
-AD9154_TXEN_RISE_COUNT_1 = 0x122
-
-AD9154_TXEN_FALL_COUNT_0 = 0x123
-
-AD9154_TXEN_FALL_COUNT_1 = 0x124
-
-AD9154_DEVICE_CONFIG_REG_0 = 0x12d
-
-AD9154_DIE_TEMP_CTRL0 = 0x12f
-# default: 0x00, access: R/W
-def AD9154_AUXADC_ENABLE_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_AUXADC_ENABLE_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x10, access: R/W
-def AD9154_AUXADC_RESERVED_SET(x):
-    return(((x) & 0x7f) << 1)
-def AD9154_AUXADC_RESERVED_GET(x):
-    return(((x) >> 1) & 0x7f)
-
-AD9154_DIE_TEMP0 = 0x132
-
-AD9154_DIE_TEMP1 = 0x133
-
-AD9154_DIE_TEMP_UPDATE = 0x134
-
-AD9154_DC_OFFSET_CTRL = 0x135
-
-AD9154_IPATH_DC_OFFSET_1PART0 = 0x136
-
-AD9154_IPATH_DC_OFFSET_1PART1 = 0x137
-
-AD9154_QPATH_DC_OFFSET_1PART0 = 0x138
-
-AD9154_QPATH_DC_OFFSET_1PART1 = 0x139
-
-AD9154_IPATH_DC_OFFSET_2PART = 0x13a
-
-AD9154_QPATH_DC_OFFSET_2PART = 0x13b
-
-AD9154_IDAC_DIG_GAIN0 = 0x13c
-
-AD9154_IDAC_DIG_GAIN1 = 0x13d
-
-AD9154_QDAC_DIG_GAIN0 = 0x13e
-
-AD9154_QDAC_DIG_GAIN1 = 0x13f
-
-AD9154_GAIN_RAMP_UP_STEP0 = 0x140
-
-AD9154_GAIN_RAMP_UP_STEP1 = 0x141
-
-AD9154_GAIN_RAMP_DOWN_STEP0 = 0x142
-
-AD9154_GAIN_RAMP_DOWN_STEP1 = 0x143
-
-AD9154_DEVICE_CONFIG_REG_1 = 0x146
-
-AD9154_BSM_STAT = 0x147
-# default: 0x00, access: R
-def AD9154_SOFTBLANKRB_GET(x):
-    return(((x) >> 6) & 0x3)
-
-AD9154_PRBS = 0x14b
-# default: 0x00, access: R/W
-def AD9154_PRBS_EN_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_PRBS_EN_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_PRBS_RESET_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_PRBS_RESET_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_PRBS_MODE_SET(x):
-    return(((x) & 0x1) << 2)
-def AD9154_PRBS_MODE_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R
-def AD9154_PRBS_GOOD_I_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x00, access: R
-def AD9154_PRBS_GOOD_Q_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_PRBS_ERROR_I = 0x14c
-
-AD9154_PRBS_ERROR_Q = 0x14d
-
-AD9154_DACPLLT0 = 0x1b0
-# default: 0x01, access: R/W
-def AD9154_LOGEN_PD_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_LOGEN_PD_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_LDO_PD_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_LDO_PD_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_SYNTH_PD_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_SYNTH_PD_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_VCO_PD_ALC_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_VCO_PD_ALC_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_VCO_PD_PTAT_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_VCO_PD_PTAT_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_VCO_PD_IN_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_VCO_PD_IN_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_DACPLLT1 = 0x1b1
-# default: 0x00, access: R/W
-def AD9154_PFD_EDGE_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_PFD_EDGE_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_PFD_DELAY_SET(x):
-    return(((x) & 0x3) << 2)
-def AD9154_PFD_DELAY_GET(x):
-    return(((x) >> 2) & 0x3)
-
-AD9154_DACPLLT2 = 0x1b2
-# default: 0x00, access: R/W
-def AD9154_EXT_ALC_WORD_SET(x):
-    return(((x) & 0x7f) << 0)
-def AD9154_EXT_ALC_WORD_GET(x):
-    return(((x) >> 0) & 0x7f)
-# default: 0x00, access: R/W
-def AD9154_EXT_ALC_WORD_EN_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_EXT_ALC_WORD_EN_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_DACPLLT3 = 0x1b3
-# default: 0x00, access: W
-def AD9154_EXT_BAND1_SET(x):
-    return(((x) & 0xff) << 0)
-
-AD9154_DACPLLT4 = 0x1b4
-# default: 0x00, access: R/W
-def AD9154_EXT_BAND2_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_EXT_BAND2_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_EXT_BAND_EN_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_EXT_BAND_EN_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x0f, access: R/W
-def AD9154_VCO_CAL_OFFSET_SET(x):
-    return(((x) & 0xf) << 3)
-def AD9154_VCO_CAL_OFFSET_GET(x):
-    return(((x) >> 3) & 0xf)
-# default: 0x00, access: R/W
-def AD9154_BYP_LOAD_DELAY_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_BYP_LOAD_DELAY_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_DACPLLT5 = 0x1b5
-
-AD9154_DACPLLT6 = 0x1b6
-
-AD9154_DACPLLT7 = 0x1b7
-
-AD9154_DACPLLT8 = 0x1b8
-
-AD9154_DACPLLT9 = 0x1b9
-
-AD9154_DACPLLTA = 0x1ba
-
-AD9154_DACPLLTB = 0x1bb
-# default: 0x04, access: R/W
-def AD9154_VCO_BIAS_REF_SET(x):
-    return(((x) & 0x7) << 0)
-def AD9154_VCO_BIAS_REF_GET(x):
-    return(((x) >> 0) & 0x7)
-# default: 0x01, access: R/W
-def AD9154_VCO_BIAS_TCF_SET(x):
-    return(((x) & 0x3) << 3)
-def AD9154_VCO_BIAS_TCF_GET(x):
-    return(((x) >> 3) & 0x3)
-
-AD9154_DACPLLTC = 0x1bc
-
-AD9154_DACPLLTD = 0x1bd
-
-AD9154_DACPLLTE = 0x1be
-
-AD9154_DACPLLTF = 0x1bf
-
-AD9154_DACPLLT10 = 0x1c0
-
-AD9154_DACPLLT11 = 0x1c1
-
-AD9154_DACPLLT15 = 0x1c2
-
-AD9154_DACPLLT16 = 0x1c3
-
-AD9154_DACPLLT17 = 0x1c4
-
-AD9154_DACPLLT18 = 0x1c5
-
-AD9154_MASTER_PD = 0x200
-
-AD9154_PHY_PD = 0x201
-
-AD9154_GENERIC_PD = 0x203
-# default: 0x00, access: R/W
-def AD9154_PD_SYNCOUT1B_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_PD_SYNCOUT1B_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_PD_SYNCOUT0B_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_PD_SYNCOUT0B_GET(x):
-    return(((x) >> 1) & 0x1)
-
-AD9154_CDR_RESET = 0x206
-
-AD9154_CDR_OPERATING_MODE_REG_0 = 0x230
-# default: 0x00, access: R/W
-def AD9154_CDR_OVERSAMP_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_CDR_OVERSAMP_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x02, access: R/W
-def AD9154_CDR_RESERVED_SET(x):
-    return(((x) & 0x7) << 2)
-def AD9154_CDR_RESERVED_GET(x):
-    return(((x) >> 2) & 0x7)
-# default: 0x01, access: R/W
-def AD9154_ENHALFRATE_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_ENHALFRATE_GET(x):
-    return(((x) >> 5) & 0x1)
-
-AD9154_EQ_BIAS_REG = 0x268
-# default: 0x22, access: R/W
-def AD9154_EQ_BIAS_RESERVED_SET(x):
-    return(((x) & 0x3f) << 0)
-def AD9154_EQ_BIAS_RESERVED_GET(x):
-    return(((x) >> 0) & 0x3f)
-# default: 0x01, access: R/W
-def AD9154_EQ_POWER_MODE_SET(x):
-    return(((x) & 0x3) << 6)
-def AD9154_EQ_POWER_MODE_GET(x):
-    return(((x) >> 6) & 0x3)
-
-AD9154_SERDESPLL_ENABLE_CNTRL = 0x280
-# default: 0x00, access: R/W
-def AD9154_ENABLE_SERDESPLL_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_ENABLE_SERDESPLL_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_RECAL_SERDESPLL_SET(x):
-    return(((x) & 0x1) << 2)
-def AD9154_RECAL_SERDESPLL_GET(x):
-    return(((x) >> 2) & 0x1)
-
-AD9154_PLL_STATUS = 0x281
-# default: 0x00, access: R
-def AD9154_SERDES_PLL_LOCK_RB_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R
-def AD9154_SERDES_CURRENTS_READY_RB_GET(x):
-    return (((x) >> 1) & 0x1)
-# default: 0x00, access: R
-def AD9154_SERDES_VCO_CAL_IN_PROGRESS_RB_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R
-def AD9154_SERDES_PLL_CAL_VALID_RB_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R
-def AD9154_SERDES_PLL_OVERRANGE_L_RB_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R
-def AD9154_SERDES_PLL_OVERRANGE_H_RB_GET(x):
-    return(((x) >> 5) & 0x1)
-
-AD9154_LDO_FILTER_1 = 0x284
-
-AD9154_LDO_FILTER_2 = 0x285
-
-AD9154_LDO_FILTER_3 = 0x286
-
-AD9154_CP_CURRENT_SPI = 0x287
-# default: 0x3f, access: R/W
-def AD9154_SPI_CP_CURRENT_SET(x):
-    return(((x) & 0x3f) << 0)
-def AD9154_SPI_CP_CURRENT_GET(x):
-    return(((x) >> 0) & 0x3f)
-# default: 0x01, access: R/W
-def AD9154_SPI_SERDES_LOGEN_POWER_MODE_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_SPI_SERDES_LOGEN_POWER_MODE_GET(x):
-    return(((x) >> 6) & 0x1)
-
-AD9154_REF_CLK_DIVIDER_LDO = 0x289
-# default: 0x00, access: R/W
-def AD9154_SPI_CDR_OVERSAMP_SET(x):
-    return(((x) & 0x3) << 0)
-def AD9154_SPI_CDR_OVERSAMP_GET(x):
-    return(((x) >> 0) & 0x3)
-# default: 0x01, access: R/W
-def AD9154_SPI_LDO_BYPASS_FILT_SET(x):
-    return(((x) & 0x1) << 2)
-def AD9154_SPI_LDO_BYPASS_FILT_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SPI_LDO_REF_SEL_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_SPI_LDO_REF_SEL_GET(x):
-    return(((x) >> 3) & 0x1)
-
-AD9154_VCO_LDO = 0x28a
-
-AD9154_PLL_RD_REG = 0x28b
-# default: 0x01, access: R/W
-def AD9154_SPI_SERDES_LOGEN_PD_CORE_SET(x):
-    return (((x) & 0x3) << 0)
-def AD9154_SPI_SERDES_LOGEN_PD_CORE_GET(x):
-    return (((x) >> 0) & 0x3)
-# default: 0x01, access: R/W
-def AD9154_SPI_SERDES_LDO_PD_SET(x):
-    return(((x) & 0x1) << 2)
-def AD9154_SPI_SERDES_LDO_PD_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_SPI_SYN_PD_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_SPI_SYN_PD_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_SPI_VCO_PD_ALC_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_SPI_VCO_PD_ALC_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_SPI_VCO_PD_PTAT_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_SPI_VCO_PD_PTAT_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_SPI_VCO_PD_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_SPI_VCO_PD_GET(x):
-    return(((x) >> 6) & 0x1)
-
-AD9154_ALC_VARACTOR = 0x290
-# default: 0x03, access: R/W
-def AD9154_SPI_VCO_VARACTOR_SET(x):
-    return(((x) & 0xf) << 0)
-def AD9154_SPI_VCO_VARACTOR_GET(x):
-    return(((x) >> 0) & 0xf)
-# default: 0x08, access: R/W
-def AD9154_SPI_INIT_ALC_VALUE_SET(x):
-    return(((x) & 0xf) << 4)
-def AD9154_SPI_INIT_ALC_VALUE_GET(x):
-    return(((x) >> 4) & 0xf)
-
-AD9154_VCO_OUTPUT = 0x291
-# default: 0x09, access: R/W
-def AD9154_SPI_VCO_OUTPUT_LEVEL_SET(x):
-    return(((x) & 0xf) << 0)
-def AD9154_SPI_VCO_OUTPUT_LEVEL_GET(x):
-    return(((x) >> 0) & 0xf)
-# default: 0x04, access: R/W
-def AD9154_SPI_VCO_OUTPUT_RESERVED_SET(x):
-    return(((x) & 0xf) << 4)
-def AD9154_SPI_VCO_OUTPUT_RESERVED_GET(x):
-    return(((x) >> 4) & 0xf)
-
-AD9154_CP_CONFIG = 0x294
-# default: 0x00, access: R/W
-def AD9154_SPI_CP_TEST_SET(x):
-    return(((x) & 0x3) << 0)
-def AD9154_SPI_CP_TEST_GET(x):
-    return(((x) >> 0) & 0x3)
-# default: 0x00, access: R/W
-def AD9154_SPI_CP_CAL_EN_SET(x):
-    return(((x) & 0x1) << 2)
-def AD9154_SPI_CP_CAL_EN_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SPI_CP_FORCE_CALBITS_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_SPI_CP_FORCE_CALBITS_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_SPI_CP_OFFSET_OFF_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_SPI_CP_OFFSET_OFF_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_SPI_CP_ENABLE_MACHINE_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_SPI_CP_ENABLE_MACHINE_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SPI_CP_DITHER_MODE_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_SPI_CP_DITHER_MODE_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x01, access: R/W
-def AD9154_SPI_CP_HALF_VCO_CAL_CLK_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_SPI_CP_HALF_VCO_CAL_CLK_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_VCO_BIAS_1 = 0x296
-# default: 0x04, access: R/W
-def AD9154_SPI_VCO_BIAS_REF_SET(x):
-    return(((x) & 0x7) << 0)
-def AD9154_SPI_VCO_BIAS_REF_GET(x):
-    return(((x) >> 0) & 0x7)
-# default: 0x01, access: R/W
-def AD9154_SPI_VCO_BIAS_TCF_SET(x):
-    return(((x) & 0x3) << 3)
-def AD9154_SPI_VCO_BIAS_TCF_GET(x):
-    return(((x) >> 3) & 0x3)
-
-AD9154_VCO_BIAS_2 = 0x297
-# default: 0x00, access: R/W
-def AD9154_SPI_PRESCALE_BIAS_SET(x):
-    return(((x) & 0x3) << 0)
-def AD9154_SPI_PRESCALE_BIAS_GET(x):
-    return(((x) >> 0) & 0x3)
-# default: 0x00, access: R/W
-def AD9154_SPI_LAST_ALC_EN_SET(x):
-    return(((x) & 0x1) << 2)
-def AD9154_SPI_LAST_ALC_EN_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SPI_PRESCALE_BYPASS_R_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_SPI_PRESCALE_BYPASS_R_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SPI_VCO_COMP_BYPASS_BIASR_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_SPI_VCO_COMP_BYPASS_BIASR_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SPI_VCO_BYPASS_DAC_R_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_SPI_VCO_BYPASS_DAC_R_GET(x):
-    return(((x) >> 5) & 0x1)
-
-AD9154_VCO_PD_OVERRIDES = 0x299
-# default: 0x00, access: R/W
-def AD9154_SPI_VCO_PD_OVERRIDE_VCO_BUF_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_SPI_VCO_PD_OVERRIDE_VCO_BUF_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SPI_VCO_PD_OVERRIDE_CAL_TCF_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_SPI_VCO_PD_OVERRIDE_CAL_TCF_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SPI_VCO_PD_OVERRIDE_VAR_REF_TCF_SET(x):
-    return(((x) & 0x1) << 2)
-def AD9154_SPI_VCO_PD_OVERRIDE_VAR_REF_TCF_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SPI_VCO_PD_OVERRIDE_VAR_REF_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_SPI_VCO_PD_OVERRIDE_VAR_REF_GET(x):
-    return(((x) >> 3) & 0x1)
-
-AD9154_VCO_CAL = 0x29a
-# default: 0x02, access: R/W
-def AD9154_SPI_FB_CLOCK_ADV_SET(x):
-    return(((x) & 0x3) << 0)
-def AD9154_SPI_FB_CLOCK_ADV_GET(x):
-    return(((x) >> 0) & 0x3)
-# default: 0x03, access: R/W
-def AD9154_SPI_VCO_CAL_COUNT_SET(x):
-    return(((x) & 0x3) << 2)
-def AD9154_SPI_VCO_CAL_COUNT_GET(x):
-    return(((x) >> 2) & 0x3)
-# default: 0x07, access: R/W
-def AD9154_SPI_VCO_CAL_ALC_WAIT_SET(x):
-    return(((x) & 0x7) << 4)
-def AD9154_SPI_VCO_CAL_ALC_WAIT_GET(x):
-    return(((x) >> 4) & 0x7)
-# default: 0x01, access: R/W
-def AD9154_SPI_VCO_CAL_EN_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_SPI_VCO_CAL_EN_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_CP_LEVEL_DETECT = 0x29c
-# default: 0x07, access: R/W
-def AD9154_SPI_CP_LEVEL_THRESHOLD_HIGH_SET(x):
-    return(((x) & 0x7) << 0)
-def AD9154_SPI_CP_LEVEL_THRESHOLD_HIGH_GET(x):
-    return(((x) >> 0) & 0x7)
-# default: 0x02, access: R/W
-def AD9154_SPI_CP_LEVEL_THRESHOLD_LOW_SET(x):
-    return(((x) & 0x7) << 3)
-def AD9154_SPI_CP_LEVEL_THRESHOLD_LOW_GET(x):
-    return(((x) >> 3) & 0x7)
-# default: 0x00, access: R/W
-def AD9154_SPI_CP_LEVEL_DET_PD_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_SPI_CP_LEVEL_DET_PD_GET(x):
-    return(((x) >> 6) & 0x1)
-
-AD9154_VCO_VARACTOR_CTRL_0 = 0x29f
-# default: 0x03, access: R/W
-def AD9154_SPI_VCO_VARACTOR_OFFSET_SET(x):
-    return(((x) & 0xf) << 0)
-def AD9154_SPI_VCO_VARACTOR_OFFSET_GET(x):
-    return(((x) >> 0) & 0xf)
-# default: 0x03, access: R/W
-def AD9154_SPI_VCO_VARACTOR_REF_TCF_SET(x):
-    return (((x) & 0x7) << 4)
-def AD9154_SPI_VCO_VARACTOR_REF_TCF_GET(x):
-    return (((x) >> 4) & 0x7)
-
-AD9154_VCO_VARACTOR_CTRL_1 = 0x2a0
-# default: 0x08, access: R/W
-def AD9154_SPI_VCO_VARACTOR_REF_SET(x):
-    return(((x) & 0xf) << 0)
-def AD9154_SPI_VCO_VARACTOR_REF_GET(x):
-    return(((x) >> 0) & 0xf)
-
-AD9154_TERM_BLK1_CTRLREG0 = 0x2a7
-
-AD9154_TERM_BLK2_CTRLREG0 = 0x2ae
-
-AD9154_GENERAL_JRX_CTRL_0 = 0x300
-# default: 0x00, access: R/W
-def AD9154_LINK_EN_SET(x):
-    return(((x) & 0x3) << 0)
-def AD9154_LINK_EN_GET(x):
-    return(((x) >> 0) & 0x3)
-# default: 0x00, access: R/W
-def AD9154_LINK_PAGE_SET(x):
-    return(((x) & 0x1) << 2)
-def AD9154_LINK_PAGE_GET(x):
-    return(((x) >> 2) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_LINK_MODE_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_LINK_MODE_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_CHECKSUM_MODE_SET(x):
- return(((x) & 0x1) << 6)
-def AD9154_CHECKSUM_MODE_GET(x):
-    return(((x) >> 6) & 0x1)
-
-AD9154_GENERAL_JRX_CTRL_1 = 0x301
-
-AD9154_DYN_LINK_LATENCY_0 = 0x302
-
-AD9154_DYN_LINK_LATENCY_1 = 0x303
-
-AD9154_LMFC_DELAY_0 = 0x304
-
-AD9154_LMFC_DELAY_1 = 0x305
-
-AD9154_LMFC_VAR_0 = 0x306
-
-AD9154_LMFC_VAR_1 = 0x307
-
-AD9154_XBAR_LN_0_1 = 0x308
-# default: 0x00, acces =
-def AD9154_LOGICAL_LANE0_SRC_SET(x):
-    return(((x) & 0x7) << 0)
-def AD9154_LOGICAL_LANE0_SRC_GET(x):
-    return(((x) >> 0) & 0x7)
-# default: 0x01, access: R/W
-def AD9154_LOGICAL_LANE1_SRC_SET(x):
-    return(((x) & 0x7) << 3)
-def AD9154_LOGICAL_LANE1_SRC_GET(x):
-    return(((x) >> 3) & 0x7)
-
-AD9154_XBAR_LN_2_3 = 0x309
-# default: 0x02, access: R/W
-def AD9154_LOGICAL_LANE2_SRC_SET(x):
-    return(((x) & 0x7) << 0)
-def AD9154_LOGICAL_LANE2_SRC_GET(x):
-    return(((x) >> 0) & 0x7)
-# default: 0x03, access: R/W
-def AD9154_LOGICAL_LANE3_SRC_SET(x):
-    return(((x) & 0x7) << 3)
-def AD9154_LOGICAL_LANE3_SRC_GET(x):
-    return(((x) >> 3) & 0x7)
-
-AD9154_XBAR_LN_4_5 = 0x30a
-# default: 0x04, access: R/W
-def AD9154_LOGICAL_LANE4_SRC_SET(x):
-    return(((x) & 0x7) << 0)
-def AD9154_LOGICAL_LANE4_SRC_GET(x):
-    return(((x) >> 0) & 0x7)
-# default: 0x05, access: R/W
-def AD9154_LOGICAL_LANE5_SRC_SET(x):
-    return(((x) & 0x7) << 3)
-def AD9154_LOGICAL_LANE5_SRC_GET(x):
-    return(((x) >> 3) & 0x7)
-
-AD9154_XBAR_LN_6_7 = 0x30b
-# default: 0x06, access: R/W
-def AD9154_LOGICAL_LANE6_SRC_SET(x):
-    return(((x) & 0x7) << 0)
-def AD9154_LOGICAL_LANE6_SRC_GET(x):
-    return(((x) >> 0) & 0x7)
-# default: 0x07, access: R/W
-def AD9154_LOGICAL_LANE7_SRC_SET(x):
-    return(((x) & 0x7) << 3)
-def AD9154_LOGICAL_LANE7_SRC_GET(x):
-    return(((x) >> 3) & 0x7)
-
-AD9154_FIFO_STATUS_REG_0 = 0x30c
-
-AD9154_FIFO_STATUS_REG_1 = 0x30d
-
-AD9154_SYNCB_GEN_1 = 0x312
-# default: 0x00, access: R/W
-def AD9154_SYNCB_ERR_DUR_SET(x):
-    return(((x) & 0x7) << 4)
-def AD9154_SYNCB_ERR_DUR_GET(x):
-    return(((x) >> 4) & 0x7)
-
-AD9154_SERDES_SPI_REG = 0x314
-
-AD9154_PHY_PRBS_TEST_EN = 0x315
-
-AD9154_PHY_PRBS_TEST_CTRL = 0x316
-# default: 0x00, access: R/W
-def AD9154_PHY_TEST_RESET_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_PHY_TEST_RESET_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_PHY_TEST_START_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_PHY_TEST_START_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_PHY_PRBS_PAT_SEL_SET(x):
-    return(((x) & 0x3) << 2)
-def AD9154_PHY_PRBS_PAT_SEL_GET(x):
-    return(((x) >> 2) & 0x3)
-# default: 0x00, access: R/W
-def AD9154_PHY_SRC_ERR_CNT_SET(x):
-    return(((x) & 0x7) << 4)
-def AD9154_PHY_SRC_ERR_CNT_GET(x):
-    return(((x) >> 4) & 0x7)
-
-AD9154_PHY_PRBS_TEST_THRESHOLD_LOBITS = 0x317
-
-AD9154_PHY_PRBS_TEST_THRESHOLD_MIDBITS = 0x318
-
-AD9154_PHY_PRBS_TEST_THRESHOLD_HIBITS = 0x319
-
-AD9154_PHY_PRBS_TEST_ERRCNT_LOBITS = 0x31a
-
-AD9154_PHY_PRBS_TEST_ERRCNT_MIDBITS = 0x31b
-
-AD9154_PHY_PRBS_TEST_ERRCNT_HIBITS = 0x31c
-
-AD9154_PHY_PRBS_TEST_STATUS = 0x31d
-
-AD9154_SHORT_TPL_TEST_0 = 0x32c
-# default: 0x00, access: R/W
-def AD9154_SHORT_TPL_TEST_EN_SET(x):
-    return(((x) & 0x1) << 0)
-def AD9154_SHORT_TPL_TEST_EN_GET(x):
-    return(((x) >> 0) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SHORT_TPL_TEST_RESET_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_SHORT_TPL_TEST_RESET_GET(x):
-    return(((x) >> 1) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_SHORT_TPL_DAC_SEL_SET(x):
-    return(((x) & 0x3) << 2)
-def AD9154_SHORT_TPL_DAC_SEL_GET(x):
-    return(((x) >> 2) & 0x3)
-# default: 0x00, access: R/W
-def AD9154_SHORT_TPL_SP_SEL_SET(x):
-    return(((x) & 0x3) << 4)
-def AD9154_SHORT_TPL_SP_SEL_GET(x):
-    return(((x) >> 4) & 0x3)
-
-AD9154_SHORT_TPL_TEST_1 = 0x32d
-
-AD9154_SHORT_TPL_TEST_2 = 0x32e
-
-AD9154_SHORT_TPL_TEST_3 = 0x32f
-
-AD9154_DEVICE_CONFIG_REG_2 = 0x333
-
-AD9154_JESD_BIT_INVERSE_CTRL = 0x334
-
-AD9154_DID_REG = 0x400
-
-AD9154_BID_REG = 0x401
-# default: 0x00, access: R
-def AD9154_BID_RD_GET(x):
-    return(((x) >> 0) & 0xf)
-# default: 0x00, access: R
-def AD9154_ADJCNT_RD_GET(x):
-    return(((x) >> 4) & 0xf)
-
-AD9154_LID0_REG = 0x402
-# default: 0x00, access: R
-def AD9154_LID0_RD_GET(x):
-    return(((x) >> 0) & 0x1f)
-# default: 0x00, access: R
-def AD9154_PHADJ_RD_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x00, access: R
-def AD9154_ADJDIR_RD_GET(x):
-    return(((x) >> 6) & 0x1)
-
-AD9154_SCR_L_REG = 0x403
-# default: 0x00, access: R
-def AD9154_L_1_RD_GET(x):
-    return(((x) >> 0) & 0x1f)
-# default: 0x00, access: R
-def AD9154_SCR_RD_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_F_REG = 0x404
-
-AD9154_K_REG = 0x405
-
-AD9154_M_REG = 0x406
-
-AD9154_CS_N_REG = 0x407
-# default: 0x00, access: R
-def AD9154_N_1_RD_GET(x):
-    return(((x) >> 0) & 0x1f)
-# default: 0x00, access: R
-def AD9154_CS_RD_GET(x):
-    return(((x) >> 6) & 0x3)
-
-AD9154_NP_REG = 0x408
-# default: 0x00, access: R
-def AD9154_NP_1_RD_GET(x):
-    return(((x) >> 0) & 0x1f)
-# default: 0x00, access: R
-def AD9154_SUBCLASSV_RD_GET(x):
-    return(((x) >> 5) & 0x7)
-
-AD9154_S_REG = 0x409
-# default: 0x00, access: R
-def AD9154_S_1_RD_GET(x):
-    return(((x) >> 0) & 0x1f)
-# default: 0x00, access: R
-def AD9154_JESDV_RD_GET(x):
-    return(((x) >> 5) & 0x7)
-
-AD9154_HD_CF_REG = 0x40a
-# default: 0x00, access: R
-def AD9154_CF_RD_GET(x):
-    return(((x) >> 0) & 0x1f)
-# default: 0x00, access: R
-def AD9154_HD_RD_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_RES1_REG = 0x40b
-
-AD9154_RES2_REG = 0x40c
-
-AD9154_CHECKSUM0_REG = 0x40d
-
-AD9154_COMPSUM0_REG = 0x40e
-
-AD9154_LID1_REG = 0x412
-
-AD9154_CHECKSUM1_REG = 0x415
-
-AD9154_COMPSUM1_REG = 0x416
-
-AD9154_LID2_REG = 0x41a
-
-AD9154_CHECKSUM2_REG = 0x41d
-
-AD9154_COMPSUM2_REG = 0x41e
-
-AD9154_LID3_REG = 0x422
-
-AD9154_CHECKSUM3_REG = 0x425
-
-AD9154_COMPSUM3_REG = 0x426
-
-AD9154_LID4_REG = 0x42a
-
-AD9154_CHECKSUM4_REG = 0x42d
-
-AD9154_COMPSUM4_REG = 0x42e
-
-AD9154_LID5_REG = 0x432
-
-AD9154_CHECKSUM5_REG = 0x435
-
-AD9154_COMPSUM5_REG = 0x436
-
-AD9154_LID6_REG = 0x43a
-
-AD9154_CHECKSUM6_REG = 0x43d
-
-AD9154_COMPSUM6_REG = 0x43e
-
-AD9154_LID7_REG = 0x442
-
-AD9154_CHECKSUM7_REG = 0x445
-
-AD9154_COMPSUM7_REG = 0x446
-
-AD9154_ILS_DID = 0x450
-
-AD9154_ILS_BID = 0x451
-# default: 0x00, access: R/W
-def AD9154_BID_SET(x):
-    return(((x) & 0xf) << 0)
-def AD9154_BID_GET(x):
-    return(((x) >> 0) & 0xf)
-# default: 0x00, access: R/W
-def AD9154_ADJCNT_SET(x):
-    return(((x) & 0xf) << 4)
-def AD9154_ADJCNT_GET(x):
-    return(((x) >> 4) & 0xf)
-
-AD9154_ILS_LID0 = 0x452
-# default: 0x00, access: R/W
-def AD9154_LID0_SET(x):
-    return(((x) & 0x1f) << 0)
-def AD9154_LID0_GET(x):
-    return(((x) >> 0) & 0x1f)
-# default: 0x00, access: R/W
-def AD9154_PHADJ_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_PHADJ_GET(x):
-    return(((x) >> 5) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_ADJDIR_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_ADJDIR_GET(x):
-    return(((x) >> 6) & 0x1)
-
-AD9154_ILS_SCR_L = 0x453
-# default: 0x03, access: R/W
-def AD9154_L_1_SET(x):
-    return(((x) & 0x1f) << 0)
-def AD9154_L_1_GET(x):
-    return(((x) >> 0) & 0x1f)
-# default: 0x01, access: R/W
-def AD9154_SCR_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_SCR_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_ILS_F = 0x454
-
-AD9154_ILS_K = 0x455
-
-AD9154_ILS_M = 0x456
-
-AD9154_ILS_CS_N = 0x457
-# default: 0x0f, access: R/W
-def AD9154_N_1_SET(x):
-    return(((x) & 0x1f) << 0)
-def AD9154_N_1_GET(x):
-    return(((x) >> 0) & 0x1f)
-# default: 0x00, access: R/W
-def AD9154_CS_SET(x):
-    return(((x) & 0x3) << 6)
-def AD9154_CS_GET(x):
-    return(((x) >> 6) & 0x3)
-
-AD9154_ILS_NP = 0x458
-# default: 0x0f, access: R/W
-def AD9154_NP_1_SET(x):
-    return(((x) & 0x1f) << 0)
-def AD9154_NP_1_GET(x):
-    return(((x) >> 0) & 0x1f)
-# default: 0x01, access: R/W
-def AD9154_SUBCLASSV_SET(x):
-    return(((x) & 0x7) << 5)
-def AD9154_SUBCLASSV_GET(x):
-    return(((x) >> 5) & 0x7)
-
-AD9154_ILS_S = 0x459
-# default: 0x00, access: R/W
-def AD9154_S_1_SET(x):
-    return(((x) & 0x1f) << 0)
-def AD9154_S_1_GET(x):
-    return(((x) >> 0) & 0x1f)
-# default: 0x01, access: R/W
-def AD9154_JESDV_SET(x):
-    return(((x) & 0x7) << 5)
-def AD9154_JESDV_GET(x):
-    return(((x) >> 5) & 0x7)
-
-AD9154_ILS_HD_CF = 0x45a
-# default: 0x00, access: R/W
-def AD9154_CF_SET(x):
-    return(((x) & 0x1f) << 0)
-def AD9154_CF_GET(x):
-    return(((x) >> 0) & 0x1f)
-# default: 0x01, access: R/W
-def AD9154_HD_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_HD_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_ILS_RES1 = 0x45b
-
-AD9154_ILS_RES2 = 0x45c
-
-AD9154_ILS_CHECKSUM = 0x45d
-
-AD9154_ERRCNTRMON = 0x46b
-# default: 0x00, access: W
-def AD9154_CNTRSEL_SET(x):
-    return(((x) & 0x3) << 0)
-# default: 0x00, access: W
-def AD9154_LANESEL_SET(x):
-    return(((x) & 0x7) << 4)
-
-AD9154_LANEDESKEW = 0x46c
-
-AD9154_BADDISPARITY = 0x46d
-# default: 0x00, access: W
-def AD9154_LANE_ADDR_DIS_SET(x):
-    return(((x) & 0x7) << 0)
-# default: 0x00, access: W
-def AD9154_RST_ERR_CNTR_DIS_SET(x):
-    return(((x) & 0x1) << 5)
-# default: 0x00, access: W
-def AD9154_DISABLE_ERR_CNTR_DIS_SET(x):
-    return(((x) & 0x1) << 6)
-# default: 0x00, access: W
-def AD9154_RST_IRQ_DIS_SET(x):
-    return(((x) & 0x1) << 7)
-
-AD9154_NIT_W = 0x46e
-# default: 0x00, access: W
-def AD9154_LANE_ADDR_NIT_SET(x):
-    return(((x) & 0x7) << 0)
-# default: 0x00, access: W
-def AD9154_RST_ERR_CNTR_NIT_SET(x):
-    return(((x) & 0x1) << 5)
-# default: 0x00, access: W
-def AD9154_DISABLE_ERR_CNTR_NIT_SET(x):
-    return(((x) & 0x1) << 6)
-# default: 0x00, access: W
-def AD9154_RST_IRQ_NIT_SET(x):
-    return(((x) & 0x1) << 7)
-
-AD9154_UNEXPECTEDCONTROL_W = 0x46f
-# default: 0x00, access: W
-def AD9154_LANE_ADDR_UCC_SET(x):
-    return(((x) & 0x7) << 0)
-# default: 0x00, access: W
-def AD9154_RST_ERR_CNTR_UCC_SET(x):
-    return(((x) & 0x1) << 5)
-# default: 0x00, access: W
-def AD9154_DISABLE_ERR_CNTR_UCC_SET(x):
-    return(((x) & 0x1) << 6)
-# default: 0x00, access: W
-def AD9154_RST_IRQ_UCC_SET(x):
-    return(((x) & 0x1) << 7)
-
-AD9154_CODEGRPSYNCFLG = 0x470
-
-AD9154_FRAMESYNCFLG = 0x471
-
-AD9154_GOODCHKSUMFLG = 0x472
-
-AD9154_INITLANESYNCFLG = 0x473
-
-AD9154_CTRLREG1 = 0x476
-
-AD9154_CTRLREG2 = 0x477
-# default: 0x00, access: R/W
-def AD9154_THRESHOLD_MASK_EN_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_THRESHOLD_MASK_EN_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_ILAS_MODE_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_ILAS_MODE_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_KVAL = 0x478
-
-AD9154_IRQVECTOR_MASK = 0x47a
-# default: 0x00, access: W
-def AD9154_CODEGRPSYNC_MASK_SET(x):
-    return(((x) & 0x1) << 0)
-# default: 0x00, access: W
-def AD9154_BADCHECKSUM_MASK_SET(x):
-    return(((x) & 0x1) << 2)
-# default: 0x00, access: W
-def AD9154_INITIALLANESYNC_MASK_SET(x):
-    return(((x) & 0x1) << 3)
-# default: 0x00, access: W
-def AD9154_UCC_MASK_SET(x):
-    return(((x) & 0x1) << 5)
-# default: 0x00, access: W
-def AD9154_NIT_MASK_SET(x):
-    return(((x) & 0x1) << 6)
-# default: 0x00, access: W
-def AD9154_BADDIS_MASK_SET(x):
-    return(((x) & 0x1) << 7)
-
-AD9154_SYNCASSERTIONMASK = 0x47b
-# default: 0x01, access: R/W
-def AD9154_CMM_ENABLE_SET(x):
-    return(((x) & 0x1) << 3)
-def AD9154_CMM_ENABLE_GET(x):
-    return(((x) >> 3) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_CMM_SET(x):
-    return(((x) & 0x1) << 4)
-def AD9154_CMM_GET(x):
-    return(((x) >> 4) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_UCC_S_SET(x):
-    return(((x) & 0x1) << 5)
-def AD9154_UCC_S_GET(x):
- return(((x) >> 5) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_NIT_S_SET(x):
-    return(((x) & 0x1) << 6)
-def AD9154_NIT_S_GET(x):
-    return(((x) >> 6) & 0x1)
-# default: 0x00, access: R/W
-def AD9154_BADDIS_S_SET(x):
-    return(((x) & 0x1) << 7)
-def AD9154_BADDIS_S_GET(x):
-    return(((x) >> 7) & 0x1)
-
-AD9154_ERRORTHRES = 0x47c
-
-AD9154_LANEENABLE = 0x47d
-
-AD9154_RAMP_ENA = 0x47e
-
-AD9154_DIG_TEST0 = 0x520
-# default: 0x00, access: R/W
-def AD9154_DC_TEST_MODE_SET(x):
-    return(((x) & 0x1) << 1)
-def AD9154_DC_TEST_MODE_GET(x):
-    return(((x) >> 1) & 0x1)
-
-AD9154_DC_TEST_VALUEI0 = 0x521
-
-AD9154_DC_TEST_VALUEI1 = 0x522
-
-AD9154_DC_TEST_VALUEQ0 = 0x523
-
-AD9154_DC_TEST_VALUEQ1 = 0x524
+# AD9154 register map
+#
+# Registers: (name, address).
+# Fields: (name, register, offset, width, access, default).
+#
+# AD9154_<REGISTER> address constants and AD9154_<FIELD>_SET/AD9154_<FIELD>_GET
+# helpers are generated from the tables (SET for R/W and W fields, GET for R/W
+# and R fields), ad9154_pack/ad9154_unpack encode/decode multiple fields of a
+# register at once.
+
+from collections import namedtuple, OrderedDict
+
+
+AD9154_REGISTERS = [
+    ("SPI_INTFCONFA",                   0x000),
+    ("CHIPTYPE",                        0x003),
+    ("PRODIDL",                         0x004),
+    ("PRODIDH",                         0x005),
+    ("CHIPGRADE",                       0x006),
+    ("SPI_PAGEINDX",                    0x008),
+    ("PWRCNTRL0",                       0x011),
+    ("TXENMASK1",                       0x012),
+    ("PWRCNTRL3",                       0x013),
+    ("GROUP_DLY",                       0x014),
+    ("IRQEN_STATUSMODE0",               0x01f),
+    ("IRQEN_STATUSMODE1",               0x020),
+    ("IRQEN_STATUSMODE2",               0x021),
+    ("IRQEN_STATUSMODE3",               0x022),
+    ("IRQ_STATUS0",                     0x023),
+    ("IRQ_STATUS1",                     0x024),
+    ("IRQ_STATUS2",                     0x025),
+    ("IRQ_STATUS3",                     0x026),
+    ("JESD_CHECKS",                     0x030),
+    ("SYNC_ERRWINDOW",                  0x034),
+    ("SYNC_LASTERR_L",                  0x038),
+    ("SYNC_LASTERR_H",                  0x039),
+    ("SYNC_CONTROL",                    0x03a),
+    ("SYNC_STATUS",                     0x03b),
+    ("SYNC_CURRERR_L",                  0x03c),
+    ("SYNC_CURRERR_H",                  0x03d),
+    ("DACGAIN0_I",                      0x040),
+    ("DACGAIN1_I",                      0x041),
+    ("DACGAIN0_Q",                      0x042),
+    ("DACGAIN1_Q",                      0x043),
+    ("GROUPDELAY_COMP_I",               0x044),
+    ("GROUPDELAY_COMP_Q",               0x045),
+    ("GROUPDELAY_COMP_BYP",             0x046),
+    ("MIX_MODE",                        0x047),
+    ("NCOALIGN_MODE",                   0x050),
+    ("NCOKEY_ILSB",                     0x051),
+    ("NCOKEY_IMSB",                     0x052),
+    ("NCOKEY_QLSB",                     0x053),
+    ("NCOKEY_QMSB",                     0x054),
+    ("PDP_THRES0",                      0x060),
+    ("PDP_THRES1",                      0x061),
+    ("PDP_AVG_TIME",                    0x062),
+    ("PDP_POWER0",                      0x063),
+    ("PDP_POWER1",                      0x064),
+    ("CLKCFG0",                         0x080),
+    ("SYSREF_ACTRL0",                   0x081),
+    ("SYSREF_ACTRL1",                   0x082),
+    ("DACPLLCNTRL",                     0x083),
+    ("DACPLLSTATUS",                    0x084),
+    ("DACINTEGERWORD0",                 0x085),
+    ("DACLOOPFILT1",                    0x087),
+    ("DACLOOPFILT2",                    0x088),
+    ("DACLOOPFILT3",                    0x089),
+    ("DACCPCNTRL",                      0x08a),
+    ("DACLOGENCNTRL",                   0x08b),
+    ("DACLDOCNTRL1",                    0x08c),
+    ("DACLDOCNTRL2",                    0x08d),
+    ("DATA_FORMAT",                     0x110),
+    ("DATAPATH_CTRL",                   0x111),
+    ("INTERP_MODE",                     0x112),
+    ("NCO_FTW_UPDATE",                  0x113),
+    ("FTW0",                            0x114),
+    ("FTW1",                            0x115),
+    ("FTW2",                            0x116),
+    ("FTW3",                            0x117),
+    ("FTW4",                            0x118),
+    ("FTW5",                            0x119),
+    ("NCO_PHASE_OFFSET0",               0x11a),
+    ("NCO_PHASE_OFFSET1",               0x11b),
+    ("PHASE_ADJ0",                      0x11c),
+    ("PHASE_ADJ1",                      0x11d),
+    ("TXEN_SM_0",                       0x11f),
+    ("TXEN_RISE_COUNT_0",               0x121),
+    ("TXEN_RISE_COUNT_1",               0x122),
+    ("TXEN_FALL_COUNT_0",               0x123),
+    ("TXEN_FALL_COUNT_1",               0x124),
+    ("DEVICE_CONFIG_REG_0",             0x12d),
+    ("DIE_TEMP_CTRL0",                  0x12f),
+    ("DIE_TEMP0",                       0x132),
+    ("DIE_TEMP1",                       0x133),
+    ("DIE_TEMP_UPDATE",                 0x134),
+    ("DC_OFFSET_CTRL",                  0x135),
+    ("IPATH_DC_OFFSET_1PART0",          0x136),
+    ("IPATH_DC_OFFSET_1PART1",          0x137),
+    ("QPATH_DC_OFFSET_1PART0",          0x138),
+    ("QPATH_DC_OFFSET_1PART1",          0x139),
+    ("IPATH_DC_OFFSET_2PART",           0x13a),
+    ("QPATH_DC_OFFSET_2PART",           0x13b),
+    ("IDAC_DIG_GAIN0",                  0x13c),
+    ("IDAC_DIG_GAIN1",                  0x13d),
+    ("QDAC_DIG_GAIN0",                  0x13e),
+    ("QDAC_DIG_GAIN1",                  0x13f),
+    ("GAIN_RAMP_UP_STEP0",              0x140),
+    ("GAIN_RAMP_UP_STEP1",              0x141),
+    ("GAIN_RAMP_DOWN_STEP0",            0x142),
+    ("GAIN_RAMP_DOWN_STEP1",            0x143),
+    ("DEVICE_CONFIG_REG_1",             0x146),
+    ("BSM_STAT",                        0x147),
+    ("PRBS",                            0x14b),
+    ("PRBS_ERROR_I",                    0x14c),
+    ("PRBS_ERROR_Q",                    0x14d),
+    ("DACPLLT0",                        0x1b0),
+    ("DACPLLT1",                        0x1b1),
+    ("DACPLLT2",                        0x1b2),
+    ("DACPLLT3",                        0x1b3),
+    ("DACPLLT4",                        0x1b4),
+    ("DACPLLT5",                        0x1b5),
+    ("DACPLLT6",                        0x1b6),
+    ("DACPLLT7",                        0x1b7),
+    ("DACPLLT8",                        0x1b8),
+    ("DACPLLT9",                        0x1b9),
+    ("DACPLLTA",                        0x1ba),
+    ("DACPLLTB",                        0x1bb),
+    ("DACPLLTC",                        0x1bc),
+    ("DACPLLTD",                        0x1bd),
+    ("DACPLLTE",                        0x1be),
+    ("DACPLLTF",                        0x1bf),
+    ("DACPLLT10",                       0x1c0),
+    ("DACPLLT11",                       0x1c1),
+    ("DACPLLT15",                       0x1c2),
+    ("DACPLLT16",                       0x1c3),
+    ("DACPLLT17",                       0x1c4),
+    ("DACPLLT18",                       0x1c5),
+    ("MASTER_PD",                       0x200),
+    ("PHY_PD",                          0x201),
+    ("GENERIC_PD",                      0x203),
+    ("CDR_RESET",                       0x206),
+    ("CDR_OPERATING_MODE_REG_0",        0x230),
+    ("EQ_BIAS_REG",                     0x268),
+    ("SERDESPLL_ENABLE_CNTRL",          0x280),
+    ("PLL_STATUS",                      0x281),
+    ("LDO_FILTER_1",                    0x284),
+    ("LDO_FILTER_2",                    0x285),
+    ("LDO_FILTER_3",                    0x286),
+    ("CP_CURRENT_SPI",                  0x287),
+    ("REF_CLK_DIVIDER_LDO",             0x289),
+    ("VCO_LDO",                         0x28a),
+    ("PLL_RD_REG",                      0x28b),
+    ("ALC_VARACTOR",                    0x290),
+    ("VCO_OUTPUT",                      0x291),
+    ("CP_CONFIG",                       0x294),
+    ("VCO_BIAS_1",                      0x296),
+    ("VCO_BIAS_2",                      0x297),
+    ("VCO_PD_OVERRIDES",                0x299),
+    ("VCO_CAL",                         0x29a),
+    ("CP_LEVEL_DETECT",                 0x29c),
+    ("VCO_VARACTOR_CTRL_0",             0x29f),
+    ("VCO_VARACTOR_CTRL_1",             0x2a0),
+    ("TERM_BLK1_CTRLREG0",              0x2a7),
+    ("TERM_BLK2_CTRLREG0",              0x2ae),
+    ("GENERAL_JRX_CTRL_0",              0x300),
+    ("GENERAL_JRX_CTRL_1",              0x301),
+    ("DYN_LINK_LATENCY_0",              0x302),
+    ("DYN_LINK_LATENCY_1",              0x303),
+    ("LMFC_DELAY_0",                    0x304),
+    ("LMFC_DELAY_1",                    0x305),
+    ("LMFC_VAR_0",                      0x306),
+    ("LMFC_VAR_1",                      0x307),
+    ("XBAR_LN_0_1",                     0x308),
+    ("XBAR_LN_2_3",                     0x309),
+    ("XBAR_LN_4_5",                     0x30a),
+    ("XBAR_LN_6_7",                     0x30b),
+    ("FIFO_STATUS_REG_0",               0x30c),
+    ("FIFO_STATUS_REG_1",               0x30d),
+    ("SYNCB_GEN_1",                     0x312),
+    ("SERDES_SPI_REG",                  0x314),
+    ("PHY_PRBS_TEST_EN",                0x315),
+    ("PHY_PRBS_TEST_CTRL",              0x316),
+    ("PHY_PRBS_TEST_THRESHOLD_LOBITS",  0x317),
+    ("PHY_PRBS_TEST_THRESHOLD_MIDBITS", 0x318),
+    ("PHY_PRBS_TEST_THRESHOLD_HIBITS",  0x319),
+    ("PHY_PRBS_TEST_ERRCNT_LOBITS",     0x31a),
+    ("PHY_PRBS_TEST_ERRCNT_MIDBITS",    0x31b),
+    ("PHY_PRBS_TEST_ERRCNT_HIBITS",     0x31c),
+    ("PHY_PRBS_TEST_STATUS",            0x31d),
+    ("SHORT_TPL_TEST_0",                0x32c),
+    ("SHORT_TPL_TEST_1",                0x32d),
+    ("SHORT_TPL_TEST_2",                0x32e),
+    ("SHORT_TPL_TEST_3",                0x32f),
+    ("DEVICE_CONFIG_REG_2",             0x333),
+    ("JESD_BIT_INVERSE_CTRL",           0x334),
+    ("DID_REG",                         0x400),
+    ("BID_REG",                         0x401),
+    ("LID0_REG",                        0x402),
+    ("SCR_L_REG",                       0x403),
+    ("F_REG",                           0x404),
+    ("K_REG",                           0x405),
+    ("M_REG",                           0x406),
+    ("CS_N_REG",                        0x407),
+    ("NP_REG",                          0x408),
+    ("S_REG",                           0x409),
+    ("HD_CF_REG",                       0x40a),
+    ("RES1_REG",                        0x40b),
+    ("RES2_REG",                        0x40c),
+    ("CHECKSUM0_REG",                   0x40d),
+    ("COMPSUM0_REG",                    0x40e),
+    ("LID1_REG",                        0x412),
+    ("CHECKSUM1_REG",                   0x415),
+    ("COMPSUM1_REG",                    0x416),
+    ("LID2_REG",                        0x41a),
+    ("CHECKSUM2_REG",                   0x41d),
+    ("COMPSUM2_REG",                    0x41e),
+    ("LID3_REG",                        0x422),
+    ("CHECKSUM3_REG",                   0x425),
+    ("COMPSUM3_REG",                    0x426),
+    ("LID4_REG",                        0x42a),
+    ("CHECKSUM4_REG",                   0x42d),
+    ("COMPSUM4_REG",                    0x42e),
+    ("LID5_REG",                        0x432),
+    ("CHECKSUM5_REG",                   0x435),
+    ("COMPSUM5_REG",                    0x436),
+    ("LID6_REG",                        0x43a),
+    ("CHECKSUM6_REG",                   0x43d),
+    ("COMPSUM6_REG",                    0x43e),
+    ("LID7_REG",                        0x442),
+    ("CHECKSUM7_REG",                   0x445),
+    ("COMPSUM7_REG",                    0x446),
+    ("ILS_DID",                         0x450),
+    ("ILS_BID",                         0x451),
+    ("ILS_LID0",                        0x452),
+    ("ILS_SCR_L",                       0x453),
+    ("ILS_F",                           0x454),
+    ("ILS_K",                           0x455),
+    ("ILS_M",                           0x456),
+    ("ILS_CS_N",                        0x457),
+    ("ILS_NP",                          0x458),
+    ("ILS_S",                           0x459),
+    ("ILS_HD_CF",                       0x45a),
+    ("ILS_RES1",                        0x45b),
+    ("ILS_RES2",                        0x45c),
+    ("ILS_CHECKSUM",                    0x45d),
+    ("ERRCNTRMON",                      0x46b),
+    ("LANEDESKEW",                      0x46c),
+    ("BADDISPARITY",                    0x46d),
+    ("NIT_W",                           0x46e),
+    ("UNEXPECTEDCONTROL_W",             0x46f),
+    ("CODEGRPSYNCFLG",                  0x470),
+    ("FRAMESYNCFLG",                    0x471),
+    ("GOODCHKSUMFLG",                   0x472),
+    ("INITLANESYNCFLG",                 0x473),
+    ("CTRLREG1",                        0x476),
+    ("CTRLREG2",                        0x477),
+    ("KVAL",                            0x478),
+    ("IRQVECTOR_MASK",                  0x47a),
+    ("SYNCASSERTIONMASK",               0x47b),
+    ("ERRORTHRES",                      0x47c),
+    ("LANEENABLE",                      0x47d),
+    ("RAMP_ENA",                        0x47e),
+    ("DIG_TEST0",                       0x520),
+    ("DC_TEST_VALUEI0",                 0x521),
+    ("DC_TEST_VALUEI1",                 0x522),
+    ("DC_TEST_VALUEQ0",                 0x523),
+    ("DC_TEST_VALUEQ1",                 0x524),
+]
+
+AD9154_FIELDS = [
+    ("SOFTRESET",                       "SPI_INTFCONFA",                   0, 1, "R/W", 0x00),
+    ("LSBFIRST",                        "SPI_INTFCONFA",                   1, 1, "R/W", 0x00),
+    ("ADDRINC",                         "SPI_INTFCONFA",                   2, 1, "R/W", 0x00),
+    ("SDOACTIVE",                       "SPI_INTFCONFA",                   3, 1, "R/W", 0x00),
+    ("SDOACTIVE_M",                     "SPI_INTFCONFA",                   4, 1, "R",   0x00),
+    ("ADDRINC_M",                       "SPI_INTFCONFA",                   5, 1, "R",   0x00),
+    ("LSBFIRST_M",                      "SPI_INTFCONFA",                   6, 1, "R",   0x00),
+    ("SOFTRESET_M",                     "SPI_INTFCONFA",                   7, 1, "R",   0x00),
+    ("DEV_REVISION",                    "CHIPGRADE",                       0, 4, "R",   0x02),
+    ("PROD_GRADE",                      "CHIPGRADE",                       4, 4, "R",   0x00),
+    ("PD_DAC3",                         "PWRCNTRL0",                       3, 1, "R/W", 0x01),
+    ("PD_DAC2",                         "PWRCNTRL0",                       4, 1, "R/W", 0x01),
+    ("PD_DAC1",                         "PWRCNTRL0",                       5, 1, "R/W", 0x01),
+    ("PD_DAC0",                         "PWRCNTRL0",                       6, 1, "R/W", 0x01),
+    ("PD_BG",                           "PWRCNTRL0",                       7, 1, "R/W", 0x00),
+    ("DACA_MASK",                       "TXENMASK1",                       6, 1, "R/W", 0x00),
+    ("DACB_MASK",                       "TXENMASK1",                       7, 1, "R/W", 0x00),
+    ("SPI_TXEN",                        "PWRCNTRL3",                       0, 1, "R/W", 0x00),
+    ("ENA_SPI_TXEN",                    "PWRCNTRL3",                       1, 1, "R/W", 0x00),
+    ("SPI_PA_CTRL",                     "PWRCNTRL3",                       2, 1, "R/W", 0x00),
+    ("ENA_PA_CTRL_FROM_SPI",            "PWRCNTRL3",                       3, 1, "R/W", 0x00),
+    ("ENA_PA_CTRL_FROM_BLSM",           "PWRCNTRL3",                       4, 1, "R/W", 0x00),
+    ("ENA_PA_CTRL_FROM_TXENSM",         "PWRCNTRL3",                       5, 1, "R/W", 0x01),
+    ("ENA_PA_CTRL_FROM_PARROT_ERR",     "PWRCNTRL3",                       6, 1, "R/W", 0x00),
+    ("COARSE_GROUP_DELAY",              "GROUP_DLY",                       0, 4, "R/W", 0x08),
+    ("GROUP_DELAY_RESERVED",            "GROUP_DLY",                       4, 4, "R/W", 0x08),
+    ("IRQEN_SMODE_LANEFIFOERR",         "IRQEN_STATUSMODE0",               1, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_SERPLLLOCK",          "IRQEN_STATUSMODE0",               2, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_SERPLLLOST",          "IRQEN_STATUSMODE0",               3, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_DACPLLLOCK",          "IRQEN_STATUSMODE0",               4, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_DACPLLLOST",          "IRQEN_STATUSMODE0",               5, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_PRBS0",               "IRQEN_STATUSMODE1",               0, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_PRBS1",               "IRQEN_STATUSMODE1",               1, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_PRBS2",               "IRQEN_STATUSMODE1",               2, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_PRBS3",               "IRQEN_STATUSMODE1",               3, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_SYNC_TRIP0",          "IRQEN_STATUSMODE2",               0, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_SYNC_WLIM0",          "IRQEN_STATUSMODE2",               1, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_SYNC_ROTATE0",        "IRQEN_STATUSMODE2",               2, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_SYNC_LOCK0",          "IRQEN_STATUSMODE2",               3, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_NCO_ALIGN0",          "IRQEN_STATUSMODE2",               4, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_BLNKDONE0",           "IRQEN_STATUSMODE2",               5, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_PDPERR0",             "IRQEN_STATUSMODE2",               7, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_SYNC_TRIP1",          "IRQEN_STATUSMODE3",               0, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_SYNC_WLIM1",          "IRQEN_STATUSMODE3",               1, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_SYNC_ROTATE1",        "IRQEN_STATUSMODE3",               2, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_SYNC_LOCK1",          "IRQEN_STATUSMODE3",               3, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_NCO_ALIGN1",          "IRQEN_STATUSMODE3",               4, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_BLNKDONE1",           "IRQEN_STATUSMODE3",               5, 1, "R/W", 0x00),
+    ("IRQEN_SMODE_PDPERR1",             "IRQEN_STATUSMODE3",               7, 1, "R/W", 0x00),
+    ("LANEFIFOERR",                     "IRQ_STATUS0",                     1, 1, "R",   0x00),
+    ("SERPLLLOCK",                      "IRQ_STATUS0",                     2, 1, "R",   0x00),
+    ("SERPLLLOST",                      "IRQ_STATUS0",                     3, 1, "R",   0x00),
+    ("DACPLLLOCK",                      "IRQ_STATUS0",                     4, 1, "R",   0x00),
+    ("DACPLLLOST",                      "IRQ_STATUS0",                     5, 1, "R",   0x00),
+    ("PRBS0",                           "IRQ_STATUS1",                     0, 1, "R",   0x00),
+    ("PRBS1",                           "IRQ_STATUS1",                     1, 1, "R",   0x00),
+    ("PRBS2",                           "IRQ_STATUS1",                     2, 1, "R",   0x00),
+    ("PRBS3",                           "IRQ_STATUS1",                     3, 1, "R",   0x00),
+    ("SYNC_TRIP0",                      "IRQ_STATUS2",                     0, 1, "R",   0x00),
+    ("SYNC_WLIM0",                      "IRQ_STATUS2",                     1, 1, "R",   0x00),
+    ("SYNC_ROTATE0",                    "IRQ_STATUS2",                     2, 1, "R",   0x00),
+    ("SYNC_LOCK0",                      "IRQ_STATUS2",                     3, 1, "R",   0x00),
+    ("NCO_ALIGN0",                      "IRQ_STATUS2",                     4, 1, "R",   0x00),
+    ("BLNKDONE0",                       "IRQ_STATUS2",                     5, 1, "R",   0x00),
+    ("PDPERR0",                         "IRQ_STATUS2",                     7, 1, "R",   0x00),
+    ("SYNC_TRIP1",                      "IRQ_STATUS3",                     0, 1, "R",   0x00),
+    ("SYNC_WLIM1",                      "IRQ_STATUS3",                     1, 1, "R",   0x00),
+    ("SYNC_ROTATE1",                    "IRQ_STATUS3",                     2, 1, "R",   0x00),
+    ("SYNC_LOCK1",                      "IRQ_STATUS3",                     3, 1, "R",   0x00),
+    ("NCO_ALIGN1",                      "IRQ_STATUS3",                     4, 1, "R",   0x00),
+    ("BLNKDONE1",                       "IRQ_STATUS3",                     5, 1, "R",   0x00),
+    ("PDPERR1",                         "IRQ_STATUS3",                     7, 1, "R",   0x00),
+    ("ERR_INTSUPP",                     "JESD_CHECKS",                     0, 1, "R",   0x00),
+    ("ERR_SUBCLASS",                    "JESD_CHECKS",                     1, 1, "R",   0x00),
+    ("ERR_KUNSUPP",                     "JESD_CHECKS",                     2, 1, "R",   0x00),
+    ("ERR_JESDBAD",                     "JESD_CHECKS",                     3, 1, "R",   0x00),
+    ("ERR_WINLIMIT",                    "JESD_CHECKS",                     4, 1, "R",   0x00),
+    ("ERR_DLYOVER",                     "JESD_CHECKS",                     5, 1, "R",   0x00),
+    ("LASTERROR_H",                     "SYNC_LASTERR_H",                  0, 1, "R",   0x00),
+    ("LASTOVER",                        "SYNC_LASTERR_H",                  6, 1, "R",   0x00),
+    ("LASTUNDER",                       "SYNC_LASTERR_H",                  7, 1, "R",   0x00),
+    ("SYNCMODE",                        "SYNC_CONTROL",                    0, 4, "R/W", 0x00),
+    ("SYNCCLRLAST",                     "SYNC_CONTROL",                    4, 1, "R/W", 0x00),
+    ("SYNCCLRSTKY",                     "SYNC_CONTROL",                    5, 1, "R/W", 0x00),
+    ("SYNCARM",                         "SYNC_CONTROL",                    6, 1, "R/W", 0x00),
+    ("SYNCENABLE",                      "SYNC_CONTROL",                    7, 1, "R/W", 0x00),
+    ("SYNC_TRIP",                       "SYNC_STATUS",                     0, 1, "R",   0x00),
+    ("SYNC_WLIM",                       "SYNC_STATUS",                     1, 1, "R",   0x00),
+    ("SYNC_ROTATE",                     "SYNC_STATUS",                     2, 1, "R",   0x00),
+    ("SYNC_LOCK",                       "SYNC_STATUS",                     3, 1, "R",   0x00),
+    ("SYNC_BUSY",                       "SYNC_STATUS",                     7, 1, "R",   0x00),
+    ("CURRERROR_H",                     "SYNC_CURRERR_H",                  0, 1, "R",   0x00),
+    ("CURROVER",                        "SYNC_CURRERR_H",                  6, 1, "R",   0x00),
+    ("CURRUNDER",                       "SYNC_CURRERR_H",                  7, 1, "R",   0x00),
+    ("GROUPCOMP_BYPQ",                  "GROUPDELAY_COMP_BYP",             0, 1, "R/W", 0x01),
+    ("GROUPCOMP_BYPI",                  "GROUPDELAY_COMP_BYP",             1, 1, "R/W", 0x01),
+    ("NCO_ALIGN_MODE",                  "NCOALIGN_MODE",                   0, 2, "R/W", 0x00),
+    ("NCO_ALIGN_FAIL",                  "NCOALIGN_MODE",                   3, 1, "R",   0x00),
+    ("NCO_ALIGN_PASS",                  "NCOALIGN_MODE",                   4, 1, "R",   0x00),
+    ("NCO_ALIGN_MTCH",                  "NCOALIGN_MODE",                   5, 1, "R",   0x00),
+    ("NCO_ALIGN_ARM",                   "NCOALIGN_MODE",                   7, 1, "R/W", 0x00),
+    ("PDP_AVG_TIME_",                   "PDP_AVG_TIME",                    0, 4, "R/W", 0x00),
+    ("PA_BUS_SWAP",                     "PDP_AVG_TIME",                    6, 1, "R/W", 0x00),
+    ("PDP_ENABLE",                      "PDP_AVG_TIME",                    7, 1, "R/W", 0x00),
+    ("REF_CLKDIV_EN",                   "CLKCFG0",                         0, 1, "R/W", 0x00),
+    ("RF_SYNC_EN",                      "CLKCFG0",                         1, 1, "R/W", 0x01),
+    ("DUTY_EN",                         "CLKCFG0",                         2, 1, "R/W", 0x01),
+    ("PD_CLK_REC",                      "CLKCFG0",                         3, 1, "R/W", 0x01),
+    ("PD_SERDES_PCLK",                  "CLKCFG0",                         4, 1, "R/W", 0x01),
+    ("PD_CLK_DIG",                      "CLKCFG0",                         5, 1, "R/W", 0x01),
+    ("PD_CLK23",                        "CLKCFG0",                         6, 1, "R/W", 0x01),
+    ("PD_CLK01",                        "CLKCFG0",                         7, 1, "R/W", 0x01),
+    ("HYS_CNTRL1",                      "SYSREF_ACTRL0",                   0, 2, "R/W", 0x00),
+    ("SYSREF_RISE",                     "SYSREF_ACTRL0",                   2, 1, "R/W", 0x00),
+    ("HYS_ON",                          "SYSREF_ACTRL0",                   3, 1, "R/W", 0x00),
+    ("PD_SYSREF_BUFFER",                "SYSREF_ACTRL0",                   4, 1, "R/W", 0x01),
+    ("ENABLE_DACPLL",                   "DACPLLCNTRL",                     4, 1, "R/W", 0x00),
+    ("RECAL_DACPLL",                    "DACPLLCNTRL",                     7, 1, "R/W", 0x00),
+    ("DACPLL_LOCK",                     "DACPLLSTATUS",                    1, 1, "R",   0x00),
+    ("VCO_CAL_PROGRESS",                "DACPLLSTATUS",                    3, 1, "R",   0x00),
+    ("CP_CAL_VALID",                    "DACPLLSTATUS",                    4, 1, "R",   0x00),
+    ("CP_OVERRANGE_L",                  "DACPLLSTATUS",                    5, 1, "R",   0x00),
+    ("CP_OVERRANGE_H",                  "DACPLLSTATUS",                    6, 2, "R",   0x00),
+    ("LF_C1_WORD",                      "DACLOOPFILT1",                    0, 4, "R/W", 0x08),
+    ("LF_C2_WORD",                      "DACLOOPFILT1",                    4, 4, "R/W", 0x08),
+    ("LF_C3_WORD",                      "DACLOOPFILT2",                    0, 4, "R/W", 0x08),
+    ("LF_R1_WORD",                      "DACLOOPFILT2",                    4, 4, "R/W", 0x08),
+    ("LF_R3_WORD",                      "DACLOOPFILT3",                    0, 4, "R/W", 0x08),
+    ("LF_BYPASS_C1",                    "DACLOOPFILT3",                    4, 1, "R/W", 0x00),
+    ("LF_BYPASS_C2",                    "DACLOOPFILT3",                    5, 1, "R/W", 0x00),
+    ("LF_BYPASS_R1",                    "DACLOOPFILT3",                    6, 1, "R/W", 0x00),
+    ("LF_BYPASS_R3",                    "DACLOOPFILT3",                    7, 1, "R/W", 0x00),
+    ("CP_CURRENT",                      "DACCPCNTRL",                      0, 6, "R/W", 0x20),
+    ("VT_FORCE",                        "DACCPCNTRL",                      6, 1, "R/W", 0x00),
+    ("LODIVMODE",                       "DACLOGENCNTRL",                   0, 2, "R/W", 0x00),
+    ("LO_POWER_MODE",                   "DACLOGENCNTRL",                   4, 2, "R/W", 0x00),
+    ("REFDIVMODE",                      "DACLDOCNTRL1",                    0, 3, "R/W", 0x00),
+    ("LDO_BYPASS_FLT",                  "DACLDOCNTRL1",                    6, 1, "R/W", 0x00),
+    ("LDO_REF_SEL",                     "DACLDOCNTRL1",                    7, 1, "R/W", 0x00),
+    ("LDO_VDROP",                       "DACLDOCNTRL2",                    0, 2, "R/W", 0x03),
+    ("LDO_SEL",                         "DACLDOCNTRL2",                    2, 3, "R/W", 0x02),
+    ("LDO_INRUSH",                      "DACLDOCNTRL2",                    5, 2, "R/W", 0x01),
+    ("LDO_BYPASS",                      "DACLDOCNTRL2",                    7, 1, "R/W", 0x00),
+    ("BINARY_FORMAT",                   "DATA_FORMAT",                     7, 1, "R/W", 0x00),
+    ("I_TO_Q",                          "DATAPATH_CTRL",                   0, 1, "R/W", 0x00),
+    ("SEL_SIDEBAND",                    "DATAPATH_CTRL",                   1, 1, "R/W", 0x00),
+    ("MODULATION_TYPE",                 "DATAPATH_CTRL",                   2, 2, "R/W", 0x00),
+    ("PHASE_ADJ_ENABLE",                "DATAPATH_CTRL",                   4, 1, "R/W", 0x00),
+    ("DIG_GAIN_ENABLE",                 "DATAPATH_CTRL",                   5, 1, "R/W", 0x01),
+    ("INVSINC_ENABLE",                  "DATAPATH_CTRL",                   7, 1, "R/W", 0x01),
+    ("FTW_UPDATE_REQ",                  "NCO_FTW_UPDATE",                  0, 1, "R/W", 0x00),
+    ("FTW_UPDATE_ACK",                  "NCO_FTW_UPDATE",                  1, 1, "R",   0x00),
+    ("TXEN_SM_EN",                      "TXEN_SM_0",                       0, 1, "R/W", 0x01),
+    ("GP_PA_CTRL",                      "TXEN_SM_0",                       1, 1, "R/W", 0x01),
+    ("GP_PA_ON_INVERT",                 "TXEN_SM_0",                       2, 0, "R/W", 0x01),
+    ("RISE_COUNTERS",                   "TXEN_SM_0",                       4, 2, "R/W", 0x00),
+    ("FALL_COUNTERS",                   "TXEN_SM_0",                       6, 2, "R/W", 0x02),
+    ("AUXADC_ENABLE",                   "DIE_TEMP_CTRL0",                  0, 1, "R/W", 0x00),
+    ("AUXADC_RESERVED",                 "DIE_TEMP_CTRL0",                  1, 7, "R/W", 0x10),
+    ("SOFTBLANKRB",                     "BSM_STAT",                        6, 2, "R",   0x00),
+    ("PRBS_EN",                         "PRBS",                            0, 1, "R/W", 0x00),
+    ("PRBS_RESET",                      "PRBS",                            1, 1, "R/W", 0x00),
+    ("PRBS_MODE",                       "PRBS",                            2, 1, "R/W", 0x00),
+    ("PRBS_GOOD_I",                     "PRBS",                            6, 1, "R",   0x00),
+    ("PRBS_GOOD_Q",                     "PRBS",                            7, 1, "R",   0x00),
+    ("LOGEN_PD",                        "DACPLLT0",                        1, 1, "R/W", 0x01),
+    ("LDO_PD",                          "DACPLLT0",                        3, 1, "R/W", 0x01),
+    ("SYNTH_PD",                        "DACPLLT0",                        4, 1, "R/W", 0x01),
+    ("VCO_PD_ALC",                      "DACPLLT0",                        5, 1, "R/W", 0x01),
+    ("VCO_PD_PTAT",                     "DACPLLT0",                        6, 1, "R/W", 0x01),
+    ("VCO_PD_IN",                       "DACPLLT0",                        7, 1, "R/W", 0x01),
+    ("PFD_EDGE",                        "DACPLLT1",                        1, 1, "R/W", 0x00),
+    ("PFD_DELAY",                       "DACPLLT1",                        2, 2, "R/W", 0x01),
+    ("EXT_ALC_WORD",                    "DACPLLT2",                        0, 7, "R/W", 0x00),
+    ("EXT_ALC_WORD_EN",                 "DACPLLT2",                        7, 1, "R/W", 0x00),
+    ("EXT_BAND1",                       "DACPLLT3",                        0, 8, "W",   0x00),
+    ("EXT_BAND2",                       "DACPLLT4",                        0, 1, "R/W", 0x00),
+    ("EXT_BAND_EN",                     "DACPLLT4",                        1, 1, "R/W", 0x00),
+    ("VCO_CAL_OFFSET",                  "DACPLLT4",                        3, 4, "R/W", 0x0f),
+    ("BYP_LOAD_DELAY",                  "DACPLLT4",                        7, 1, "R/W", 0x00),
+    ("VCO_BIAS_REF",                    "DACPLLTB",                        0, 3, "R/W", 0x04),
+    ("VCO_BIAS_TCF",                    "DACPLLTB",                        3, 2, "R/W", 0x01),
+    ("PD_SYNCOUT1B",                    "GENERIC_PD",                      0, 1, "R/W", 0x00),
+    ("PD_SYNCOUT0B",                    "GENERIC_PD",                      1, 1, "R/W", 0x00),
+    ("CDR_OVERSAMP",                    "CDR_OPERATING_MODE_REG_0",        1, 1, "R/W", 0x00),
+    ("CDR_RESERVED",                    "CDR_OPERATING_MODE_REG_0",        2, 3, "R/W", 0x02),
+    ("ENHALFRATE",                      "CDR_OPERATING_MODE_REG_0",        5, 1, "R/W", 0x01),
+    ("EQ_BIAS_RESERVED",                "EQ_BIAS_REG",                     0, 6, "R/W", 0x22),
+    ("EQ_POWER_MODE",                   "EQ_BIAS_REG",                     6, 2, "R/W", 0x01),
+    ("ENABLE_SERDESPLL",                "SERDESPLL_ENABLE_CNTRL",          0, 1, "R/W", 0x00),
+    ("RECAL_SERDESPLL",                 "SERDESPLL_ENABLE_CNTRL",          2, 1, "R/W", 0x00),
+    ("SERDES_PLL_LOCK_RB",              "PLL_STATUS",                      0, 1, "R",   0x00),
+    ("SERDES_CURRENTS_READY_RB",        "PLL_STATUS",                      1, 1, "R",   0x00),
+    ("SERDES_VCO_CAL_IN_PROGRESS_RB",   "PLL_STATUS",                      2, 1, "R",   0x00),
+    ("SERDES_PLL_CAL_VALID_RB",         "PLL_STATUS",                      3, 1, "R",   0x00),
+    ("SERDES_PLL_OVERRANGE_L_RB",       "PLL_STATUS",                      4, 1, "R",   0x00),
+    ("SERDES_PLL_OVERRANGE_H_RB",       "PLL_STATUS",                      5, 1, "R",   0x00),
+    ("SPI_CP_CURRENT",                  "CP_CURRENT_SPI",                  0, 6, "R/W", 0x3f),
+    ("SPI_SERDES_LOGEN_POWER_MODE",     "CP_CURRENT_SPI",                  6, 1, "R/W", 0x01),
+    ("SPI_CDR_OVERSAMP",                "REF_CLK_DIVIDER_LDO",             0, 2, "R/W", 0x00),
+    ("SPI_LDO_BYPASS_FILT",             "REF_CLK_DIVIDER_LDO",             2, 1, "R/W", 0x01),
+    ("SPI_LDO_REF_SEL",                 "REF_CLK_DIVIDER_LDO",             3, 1, "R/W", 0x00),
+    ("SPI_SERDES_LOGEN_PD_CORE",        "PLL_RD_REG",                      0, 2, "R/W", 0x01),
+    ("SPI_SERDES_LDO_PD",               "PLL_RD_REG",                      2, 1, "R/W", 0x01),
+    ("SPI_SYN_PD",                      "PLL_RD_REG",                      3, 1, "R/W", 0x01),
+    ("SPI_VCO_PD_ALC",                  "PLL_RD_REG",                      4, 1, "R/W", 0x01),
+    ("SPI_VCO_PD_PTAT",                 "PLL_RD_REG",                      5, 1, "R/W", 0x01),
+    ("SPI_VCO_PD",                      "PLL_RD_REG",                      6, 1, "R/W", 0x01),
+    ("SPI_VCO_VARACTOR",                "ALC_VARACTOR",                    0, 4, "R/W", 0x03),
+    ("SPI_INIT_ALC_VALUE",              "ALC_VARACTOR",                    4, 4, "R/W", 0x08),
+    ("SPI_VCO_OUTPUT_LEVEL",            "VCO_OUTPUT",                      0, 4, "R/W", 0x09),
+    ("SPI_VCO_OUTPUT_RESERVED",         "VCO_OUTPUT",                      4, 4, "R/W", 0x04),
+    ("SPI_CP_TEST",                     "CP_CONFIG",                       0, 2, "R/W", 0x00),
+    ("SPI_CP_CAL_EN",                   "CP_CONFIG",                       2, 1, "R/W", 0x00),
+    ("SPI_CP_FORCE_CALBITS",            "CP_CONFIG",                       3, 1, "R/W", 0x00),
+    ("SPI_CP_OFFSET_OFF",               "CP_CONFIG",                       4, 1, "R/W", 0x01),
+    ("SPI_CP_ENABLE_MACHINE",           "CP_CONFIG",                       5, 1, "R/W", 0x01),
+    ("SPI_CP_DITHER_MODE",              "CP_CONFIG",                       6, 1, "R/W", 0x00),
+    ("SPI_CP_HALF_VCO_CAL_CLK",         "CP_CONFIG",                       7, 1, "R/W", 0x01),
+    ("SPI_VCO_BIAS_REF",                "VCO_BIAS_1",                      0, 3, "R/W", 0x04),
+    ("SPI_VCO_BIAS_TCF",                "VCO_BIAS_1",                      3, 2, "R/W", 0x01),
+    ("SPI_PRESCALE_BIAS",               "VCO_BIAS_2",                      0, 2, "R/W", 0x00),
+    ("SPI_LAST_ALC_EN",                 "VCO_BIAS_2",                      2, 1, "R/W", 0x00),
+    ("SPI_PRESCALE_BYPASS_R",           "VCO_BIAS_2",                      3, 1, "R/W", 0x00),
+    ("SPI_VCO_COMP_BYPASS_BIASR",       "VCO_BIAS_2",                      4, 1, "R/W", 0x00),
+    ("SPI_VCO_BYPASS_DAC_R",            "VCO_BIAS_2",                      5, 1, "R/W", 0x00),
+    ("SPI_VCO_PD_OVERRIDE_VCO_BUF",     "VCO_PD_OVERRIDES",                0, 1, "R/W", 0x00),
+    ("SPI_VCO_PD_OVERRIDE_CAL_TCF",     "VCO_PD_OVERRIDES",                1, 1, "R/W", 0x00),
+    ("SPI_VCO_PD_OVERRIDE_VAR_REF_TCF", "VCO_PD_OVERRIDES",                2, 1, "R/W", 0x00),
+    ("SPI_VCO_PD_OVERRIDE_VAR_REF",     "VCO_PD_OVERRIDES",                3, 1, "R/W", 0x00),
+    ("SPI_FB_CLOCK_ADV",                "VCO_CAL",                         0, 2, "R/W", 0x02),
+    ("SPI_VCO_CAL_COUNT",               "VCO_CAL",                         2, 2, "R/W", 0x03),
+    ("SPI_VCO_CAL_ALC_WAIT",            "VCO_CAL",                         4, 3, "R/W", 0x07),
+    ("SPI_VCO_CAL_EN",                  "VCO_CAL",                         7, 1, "R/W", 0x01),
+    ("SPI_CP_LEVEL_THRESHOLD_HIGH",     "CP_LEVEL_DETECT",                 0, 3, "R/W", 0x07),
+    ("SPI_CP_LEVEL_THRESHOLD_LOW",      "CP_LEVEL_DETECT",                 3, 3, "R/W", 0x02),
+    ("SPI_CP_LEVEL_DET_PD",             "CP_LEVEL_DETECT",                 6, 1, "R/W", 0x00),
+    ("SPI_VCO_VARACTOR_OFFSET",         "VCO_VARACTOR_CTRL_0",             0, 4, "R/W", 0x03),
+    ("SPI_VCO_VARACTOR_REF_TCF",        "VCO_VARACTOR_CTRL_0",             4, 3, "R/W", 0x03),
+    ("SPI_VCO_VARACTOR_REF",            "VCO_VARACTOR_CTRL_1",             0, 4, "R/W", 0x08),
+    ("LINK_EN",                         "GENERAL_JRX_CTRL_0",              0, 2, "R/W", 0x00),
+    ("LINK_PAGE",                       "GENERAL_JRX_CTRL_0",              2, 1, "R/W", 0x00),
+    ("LINK_MODE",                       "GENERAL_JRX_CTRL_0",              3, 1, "R/W", 0x00),
+    ("CHECKSUM_MODE",                   "GENERAL_JRX_CTRL_0",              6, 1, "R/W", 0x00),
+    ("LOGICAL_LANE0_SRC",               "XBAR_LN_0_1",                     0, 3, "R/W", 0x00),
+    ("LOGICAL_LANE1_SRC",               "XBAR_LN_0_1",                     3, 3, "R/W", 0x01),
+    ("LOGICAL_LANE2_SRC",               "XBAR_LN_2_3",                     0, 3, "R/W", 0x02),
+    ("LOGICAL_LANE3_SRC",               "XBAR_LN_2_3",                     3, 3, "R/W", 0x03),
+    ("LOGICAL_LANE4_SRC",               "XBAR_LN_4_5",                     0, 3, "R/W", 0x04),
+    ("LOGICAL_LANE5_SRC",               "XBAR_LN_4_5",                     3, 3, "R/W", 0x05),
+    ("LOGICAL_LANE6_SRC",               "XBAR_LN_6_7",                     0, 3, "R/W", 0x06),
+    ("LOGICAL_LANE7_SRC",               "XBAR_LN_6_7",                     3, 3, "R/W", 0x07),
+    ("SYNCB_ERR_DUR",                   "SYNCB_GEN_1",                     4, 3, "R/W", 0x00),
+    ("PHY_TEST_RESET",                  "PHY_PRBS_TEST_CTRL",              0, 1, "R/W", 0x00),
+    ("PHY_TEST_START",                  "PHY_PRBS_TEST_CTRL",              1, 1, "R/W", 0x00),
+    ("PHY_PRBS_PAT_SEL",                "PHY_PRBS_TEST_CTRL",              2, 2, "R/W", 0x00),
+    ("PHY_SRC_ERR_CNT",                 "PHY_PRBS_TEST_CTRL",              4, 3, "R/W", 0x00),
+    ("SHORT_TPL_TEST_EN",               "SHORT_TPL_TEST_0",                0, 1, "R/W", 0x00),
+    ("SHORT_TPL_TEST_RESET",            "SHORT_TPL_TEST_0",                1, 1, "R/W", 0x00),
+    ("SHORT_TPL_DAC_SEL",               "SHORT_TPL_TEST_0",                2, 2, "R/W", 0x00),
+    ("SHORT_TPL_SP_SEL",                "SHORT_TPL_TEST_0",                4, 2, "R/W", 0x00),
+    ("BID_RD",                          "BID_REG",                         0, 4, "R",   0x00),
+    ("ADJCNT_RD",                       "BID_REG",                         4, 4, "R",   0x00),
+    ("LID0_RD",                         "LID0_REG",                        0, 5, "R",   0x00),
+    ("PHADJ_RD",                        "LID0_REG",                        5, 1, "R",   0x00),
+    ("ADJDIR_RD",                       "LID0_REG",                        6, 1, "R",   0x00),
+    ("L_1_RD",                          "SCR_L_REG",                       0, 5, "R",   0x00),
+    ("SCR_RD",                          "SCR_L_REG",                       7, 1, "R",   0x00),
+    ("N_1_RD",                          "CS_N_REG",                        0, 5, "R",   0x00),
+    ("CS_RD",                           "CS_N_REG",                        6, 2, "R",   0x00),
+    ("NP_1_RD",                         "NP_REG",                          0, 5, "R",   0x00),
+    ("SUBCLASSV_RD",                    "NP_REG",                          5, 3, "R",   0x00),
+    ("S_1_RD",                          "S_REG",                           0, 5, "R",   0x00),
+    ("JESDV_RD",                        "S_REG",                           5, 3, "R",   0x00),
+    ("CF_RD",                           "HD_CF_REG",                       0, 5, "R",   0x00),
+    ("HD_RD",                           "HD_CF_REG",                       7, 1, "R",   0x00),
+    ("BID",                             "ILS_BID",                         0, 4, "R/W", 0x00),
+    ("ADJCNT",                          "ILS_BID",                         4, 4, "R/W", 0x00),
+    ("LID0",                            "ILS_LID0",                        0, 5, "R/W", 0x00),
+    ("PHADJ",                           "ILS_LID0",                        5, 1, "R/W", 0x00),
+    ("ADJDIR",                          "ILS_LID0",                        6, 1, "R/W", 0x00),
+    ("L_1",                             "ILS_SCR_L",                       0, 5, "R/W", 0x03),
+    ("SCR",                             "ILS_SCR_L",                       7, 1, "R/W", 0x01),
+    ("N_1",                             "ILS_CS_N",                        0, 5, "R/W", 0x0f),
+    ("CS",                              "ILS_CS_N",                        6, 2, "R/W", 0x00),
+    ("NP_1",                            "ILS_NP",                          0, 5, "R/W", 0x0f),
+    ("SUBCLASSV",                       "ILS_NP",                          5, 3, "R/W", 0x01),
+    ("S_1",                             "ILS_S",                           0, 5, "R/W", 0x00),
+    ("JESDV",                           "ILS_S",                           5, 3, "R/W", 0x01),
+    ("CF",                              "ILS_HD_CF",                       0, 5, "R/W", 0x00),
+    ("HD",                              "ILS_HD_CF",                       7, 1, "R/W", 0x01),
+    ("CNTRSEL",                         "ERRCNTRMON",                      0, 2, "W",   0x00),
+    ("LANESEL",                         "ERRCNTRMON",                      4, 3, "W",   0x00),
+    ("LANE_ADDR_DIS",                   "BADDISPARITY",                    0, 3, "W",   0x00),
+    ("RST_ERR_CNTR_DIS",                "BADDISPARITY",                    5, 1, "W",   0x00),
+    ("DISABLE_ERR_CNTR_DIS",            "BADDISPARITY",                    6, 1, "W",   0x00),
+    ("RST_IRQ_DIS",                     "BADDISPARITY",                    7, 1, "W",   0x00),
+    ("LANE_ADDR_NIT",                   "NIT_W",                           0, 3, "W",   0x00),
+    ("RST_ERR_CNTR_NIT",                "NIT_W",                           5, 1, "W",   0x00),
+    ("DISABLE_ERR_CNTR_NIT",            "NIT_W",                           6, 1, "W",   0x00),
+    ("RST_IRQ_NIT",                     "NIT_W",                           7, 1, "W",   0x00),
+    ("LANE_ADDR_UCC",                   "UNEXPECTEDCONTROL_W",             0, 3, "W",   0x00),
+    ("RST_ERR_CNTR_UCC",                "UNEXPECTEDCONTROL_W",             5, 1, "W",   0x00),
+    ("DISABLE_ERR_CNTR_UCC",            "UNEXPECTEDCONTROL_W",             6, 1, "W",   0x00),
+    ("RST_IRQ_UCC",                     "UNEXPECTEDCONTROL_W",             7, 1, "W",   0x00),
+    ("THRESHOLD_MASK_EN",               "CTRLREG2",                        3, 1, "R/W", 0x00),
+    ("ILAS_MODE",                       "CTRLREG2",                        7, 1, "R/W", 0x00),
+    ("CODEGRPSYNC_MASK",                "IRQVECTOR_MASK",                  0, 1, "W",   0x00),
+    ("BADCHECKSUM_MASK",                "IRQVECTOR_MASK",                  2, 1, "W",   0x00),
+    ("INITIALLANESYNC_MASK",            "IRQVECTOR_MASK",                  3, 1, "W",   0x00),
+    ("UCC_MASK",                        "IRQVECTOR_MASK",                  5, 1, "W",   0x00),
+    ("NIT_MASK",                        "IRQVECTOR_MASK",                  6, 1, "W",   0x00),
+    ("BADDIS_MASK",                     "IRQVECTOR_MASK",                  7, 1, "W",   0x00),
+    ("CMM_ENABLE",                      "SYNCASSERTIONMASK",               3, 1, "R/W", 0x01),
+    ("CMM",                             "SYNCASSERTIONMASK",               4, 1, "R/W", 0x00),
+    ("UCC_S",                           "SYNCASSERTIONMASK",               5, 1, "R/W", 0x00),
+    ("NIT_S",                           "SYNCASSERTIONMASK",               6, 1, "R/W", 0x00),
+    ("BADDIS_S",                        "SYNCASSERTIONMASK",               7, 1, "R/W", 0x00),
+    ("DC_TEST_MODE",                    "DIG_TEST0",                       1, 1, "R/W", 0x00),
+]
+
+
+AD9154Field = namedtuple("AD9154Field",
+    "name register address offset width access default mask")
+
+ad9154_registers = OrderedDict(AD9154_REGISTERS)
+ad9154_fields = OrderedDict()
+ad9154_register_fields = OrderedDict((address, []) for address in ad9154_registers.values())
+
+
+def _make_set(offset, mask):
+    def _set(x):
+        return (x & mask) << offset
+    return _set
+
+
+def _make_get(offset, mask):
+    def _get(x):
+        return (x >> offset) & mask
+    return _get
+
+
+for _name, _address in AD9154_REGISTERS:
+    globals()["AD9154_" + _name] = _address
+
+for _name, _register, _offset, _width, _access, _default in AD9154_FIELDS:
+    _field = AD9154Field(_name, _register, ad9154_registers[_register],
+        _offset, _width, _access, _default, 2**_width - 1)
+    ad9154_fields[_name] = _field
+    ad9154_register_fields[_field.address].append(_field)
+    if _access in ["R/W", "W"]:
+        globals()["AD9154_" + _name + "_SET"] = _make_set(_offset, _field.mask)
+    if _access in ["R/W", "R"]:
+        globals()["AD9154_" + _name + "_GET"] = _make_get(_offset, _field.mask)
+
+
+def ad9154_validate(name, value):
+    field = ad9154_fields[name]
+    if field.access == "R":
+        raise ValueError("{} is read-only".format(name))
+    if not 0 <= value <= field.mask:
+        raise ValueError("{} value 0x{:x} does not fit in {} bits".format(
+            name, value, field.width))
+
+
+def ad9154_pack(values, data=None):
+    """Pack a dict of field values of a register, other bits are taken from
+    data (register default if None). Return (address, data)."""
+    addresses = set(ad9154_fields[name].address for name in values.keys())
+    if len(addresses) != 1:
+        raise ValueError("fields must belong to a single register")
+    address = addresses.pop()
+    if data is None:
+        data = ad9154_default(address)
+    for name, value in values.items():
+        ad9154_validate(name, value)
+        field = ad9154_fields[name]
+        data = (data & ~(field.mask << field.offset)) | (value << field.offset)
+    return address, data
+
+
+def ad9154_unpack(address, data):
+    """Decode all fields of a register, return an OrderedDict."""
+    return OrderedDict((field.name, (data >> field.offset) & field.mask)
+        for field in ad9154_register_fields[address])
+
+
+def ad9154_default(address):
+    data = 0
+    for field in ad9154_register_fields[address]:
+        data |= field.default << field.offset
+    return data
+
+
+def ad9154_defaults():
+    """(address, data) of the registers with writable fields, at their
+    default values."""
+    return [(address, ad9154_default(address))
+        for address, fields in ad9154_register_fields.items()
+        if any(field.access == "R/W" for field in fields)]
@@ -0,0 +1,156 @@
+import csv
+import time
+
+from libbase.memtest import burst_read
+from libbase.poll import poll_csr
+
+FLAG_MASKED   = 0b01
+FLAG_OVERFLOW = 0b10
+
+
+def read_capture_csv(filename):
+    """Return data_width and the signals of each group: {group: [(name,
+    width), ...]}, in Cat order."""
+    data_width = None
+    groups = {}
+    with open(filename, "r") as f:
+        for line in csv.reader(f):
+            if line[0] == "config" and line[2] == "data_width":
+                data_width = int(line[3])
+            elif line[0] == "signal":
+                groups.setdefault(int(line[1]), []).append((line[2], int(line[3])))
+    return data_width, groups
+
+
+class StreamingCaptureDriver:
+    """Driver of the sdram streaming capture: records are read from the
+    sdram in bursts (through the capture readback window, not the cached
+    main_ram) and run length decoded."""
+    def __init__(self, wb, name, config_csv, debug=False):
+        self.wb = wb
+        self.name = name
+        self.debug = debug
+        self.data_width, self.groups = read_capture_csv(config_csv)
+        self.word_bytes = self.read("word_bytes")
+        self.group = 0
+        self.records = []
+
+    def read(self, name):
+        return getattr(self.wb.regs, self.name + "_" + name).read()
+
+    def write(self, name, value):
+        getattr(self.wb.regs, self.name + "_" + name).write(value)
+
+    def configure_group(self, group):
+        self.group = group
+        self.write("group", group)
+
+    def configure_trigger(self, value=0, mask=0):
+        self.write("trigger_value", value)
+        self.write("trigger_mask", mask)
+
+    def configure_masking(self, burst, holdoff=16):
+        """Records written per burst (longer windows without masking, up to
+        the fifo depth - 1) and cycles masked after the last write data."""
+        self.write("burst", burst)
+        self.write("holdoff", holdoff)
+
+    def run(self, base, length):
+        """Capture to sdram at base (offset in bytes) up to length bytes."""
+        self.write("base", base)
+        self.write("length", length)
+        self.write("start", 1)
+
+    def stop(self):
+        self.write("stop", 1)
+
+    def wait_done(self, timeout=60.0):
+        poll_csr(getattr(self.wb.regs, self.name + "_done"), self.name, timeout=timeout)
+        overflows = self.read("overflows")
+        if overflows:
+            print("{:s}: {:d} records dropped (cycles kept in overflow records)".format(self.name, overflows))
+        cycles = self.read("cycles")
+        if cycles:
+            print("{:s}: {:d} cycles, {:.1f}% masked".format(
+                self.name, cycles, 100*self.read("masked_cycles")/cycles))
+
+    def upload(self):
+        """Read the records, return a list of (sample, cycles, flags).
+        FLAG_MASKED records cover cycles where the capture was writing its
+        records (sample not valid), FLAG_OVERFLOW records also cover the
+        cycles of the dropped records preceding them."""
+        nrecords = self.read("records")
+        words_per_record = self.word_bytes//4
+        start = time.time()
+        datas = burst_read(self.wb, getattr(self.wb.mems, self.name).base,
+                           nrecords*words_per_record)
+        if self.debug:
+            print("{:s}: {:d} records uploaded in {:.2f}s".format(
+                self.name, nrecords, time.time() - start))
+        # 32-bit word n of a record holds bits [32n:32n+32] of the port word
+        self.records = []
+        for i in range(nrecords):
+            words = datas[i*words_per_record:(i+1)*words_per_record]
+            sample = 0
+            for n, word in enumerate(words[:-1]):
+                sample |= int(word) << 32*n
+            flags = (int(words[-2]) >> 30) & 0x3
+            self.records.append((sample & (2**self.data_width-1), int(words[-1]), flags))
+        if self.debug:
+            masked = sum(cycles for sample, cycles, flags in self.records if flags & FLAG_MASKED)
+            total = sum(cycles for sample, cycles, flags in self.records)
+            print("{:s}: {:d} cycles, {:d} masked".format(self.name, total, masked))
+        return self.records
+
+    def get_samples(self, name):
+        """Expand the records to the samples of a signal (None when not
+        valid: masked or overflow records)."""
+        offset = 0
+        for signal, width in self.groups[self.group]:
+            if signal == name:
+                break
+            offset += width
+        else:
+            raise KeyError(name)
+        samples = []
+        for sample, cycles, flags in self.records:
+            if flags:
+                samples += [None]*cycles
+            else:
+                samples += [(sample >> offset) & (2**width-1)]*cycles
+        return samples
+
+    def save(self, filename, period=8):
+        """Save the records as a vcd (period in ns), one value change per
+        record. Signals are x on masked and overflow records, which are
+        also shown on the masked/overflow markers."""
+        signals = self.groups[self.group]
+        ids = [chr(33 + i) for i in range(len(signals))]
+        with open(filename, "w") as f:
+            f.write("$timescale 1ns $end\n")
+            f.write("$scope module {:s} $end\n".format(self.name))
+            for (name, width), id in zip(signals, ids):
+                f.write("$var wire {:d} {:s} {:s} $end\n".format(width, id, name))
+            marker_ids = [chr(33 + len(signals) + i) for i in range(2)]
+            for name, id in zip(["masked", "overflow"], marker_ids):
+                f.write("$var wire 1 {:s} {:s} $end\n".format(id, name))
+            f.write("$upscope $end\n")
+            f.write("$enddefinitions $end\n")
+            t = 0
+            previous = [None]*(len(signals) + 2)
+            for sample, cycles, flags in self.records:
+                f.write("#{:d}\n".format(t*period))
+                offset = 0
+                for i, ((name, width), id) in enumerate(zip(signals, ids)):
+                    value = "x" if flags else "{:b}".format((sample >> offset) & (2**width-1))
+                    offset += width
+                    if value != previous[i]:
+                        f.write("b{:s} {:s}\n".format(value, id))
+                        previous[i] = value
+                for i, (flag, id) in enumerate(zip([FLAG_MASKED, FLAG_OVERFLOW], marker_ids)):
+                    value = int(bool(flags & flag))
+                    if value != previous[len(signals) + i]:
+                        f.write("{:d}{:s}\n".format(value, id))
+                        previous[len(signals) + i] = value
+                t += cycles
+            f.write("#{:d}\n".format(t*period))
@@ -0,0 +1,152 @@
+import time
+
+from libbase.poll import poll, poll_csr
+
+COMMAND_PROCESSOR_BASE          = 0x50000000
+COMMAND_PROCESSOR_DEPTH         = 8192
+COMMAND_PROCESSOR_RESULTS_DEPTH = 2048
+
+OP_WRITE = 0
+OP_READ  = 1
+OP_POLL  = 2
+OP_WAIT  = 3
+
+
+class CommandScript:
+    """Sequence of bus accesses to execute with the command processor (or
+    directly on the host when not available). Reads return the index of
+    their value in the results."""
+    def __init__(self, sys_clk_freq=125e6):
+        self.sys_clk_freq = sys_clk_freq
+        self.commands = []
+        self.nreads = 0
+
+    def get_timeout(self, timeout):
+        return min(int(timeout*self.sys_clk_freq)//256 + 1, 2**24-1)
+
+    def write(self, addr, data):
+        self.commands.append((OP_WRITE, addr, data, 0xffffffff))
+
+    def read(self, addr, mask=0xffffffff):
+        self.commands.append((OP_READ, addr, 0, mask))
+        self.nreads += 1
+        return self.nreads - 1
+
+    def poll(self, addr, value, mask=0xffffffff, timeout=1.0):
+        self.commands.append((OP_POLL | (self.get_timeout(timeout) << 8), addr, value, mask))
+
+    def wait(self, duration):
+        self.commands.append((OP_WAIT | (self.get_timeout(duration) << 8), 0, 0, 0))
+
+    # csr helpers (csr_data_width=32)
+    def write_csr(self, csr, value):
+        for i in range(csr.length):
+            self.write(csr.addr + 4*i, (value >> (32*(csr.length - 1 - i))) & 0xffffffff)
+
+    def read_csr(self, csr):
+        assert csr.length == 1
+        return self.read(csr.addr)
+
+    def poll_csr(self, csr, value, mask=0xffffffff, timeout=1.0):
+        assert csr.length == 1
+        self.poll(csr.addr, value, mask, timeout)
+
+    def execute(self, wb):
+        """Execute the script on the host, access by access."""
+        results = []
+        for i, (op, addr, data, mask) in enumerate(self.commands):
+            timeout = (op >> 8)*256/self.sys_clk_freq
+            op = op & 0x3
+            if op == OP_WRITE:
+                wb.write(addr, data)
+            elif op == OP_READ:
+                results.append(wb.read(addr) & mask)
+            elif op == OP_POLL:
+                poll(lambda: wb.read(addr) & mask, lambda value: value == data & mask,
+                     "command {:d}".format(i), timeout=timeout)
+            elif op == OP_WAIT:
+                time.sleep(timeout)
+        return results
+
+
+class CommandProcessor:
+    def __init__(self, wb, base=COMMAND_PROCESSOR_BASE,
+                 depth=COMMAND_PROCESSOR_DEPTH,
+                 results_depth=COMMAND_PROCESSOR_RESULTS_DEPTH):
+        self.wb = wb
+        self.base = base
+        self.depth = depth
+        self.results_depth = results_depth
+
+    def run_chunk(self, commands, nreads):
+        regs = self.wb.regs
+
+        # load commands in bursts
+        datas = []
+        for command in commands:
+            datas += list(command)
+        for i in range(0, len(datas), 255):
+            self.wb.write(self.base + 4*i, datas[i:i+255])
+
+        # execute
+        regs.command_processor_length.write(len(commands))
+        regs.command_processor_start.write(1)
+        poll_csr(regs.command_processor_done, "command_processor", timeout=60.0)
+        if regs.command_processor_error.read():
+            raise TimeoutError("command processor: poll timeout at command {:d}".format(
+                regs.command_processor_error_index.read()))
+
+        # retrieve results in bursts
+        results = []
+        while len(results) < nreads:
+            n = min(nreads - len(results), 255)
+            results += self.wb.read(self.base + 4*self.depth + 4*len(results), n)
+        return results
+
+    def run(self, script):
+        """Execute script, split in chunks fitting in the memories, return
+        the read values."""
+        max_commands = self.depth//4
+        results = []
+        chunk = []
+        nreads = 0
+        for command in script.commands:
+            op_nreads = (command[0] & 0x3) == OP_READ
+            if len(chunk) == max_commands or nreads + op_nreads > self.results_depth:
+                results += self.run_chunk(chunk, nreads)
+                chunk = []
+                nreads = 0
+            chunk.append(command)
+            nreads += op_nreads
+        if chunk:
+            results += self.run_chunk(chunk, nreads)
+        return results
+
+
+def run_script(wb, script):
+    """Execute script with the command processor of the design when
+    available, on the host otherwise."""
+    try:
+        wb.regs.command_processor_start
+    except (AttributeError, KeyError):
+        return script.execute(wb)
+    return CommandProcessor(wb).run(script)
+
+
+class ScriptCSR:
+    def __init__(self, script, csr):
+        self.script = script
+        self.csr = csr
+
+    def write(self, value):
+        self.script.write_csr(self.csr, value)
+
+
+class ScriptRegs:
+    """wb.regs like view recording CSR writes to a script."""
+    def __init__(self, script, regs):
+        self.script = script
+        self.regs = regs
+
+    def __getattr__(self, name):
+        return ScriptCSR(self.script, getattr(self.regs, name))
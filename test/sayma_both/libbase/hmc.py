@@ -1,3 +1,7 @@
+from libbase.poll import poll_csr_clear
+from libbase.spi_sequencer import spi_write_many
+from libbase.shadow import ShadowedSPIDevice, HMC830_VOLATILE, HMC7043_VOLATILE
+
 # config mapping
 OFFLINE      = (1 << 0)
 CS_POLARITY  = (1 << 3)
@@ -13,9 +17,12 @@ WRITE_LENGTH = (1 << 16)
 READ_LENGTH  = (1 << 24)
 
 
-class HMC830:
-    def __init__(self, regs):
+class HMC830(ShadowedSPIDevice):
+    def __init__(self, regs, sequencer=None, shadow=False, write_back=False):
         self.regs = regs
+        self.sequencer = sequencer
+        if shadow:
+            self.enable_shadow(HMC830_VOLATILE, write_back, resets=[0x0])
 
     def configure(self):
         self.regs.hmc_spi_sel_out.write(0)
@@ -25,36 +32,46 @@ class HMC830:
         config |= 8*DIV_READ | 8*DIV_WRITE
         self.regs.hmc_spi_config.write(config)
 
-    def write(self, addr, data):
-        self.configure()
+    def write_xfer(self, addr, data):
         cmd = (0 << 6) | (addr & 0x3f)
         val = (cmd << 24) | (data & 0xffffff)
-        self.regs.hmc_spi_xfer.write(0b01 | 32*WRITE_LENGTH)
-        self.regs.hmc_spi_mosi_data.write(val << (32-31))
-        self.regs.hmc_spi_start.write(1)
-        while (self.regs.hmc_spi_pending.read() & 0x1):
-            pass
+        return (0b01 | 32*WRITE_LENGTH, val << (32-31), 0, 0)
 
-    def read(self, addr):
-        self.configure()
+    def read_xfer(self, addr, expected=0):
         cmd = (1 << 6) | (addr & 0x3f)
         val = (cmd << 24)
-        self.regs.hmc_spi_xfer.write(0b01 | 7*WRITE_LENGTH | 25*READ_LENGTH)
-        self.regs.hmc_spi_mosi_data.write(val << (32-31))
+        return (0b01 | 7*WRITE_LENGTH | 25*READ_LENGTH, val << (32-31), expected, 0xffffff)
+
+    def xfer(self, xfer, mosi_data):
+        self.regs.hmc_spi_xfer.write(xfer)
+        self.regs.hmc_spi_mosi_data.write(mosi_data)
         self.regs.hmc_spi_start.write(1)
-        while (self.regs.hmc_spi_pending.read() & 0x1):
-            pass
+        poll_csr_clear(self.regs.hmc_spi_pending, "hmc_spi", timeout=1.0)
+
+    def raw_write(self, addr, data):
+        self.configure()
+        self.xfer(*self.write_xfer(addr, data)[:2])
+
+    def raw_read(self, addr):
+        self.configure()
+        self.xfer(*self.read_xfer(addr)[:2])
         return self.regs.hmc_spi_miso_data.read() & 0xffffff
 
+    def raw_write_many(self, writes, verify=False):
+        return spi_write_many(self, "hmc_spi", writes, verify)
+
     def check_presence(self):
         errors = 0
         errors += self.read(0) != 0xa7975
         return errors == 0
 
 
-class HMC7043:
-    def __init__(self, regs):
+class HMC7043(ShadowedSPIDevice):
+    def __init__(self, regs, sequencer=None, shadow=False, write_back=False):
         self.regs = regs
+        self.sequencer = sequencer
+        if shadow:
+            self.enable_shadow(HMC7043_VOLATILE, write_back, resets=[0x0])
 
     def configure(self):
         self.regs.hmc_spi_sel_out.write(1)
@@ -64,27 +81,34 @@ class HMC7043:
         config |= 8*DIV_READ | 8*DIV_WRITE
         self.regs.hmc_spi_config.write(config)
 
-    def write(self, addr, data):
-        self.configure()
+    def write_xfer(self, addr, data):
         cmd = (0 << 15) | (addr & 0x1fff)
         val = (cmd << 8) | (data)
-        self.regs.hmc_spi_xfer.write(0b01 | 24*WRITE_LENGTH)
-        self.regs.hmc_spi_mosi_data.write(val << (32-24))
-        self.regs.hmc_spi_start.write(1)
-        while (self.regs.hmc_spi_pending.read() & 0x1):
-            pass
+        return (0b01 | 24*WRITE_LENGTH, val << (32-24), 0, 0)
 
-    def read(self, addr):
-        self.configure()
+    def read_xfer(self, addr, expected=0):
         cmd = (1 << 15) | (addr & 0x1fff)
         val = (cmd << 8)
-        self.regs.hmc_spi_xfer.write(0b01 | 16*WRITE_LENGTH | 8*READ_LENGTH)
-        self.regs.hmc_spi_mosi_data.write(val << (32-24))
+        return (0b01 | 16*WRITE_LENGTH | 8*READ_LENGTH, val << (32-24), expected, 0xff)
+
+    def xfer(self, xfer, mosi_data):
+        self.regs.hmc_spi_xfer.write(xfer)
+        self.regs.hmc_spi_mosi_data.write(mosi_data)
         self.regs.hmc_spi_start.write(1)
-        while (self.regs.hmc_spi_pending.read() & 0x1):
-            pass
+        poll_csr_clear(self.regs.hmc_spi_pending, "hmc_spi", timeout=1.0)
+
+    def raw_write(self, addr, data):
+        self.configure()
+        self.xfer(*self.write_xfer(addr, data)[:2])
+
+    def raw_read(self, addr):
+        self.configure()
+        self.xfer(*self.read_xfer(addr)[:2])
         return self.regs.hmc_spi_miso_data.read() & 0xff
 
+    def raw_write_many(self, writes, verify=False):
+        return spi_write_many(self, "hmc_spi", writes, verify)
+
     def check_presence(self):
         errors = 0
         errors += self.read(0x78) != 0xf1
@@ -0,0 +1,133 @@
+import os
+import json
+import runpy
+
+RATES = ["2p5gbps", "5gbps", "10gbps"]
+
+libbase_dir = os.path.dirname(os.path.abspath(__file__))
+
+# request/clear bits, always written
+ALWAYS_WRITTEN = [0x1, 0x2, 0x6]
+
+
+def get_config_filename(rate):
+    return os.path.join(libbase_dir, "hmc7043_config_" + rate + ".py")
+
+
+def run_config(rate):
+    config = []
+    class HMC7043DUT:
+        @staticmethod
+        def write(address, value):
+            config.append((address, value))
+    runpy.run_path(get_config_filename(rate), {"dut": HMC7043DUT})
+    return config
+
+
+def compile_image(rates=RATES):
+    """Compile configs to an image: write order, values common to all
+    rates and per-rate differences."""
+    configs = {rate: run_config(rate) for rate in rates}
+    order = [addr for addr, value in configs[rates[0]]]
+    for rate in rates:
+        assert [addr for addr, value in configs[rate]] == order
+    common = {}
+    diffs = {rate: {} for rate in rates}
+    for i, addr in enumerate(order):
+        values = {rate: configs[rate][i][1] for rate in rates}
+        if len(set(values.values())) == 1:
+            common[addr] = values[rates[0]]
+        else:
+            for rate in rates:
+                diffs[rate][addr] = values[rate]
+    return {"order": order, "common": common, "diffs": diffs}
+
+
+def get_image(rates=RATES, image_filename="hmc7043_image.json"):
+    """Return the image, from the cache (in the working directory) when up
+    to date."""
+    if os.path.exists(image_filename):
+        image_mtime = os.path.getmtime(image_filename)
+        if all(os.path.getmtime(get_config_filename(rate)) < image_mtime for rate in rates):
+            with open(image_filename, "r") as f:
+                image = json.load(f)
+            if set(image["diffs"].keys()) == set(rates):
+                # json keys are strings
+                image["common"] = {int(k): v for k, v in image["common"].items()}
+                image["diffs"] = {rate: {int(k): v for k, v in diffs.items()}
+                                  for rate, diffs in image["diffs"].items()}
+                return image
+    image = compile_image(rates)
+    with open(image_filename, "w") as f:
+        json.dump(image, f)
+    return image
+
+
+def get_config(rate, image=None):
+    if image is None:
+        image = get_image()
+    values = dict(image["common"])
+    values.update(image["diffs"][rate])
+    return [(addr, values[addr]) for addr in image["order"]]
+
+
+class HMC7043Loader:
+    def __init__(self, hmc7043, snapshot_filename="hmc7043_snapshot.json",
+                 image_filename="hmc7043_image.json"):
+        self.hmc7043 = hmc7043
+        self.snapshot_filename = snapshot_filename
+        self.image = get_image(image_filename=image_filename)
+
+    def load_snapshot(self):
+        try:
+            with open(self.snapshot_filename, "r") as f:
+                return {int(k): v for k, v in json.load(f).items()}
+        except FileNotFoundError:
+            return None
+
+    def save_snapshot(self, values):
+        with open(self.snapshot_filename, "w") as f:
+            json.dump(values, f)
+
+    def clear_snapshot(self):
+        if os.path.exists(self.snapshot_filename):
+            os.remove(self.snapshot_filename)
+
+    def get_state(self, readback=False):
+        """Current register values: full readback, or last written values
+        when the rate dependent registers read back as expected.
+
+        Without readback, the other registers are assumed to still hold the
+        snapshot values: this is not true after a power cycle of the board
+        if the rate dependent registers happen to read back as expected
+        (e.g. default values), use readback (or force) then."""
+        if readback:
+            return {addr: self.hmc7043.read(addr) for addr in self.image["order"]}
+        snapshot = self.load_snapshot()
+        if snapshot is None:
+            return {}
+        for addr in self.image["diffs"][RATES[0]].keys():
+            if self.hmc7043.read(addr) != snapshot.get(addr):
+                return {}
+        return snapshot
+
+    def load(self, rate, readback=False, force=False, verify=False, verbose=True):
+        """Write the registers differing from the current state, optionally
+        read back the written registers. Return the number of readback
+        errors (the snapshot is then discarded: next load writes all
+        registers)."""
+        config = get_config(rate, self.image)
+        state = {} if force else self.get_state(readback)
+        writes = [(addr, value) for addr, value in config
+            if addr in ALWAYS_WRITTEN or state.get(addr) != value]
+        if verbose:
+            print("HMC7043 {:s}: writing {:d}/{:d} registers".format(
+                rate, len(writes), len(config)))
+        errors = self.hmc7043.write_many(writes, verify)
+        if verify:
+            print("HMC7043 {:s}: {:d} readback errors".format(rate, errors))
+        if errors:
+            self.clear_snapshot()
+        else:
+            self.save_snapshot(dict(config))
+        return errors
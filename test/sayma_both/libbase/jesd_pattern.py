@@ -0,0 +1,83 @@
+import math
+
+from libbase.memtest import burst_write
+
+MODE_DDS  = 0
+MODE_AWG  = 1
+MODE_RAMP = 2
+MODE_ZERO = 3
+
+
+class JESDPatternDriver:
+    """Driver of a jesd pattern generator (dac0_pattern, dac1_pattern).
+    Frequencies are in Hz, phases in degrees, amplitudes and samples in
+    full scale units. Configuration is applied on update()."""
+    def __init__(self, wb, name, sample_rate=1e9):
+        self.wb = wb
+        self.name = name
+        self.sample_rate = sample_rate
+        self.nsamples = self.read("nsamples")
+        self.awg_depth = self.read("awg_depth")
+
+    def read(self, name):
+        return getattr(self.wb.regs, self.name + "_" + name).read()
+
+    def write(self, name, value):
+        getattr(self.wb.regs, self.name + "_" + name).write(value)
+
+    def write_channel(self, channel, name, value):
+        self.write("channel{:d}_{:s}".format(channel, name), value)
+
+    def get_frequency_word(self, frequency):
+        return int(round(frequency/self.sample_rate*2**32)) & 0xffffffff
+
+    def get_frequency(self, frequency_word):
+        return frequency_word*self.sample_rate/2**32
+
+    def get_coherent_frequency(self, frequency, npoints):
+        """Closest frequency with an integer number of periods in npoints
+        samples (no leakage in a npoints fft)."""
+        return round(frequency*npoints/self.sample_rate)*self.sample_rate/npoints
+
+    def set_amplitude(self, channel, amplitude):
+        self.write_channel(channel, "amplitude", int(round(min(amplitude, 1.0)*(2**15-1))))
+
+    def set_mode(self, channel, mode):
+        self.write_channel(channel, "mode", mode)
+
+    def set_dds(self, channel, frequency, phase=0.0, amplitude=1.0):
+        """Return the generated frequency (after quantization)."""
+        frequency_word = self.get_frequency_word(frequency)
+        self.write_channel(channel, "frequency", frequency_word)
+        self.write_channel(channel, "phase", int(round((phase % 360)/360*2**32)) & 0xffffffff)
+        self.set_amplitude(channel, amplitude)
+        self.set_mode(channel, MODE_DDS)
+        return self.get_frequency(frequency_word)
+
+    def set_awg(self, channel, samples, amplitude=1.0):
+        """Play samples in loop, length must be a multiple of nsamples."""
+        if len(samples) % self.nsamples or len(samples) > self.awg_depth:
+            raise ValueError("awg length must be a multiple of {:d} up to {:d}".format(
+                self.nsamples, self.awg_depth))
+        codes = [int(round(max(-1.0, min(sample, 1.0))*(2**15-1))) & 0xffff
+            for sample in samples]
+        datas = [codes[i] | (codes[i+1] << 16) for i in range(0, len(codes), 2)]
+        base = getattr(self.wb.mems, self.name).base
+        burst_write(self.wb, base + 2*self.awg_depth*channel, datas)
+        self.write_channel(channel, "awg_length", len(samples))
+        self.set_amplitude(channel, amplitude)
+        self.set_mode(channel, MODE_AWG)
+
+    def set_tones(self, channel, frequencies, npoints=None, amplitude=1.0):
+        """Play a multi-tone in the awg memory (frequencies made coherent
+        over npoints samples), return the generated frequencies."""
+        if npoints is None:
+            npoints = self.awg_depth
+        frequencies = [self.get_coherent_frequency(f, npoints) for f in frequencies]
+        samples = [sum(math.sin(2*math.pi*f*i/self.sample_rate) for f in frequencies)/len(frequencies)
+            for i in range(npoints)]
+        self.set_awg(channel, samples, amplitude)
+        return frequencies
+
+    def update(self):
+        self.write("update", 1)
@@ -0,0 +1,51 @@
+import numpy as np
+
+# length field of the bridge commands is 8 bits
+MAX_BURST = 255
+
+
+def seed_to_data(seeds, random=True):
+    seeds = np.asarray(seeds, dtype=np.uint64)
+    if random:
+        return ((1664525*seeds + 1013904223) & 0xffffffff).astype(np.uint32)
+    else:
+        return (seeds & 0xffffffff).astype(np.uint32)
+
+
+def burst_write(wb, base, datas, burst=MAX_BURST):
+    datas = [int(data) for data in datas]
+    for i in range(0, len(datas), burst):
+        wb.write(base + 4*i, datas[i:i+burst])
+
+
+def burst_read(wb, base, length, burst=MAX_BURST):
+    datas = []
+    for i in range(0, length, burst):
+        datas += wb.read(base + 4*i, min(burst, length - i))
+    return np.array(datas, dtype=np.uint32)
+
+
+def write_memory_pattern(wb, base, length, random=True):
+    burst_write(wb, base, seed_to_data(np.arange(length), random))
+
+
+def check_memory_pattern(wb, base, length, random=True, debug=False):
+    """Read back length words and compare them to the pattern, return the
+    number of errors and the error bitmap (one bit per word, packed)."""
+    expected = seed_to_data(np.arange(length), random)
+    datas = burst_read(wb, base, length)
+    mismatches = datas != expected
+    if debug:
+        for i in np.flatnonzero(mismatches):
+            print("{}: 0x{:08x}, 0x{:08x} KO".format(i, datas[i], expected[i]))
+    return int(np.count_nonzero(mismatches)), np.packbits(mismatches)
+
+
+def print_bitmap(bitmap, words_per_line=256):
+    """Print the error bitmap in hex, one line per words_per_line words,
+    error free lines are skipped."""
+    nbytes = words_per_line//8
+    for i in range(0, len(bitmap), nbytes):
+        line = bitmap[i:i+nbytes]
+        if line.any():
+            print("{:08x}: {}".format(8*i, "".join("{:02x}".format(b) for b in line)))
@@ -0,0 +1,64 @@
+import time
+
+
+class PollStats:
+    """Number of polls and latency of each polled operation."""
+    def __init__(self):
+        self.operations = {}
+
+    def add(self, name, polls, latency):
+        self.operations.setdefault(name, []).append((polls, latency))
+
+    def print(self):
+        for name in sorted(self.operations.keys()):
+            samples = self.operations[name]
+            polls = sorted(s[0] for s in samples)
+            latencies = sorted(s[1] for s in samples)
+            n = len(samples)
+            print("{:s}: {:d} ops, polls/op avg {:.1f} max {:d}, latency(ms) min {:.2f} med {:.2f} p99 {:.2f} max {:.2f}".format(
+                name, n, sum(polls)/n, polls[-1],
+                1e3*latencies[0],
+                1e3*latencies[n//2],
+                1e3*latencies[min(int(0.99*n), n - 1)],
+                1e3*latencies[-1]))
+
+
+stats = PollStats()
+
+
+def backoff(interval=1e-3, max_interval=0.1, factor=2):
+    """Intervals between polls: exponential from interval to max_interval."""
+    while True:
+        yield interval
+        interval = min(interval*factor, max_interval)
+
+
+def poll(function, condition=bool, name=None, timeout=10.0,
+         interval=1e-3, max_interval=0.1):
+    """Call function until condition is true on the returned value (first
+    call is immediate), then return the value. Raise TimeoutError when not
+    done after timeout seconds."""
+    if name is None:
+        name = getattr(function, "__name__", str(function))
+    start = time.time()
+    deadline = start + timeout
+    polls = 0
+    for delay in backoff(interval, max_interval):
+        value = function()
+        polls += 1
+        if condition(value):
+            stats.add(name, polls, time.time() - start)
+            return value
+        now = time.time()
+        if now > deadline:
+            raise TimeoutError("{:s}: not done after {:.2f}s ({:d} polls)".format(
+                name, timeout, polls))
+        time.sleep(min(delay, deadline - now))
+
+
+def poll_csr(csr, name=None, condition=lambda value: value & 0x1, **kwargs):
+    return poll(csr.read, condition, name, **kwargs)
+
+
+def poll_csr_clear(csr, name=None, **kwargs):
+    return poll(csr.read, lambda value: not (value & 0x1), name, **kwargs)
@@ -0,0 +1,128 @@
+import csv
+import time
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from litex.soc.tools.remote import RemoteClient
+
+from libbase.poll import backoff, stats
+
+SAYMA_BOARDS = {
+    "amc": (1234, "../sayma_amc/csr.csv"),
+    "rtm": (1235, "../sayma_rtm/csr.csv")
+}
+
+
+class TracedRemoteClient(RemoteClient):
+    """RemoteClient recording each access to trace as (start, board,
+    operation, address, data, duration)."""
+    def __init__(self, name, trace, *args, **kwargs):
+        self.name = name
+        self.trace = trace
+        RemoteClient.__init__(self, *args, **kwargs)
+
+    def read(self, addr, length=None):
+        start = time.time()
+        data = RemoteClient.read(self, addr, length)
+        self.trace.append((start, self.name, "read", addr, data, time.time() - start))
+        return data
+
+    def write(self, addr, data):
+        start = time.time()
+        RemoteClient.write(self, addr, data)
+        self.trace.append((start, self.name, "write", addr, data, time.time() - start))
+
+
+class Board:
+    """Awaitable accesses to a board. Accesses of a board are executed in
+    order by a dedicated thread, accesses of different boards overlap."""
+    def __init__(self, name, wb):
+        self.name = name
+        self.wb = wb
+        self.regs = wb.regs
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    async def call(self, function, *args, **kwargs):
+        """Run a blocking function (driver method, etc...) in the board
+        thread."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor,
+            functools.partial(function, *args, **kwargs))
+
+    async def read(self, name):
+        return await self.call(getattr(self.regs, name).read)
+
+    async def write(self, name, value):
+        await self.call(getattr(self.regs, name).write, value)
+
+    async def poll(self, function, condition=bool, name=None, timeout=10.0,
+                   interval=1e-3, max_interval=0.1):
+        """Call function until condition is true on the returned value
+        (with the backoff of libbase.poll), other boards are served between
+        calls."""
+        if name is None:
+            name = getattr(function, "__name__", str(function))
+        start = time.time()
+        deadline = start + timeout
+        polls = 0
+        for delay in backoff(interval, max_interval):
+            value = await self.call(function)
+            polls += 1
+            if condition(value):
+                stats.add(self.name + ":" + name, polls, time.time() - start)
+                return value
+            now = time.time()
+            if now > deadline:
+                raise TimeoutError("{:s}:{:s}: not done after {:.2f}s ({:d} polls)".format(
+                    self.name, name, timeout, polls))
+            await asyncio.sleep(min(delay, deadline - now))
+
+    async def poll_csr(self, name, condition=lambda value: value & 0x1, **kwargs):
+        return await self.poll(getattr(self.regs, name).read, condition, name, **kwargs)
+
+
+class Session:
+    """Drives several boards concurrently, boards are available as attributes
+    (session.amc, session.rtm) and all accesses are traced."""
+    def __init__(self, boards=SAYMA_BOARDS):
+        self.trace = []
+        self.boards = {}
+        for name, (port, csr_csv) in boards.items():
+            wb = TracedRemoteClient(name, self.trace, port=port, csr_csv=csr_csv, debug=False)
+            self.boards[name] = Board(name, wb)
+            setattr(self, name, self.boards[name])
+        self.start = None
+
+    def open(self):
+        for board in self.boards.values():
+            board.wb.open()
+        self.start = time.time()
+
+    def close(self):
+        for board in self.boards.values():
+            board.wb.close()
+            board.executor.shutdown()
+
+    def run(self, *coroutines):
+        """Run coroutines concurrently, return their results."""
+        loop = asyncio.get_event_loop()
+        return loop.run_until_complete(asyncio.gather(*coroutines))
+
+    def print_summary(self):
+        elapsed = time.time() - self.start
+        print("session: {:.2f}s".format(elapsed))
+        for name in sorted(self.boards.keys()):
+            accesses = [t for t in self.trace if t[1] == name]
+            busy = sum(t[5] for t in accesses)
+            print("-{:s}: {:d} accesses, busy {:.2f}s ({:.0f}%)".format(
+                name, len(accesses), busy, 100*busy/elapsed))
+        stats.print()
+
+    def save_trace(self, filename):
+        with open(filename, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["time", "board", "operation", "address", "data", "duration"])
+            for start, board, operation, addr, data, duration in self.trace:
+                writer.writerow(["{:.6f}".format(start - self.start), board, operation,
+                    "0x{:08x}".format(addr), data, "{:.6f}".format(duration)])
@@ -0,0 +1,137 @@
+from libbase.ad9154_regs import ad9154_register_fields
+
+
+class ShadowRegisters:
+    """Register cache of a SPI device.
+
+    Non-volatile registers are cached: reads are served from the cache and
+    writes of unchanged values are skipped. Volatile registers (status,
+    strobes, write-only) are always accessed. In write-back mode, writes
+    are kept in order until flush() (or until a volatile access, to
+    preserve ordering with strobes/status reads). Writes to reset
+    registers invalidate the cache."""
+    def __init__(self, read, write, volatile, write_back=False,
+                 write_many=None, resets=[]):
+        self._read = read
+        self._write = write
+        self._write_many = write_many
+        self.volatile = set(volatile)
+        self.write_back = write_back
+        self.resets = set(resets)
+        self.values = {}
+        self.dirty = {}
+
+    def invalidate(self, addr=None):
+        if addr is None:
+            self.values = {}
+        else:
+            self.values.pop(addr, None)
+
+    def flush(self):
+        if not self.dirty:
+            return
+        writes = list(self.dirty.items())
+        self.dirty = {}
+        if self._write_many is not None:
+            self._write_many(writes)
+        else:
+            for addr, data in writes:
+                self._write(addr, data)
+
+    def read(self, addr):
+        if addr in self.volatile:
+            self.flush()
+            return self._read(addr)
+        if addr not in self.values:
+            self.values[addr] = self._read(addr)
+        return self.values[addr]
+
+    def write(self, addr, data):
+        if addr in self.volatile or addr in self.resets:
+            self.flush()
+            self._write(addr, data)
+            if addr in self.resets:
+                self.invalidate()
+            return
+        if self.values.get(addr) == data:
+            return
+        self.values[addr] = data
+        if self.write_back:
+            # keep write order: a rewritten register moves to the end
+            self.dirty.pop(addr, None)
+            self.dirty[addr] = data
+        else:
+            self._write(addr, data)
+
+    def write_many(self, writes):
+        for addr, data in writes:
+            if addr in self.volatile or addr in self.resets:
+                self.write(addr, data)
+            elif self.values.get(addr) != data:
+                self.values[addr] = data
+                self.dirty.pop(addr, None)
+                self.dirty[addr] = data
+        if not self.write_back:
+            self.flush()
+
+    def modify(self, addr, mask, value):
+        """Read-modify-write of the mask bits (from the cache when
+        available)."""
+        data = self.read(addr)
+        self.write(addr, (data & ~mask) | (value & mask))
+
+
+class ShadowedSPIDevice:
+    """Mixin routing read/write/write_many of a SPI device through an
+    optional ShadowRegisters, the device provides raw_read/raw_write and
+    raw_write_many."""
+    shadow = None
+
+    def enable_shadow(self, volatile, write_back=False, resets=[]):
+        self.shadow = ShadowRegisters(self.raw_read, self.raw_write, volatile,
+            write_back, lambda writes: self.raw_write_many(writes), resets)
+
+    def read(self, addr):
+        if self.shadow is None:
+            return self.raw_read(addr)
+        return self.shadow.read(addr)
+
+    def write(self, addr, data):
+        if self.shadow is None:
+            self.raw_write(addr, data)
+        else:
+            self.shadow.write(addr, data)
+
+    def write_many(self, writes, verify=False):
+        if self.shadow is None:
+            return self.raw_write_many(writes, verify)
+        self.shadow.write_many(writes)
+        errors = 0
+        if verify:
+            self.shadow.flush()
+            for addr, data in writes:
+                errors += self.raw_read(addr) != data
+        return errors
+
+    def modify(self, addr, mask, value):
+        if self.shadow is None:
+            data = self.raw_read(addr)
+            self.raw_write(addr, (data & ~mask) | (value & mask))
+        else:
+            self.shadow.modify(addr, mask, value)
+
+    def flush(self):
+        if self.shadow is not None:
+            self.shadow.flush()
+
+
+def get_ad9154_volatile():
+    """Volatile registers from the ad9154_regs access annotations: registers
+    with a read-only or write-only field, or without fields."""
+    return set(address for address, fields in ad9154_register_fields.items()
+        if set(field.access for field in fields) != {"R/W"})
+
+
+# cf hmc830 and hmc7043 datasheets
+HMC830_VOLATILE  = [0x00, 0x05, 0x12, 0x13] # id/reset, vco subsystem port, readbacks
+HMC7043_VOLATILE = [0x01, 0x02, 0x06] + list(range(0x78, 0x96)) # requests, readbacks
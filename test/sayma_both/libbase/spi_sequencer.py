@@ -0,0 +1,61 @@
+from libbase.poll import poll_csr
+
+SPI_SEQUENCER_BASE  = 0x30000000
+SPI_SEQUENCER_DEPTH = 8192
+
+
+class SPISequencer:
+    def __init__(self, wb, base=SPI_SEQUENCER_BASE, depth=SPI_SEQUENCER_DEPTH):
+        self.wb = wb
+        self.base = base
+        self.depth = depth
+
+    def run(self, spi, transfers):
+        """Execute transfers (xfer, mosi_data, expected, mask) on the
+        SPIMaster named spi, return the number of readback errors."""
+        regs = self.wb.regs
+        for name in ["xfer", "mosi_data", "miso_data", "start", "pending"]:
+            addr = getattr(regs, spi + "_" + name).addr
+            getattr(regs, "spi_sequencer_" + name + "_addr").write(addr)
+
+        # load transfers in one burst
+        datas = []
+        for transfer in transfers:
+            datas += list(transfer)
+        assert len(datas) <= self.depth
+        for i in range(0, len(datas), 255):
+            self.wb.write(self.base + 4*i, datas[i:i+255])
+
+        # execute
+        regs.spi_sequencer_length.write(len(transfers))
+        regs.spi_sequencer_start.write(1)
+        poll_csr(regs.spi_sequencer_done, "spi_sequencer", timeout=10.0)
+
+        errors = regs.spi_sequencer_errors.read()
+        if errors:
+            first_error = regs.spi_sequencer_first_error.read()
+            transfer = transfers[first_error]
+            print("spi sequencer: {:d} readback errors, first at {:d}: 0x{:x} (expected 0x{:x})".format(
+                errors, first_error, regs.spi_sequencer_first_error_data.read(),
+                transfer[2] & transfer[3]))
+        return errors
+
+
+def spi_write_many(dev, spi, writes, verify=False):
+    """Write a list of (addr, data) to dev, with the sequencer of dev when
+    available, and optionally read back the written values. Return the
+    number of readback errors."""
+    if dev.sequencer is None:
+        for addr, data in writes:
+            dev.raw_write(addr, data)
+        errors = 0
+        if verify:
+            for addr, data in writes:
+                errors += dev.raw_read(addr) != data
+        return errors
+
+    dev.configure()
+    transfers = [dev.write_xfer(addr, data) for addr, data in writes]
+    if verify:
+        transfers += [dev.read_xfer(addr, data) for addr, data in writes]
+    return dev.sequencer.run(spi, transfers)
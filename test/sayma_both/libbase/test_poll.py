@@ -0,0 +1,38 @@
+import unittest
+
+from libbase.poll import poll_csr, poll_csr_clear
+
+
+class FakeCSR:
+    def __init__(self, values):
+        self.values = list(values)
+        self.reads = 0
+
+    def read(self):
+        self.reads += 1
+        return self.values.pop(0) if len(self.values) > 1 else self.values[0]
+
+
+class TestPoll(unittest.TestCase):
+    def test_poll_csr_name(self):
+        csr = FakeCSR([0, 0, 1])
+        self.assertEqual(poll_csr(csr, "done", timeout=1.0, interval=1e-4), 1)
+        self.assertEqual(csr.reads, 3)
+
+    def test_poll_csr_condition(self):
+        csr = FakeCSR([1, 2, 4])
+        self.assertEqual(poll_csr(csr, "level", condition=lambda value: value >= 4,
+                                  timeout=1.0, interval=1e-4), 4)
+
+    def test_poll_csr_timeout(self):
+        csr = FakeCSR([0])
+        with self.assertRaises(TimeoutError):
+            poll_csr(csr, "done", timeout=0.01, interval=1e-3)
+
+    def test_poll_csr_clear(self):
+        csr = FakeCSR([1, 1, 0])
+        self.assertEqual(poll_csr_clear(csr, "pending", timeout=1.0, interval=1e-4), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
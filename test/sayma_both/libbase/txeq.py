@@ -0,0 +1,120 @@
+import json
+import itertools
+
+# tx equalization settings (cf ug576)
+TXDIFFCTRLS   = [0b1000, 0b1010, 0b1100, 0b1110, 0b1111]
+TXPRECURSORS  = [0b00000, 0b00010, 0b00100]
+TXPOSTCURSORS = [0b00000, 0b00010, 0b00100, 0b00110, 0b01000]
+
+DEFAULT_SETTING = {
+    "txdiffctrl":   0b1111,
+    "txmaincursor": 80,
+    "txprecursor":  0b00000,
+    "txpostcursor": 0b00000
+}
+
+# csr names of lane settings
+JESD_LANE_CSRS = {
+    "txdiffctrl":   "{prefix}_core_phy{lane:d}_transmitter_txdiffcttrl",
+    "txmaincursor": "{prefix}_core_phy{lane:d}_transmitter_txmaincursor",
+    "txprecursor":  "{prefix}_core_phy{lane:d}_transmitter_txprecursor",
+    "txpostcursor": "{prefix}_core_phy{lane:d}_transmitter_txpostcursor"
+}
+
+DRTIO_LANE_CSRS = {
+    "txdiffctrl":   "{prefix}_gth{lane:d}_txdiffctrl",
+    "txmaincursor": "{prefix}_gth{lane:d}_txmaincursor",
+    "txprecursor":  "{prefix}_gth{lane:d}_txprecursor",
+    "txpostcursor": "{prefix}_gth{lane:d}_txpostcursor"
+}
+
+
+def get_margin(settings, index, candidates):
+    """Distance (in steps of each swept field) from settings[index] to the
+    closest setting not in candidates."""
+    fields = [field for field in DEFAULT_SETTING
+              if len(set(setting[field] for setting in settings)) > 1]
+    steps = {field: sorted(set(setting[field] for setting in settings))
+             for field in fields}
+    def position(setting):
+        return [steps[field].index(setting[field]) for field in fields]
+    failing = [position(settings[i]) for i in range(len(settings))
+               if i not in candidates]
+    if not failing:
+        return len(settings)
+    return min(max(abs(a - b) for a, b in zip(position(settings[index]), f))
+               for f in failing)
+
+
+def get_settings():
+    settings = []
+    for txdiffctrl, txprecursor, txpostcursor in itertools.product(
+        TXDIFFCTRLS, TXPRECURSORS, TXPOSTCURSORS):
+        setting = dict(DEFAULT_SETTING)
+        setting["txdiffctrl"] = txdiffctrl
+        setting["txprecursor"] = txprecursor
+        setting["txpostcursor"] = txpostcursor
+        settings.append(setting)
+    return settings
+
+
+class TXEqualization:
+    def __init__(self, regs, prefix, nlanes, csrs=JESD_LANE_CSRS):
+        self.regs = regs
+        self.prefix = prefix
+        self.nlanes = nlanes
+        self.csrs = csrs
+
+    def apply(self, lane, setting):
+        for field, csr in self.csrs.items():
+            reg = getattr(self.regs, csr.format(prefix=self.prefix, lane=lane))
+            reg.write(setting[field])
+
+    def apply_all(self, settings):
+        for lane in range(self.nlanes):
+            self.apply(lane, settings[lane])
+
+    def sweep(self, measure, settings=None, verbose=True):
+        """Apply each setting to all lanes and measure errors with measure(),
+        which returns the number of errors of each lane. For each lane, the
+        retained setting is the one with the fewest errors; when several
+        settings reach it, the one with the largest margin (get_margin) to
+        the other settings is retained to stay away from the failing
+        region."""
+        if settings is None:
+            settings = get_settings()
+        results = [[] for lane in range(self.nlanes)]
+        for setting in settings:
+            self.apply_all([setting]*self.nlanes)
+            errors = measure()
+            if verbose:
+                print("txdiffctrl: {:04b} txprecursor: {:05b} txpostcursor: {:05b} | ".format(
+                    setting["txdiffctrl"], setting["txprecursor"], setting["txpostcursor"]) +
+                    " ".join("{:8d}".format(e) for e in errors))
+            for lane in range(self.nlanes):
+                results[lane].append(errors[lane])
+
+        best = []
+        for lane in range(self.nlanes):
+            min_errors = min(results[lane])
+            candidates = [i for i, e in enumerate(results[lane]) if e == min_errors]
+            margins = [get_margin(settings, i, candidates) for i in candidates]
+            best.append(dict(settings[candidates[margins.index(max(margins))]]))
+            if verbose:
+                print("lane{:d}: {:d} errors with {}".format(lane, min_errors, best[lane]))
+        self.apply_all(best)
+        return best
+
+    def save(self, filename, settings):
+        with open(filename, "w") as f:
+            json.dump({"lane{:d}".format(lane): settings[lane]
+                       for lane in range(self.nlanes)}, f, indent=4)
+
+    def load(self, filename):
+        try:
+            with open(filename, "r") as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return [dict(DEFAULT_SETTING) for lane in range(self.nlanes)]
+        return [saved.get("lane{:d}".format(lane), dict(DEFAULT_SETTING))
+                for lane in range(self.nlanes)]
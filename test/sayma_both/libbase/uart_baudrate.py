@@ -0,0 +1,97 @@
+import csv
+import time
+import random
+
+import serial
+
+# supported by the ftdi (3MHz/n, 12MHz and 6MHz on ft2232h)
+BAUDRATES = [12000000, 6000000, 3000000, 2000000, 1000000, 921600, 460800, 230400]
+DEFAULT_BAUDRATE = 115200
+
+
+def read_csr_csv(filename):
+    csrs = {}
+    constants = {}
+    with open(filename, "r") as f:
+        for line in csv.reader(f):
+            if not line or line[0].startswith("#"):
+                continue
+            if line[0] == "csr_register":
+                csrs[line[1]] = int(line[2], 0)
+            elif line[0] == "constant":
+                constants[line[1]] = line[2]
+    return csrs, constants
+
+
+class UARTBridge:
+    """Direct access to the UART bridge (litex_server must not be running),
+    with timeouts to detect a baudrate mismatch."""
+    def __init__(self, port, baudrate=DEFAULT_BAUDRATE, timeout=0.1):
+        self.port = serial.serial_for_url(port, baudrate, timeout=timeout)
+
+    def close(self):
+        self.port.close()
+
+    def set_baudrate(self, baudrate):
+        self.port.flush()
+        self.port.baudrate = baudrate
+        self.port.reset_input_buffer()
+
+    def read(self, addr):
+        self.port.write(bytes([0x02, 1]) + (addr//4).to_bytes(4, byteorder="big"))
+        data = self.port.read(4)
+        if len(data) != 4:
+            raise TimeoutError("uart bridge: no response")
+        return int.from_bytes(data, byteorder="big")
+
+    def write(self, addr, data):
+        self.port.write(bytes([0x01, 1]) + (addr//4).to_bytes(4, byteorder="big") +
+                        data.to_bytes(4, byteorder="big"))
+
+
+class UARTBaudrateNegotiation:
+    def __init__(self, port, csr_csv, timeout=1.0):
+        self.csrs, constants = read_csr_csv(csr_csv)
+        self.clk_freq = int(constants["config_clock_frequency"])
+        self.timeout = timeout
+        self.bridge = UARTBridge(port)
+
+    def check(self):
+        try:
+            value = random.getrandbits(32)
+            self.bridge.write(self.csrs["ctrl_scratch"], value)
+            return self.bridge.read(self.csrs["ctrl_scratch"]) == value
+        except TimeoutError:
+            return False
+
+    def try_baudrate(self, baudrate):
+        tuning_word = int((baudrate/self.clk_freq)*2**32)
+        self.bridge.write(self.csrs["uart_baudrate_tuning_word"], tuning_word)
+        self.bridge.set_baudrate(baudrate)
+        if self.check():
+            self.bridge.write(self.csrs["uart_baudrate_confirm"], 1)
+            if self.bridge.read(self.csrs["uart_baudrate_confirmed"]):
+                return True
+        # wait for the board to restore the default baudrate
+        self.bridge.set_baudrate(DEFAULT_BAUDRATE)
+        time.sleep(self.timeout)
+        return False
+
+    def negotiate(self, max_baudrate=BAUDRATES[0], verbose=True):
+        """Select the highest working baudrate, return it."""
+        if not self.check():
+            raise ValueError("no response at {:d} bauds".format(DEFAULT_BAUDRATE))
+        for baudrate in BAUDRATES:
+            if baudrate > max_baudrate:
+                continue
+            if verbose:
+                print("trying {:d} bauds...".format(baudrate), end="")
+            ok = self.try_baudrate(baudrate)
+            if verbose:
+                print("ok" if ok else "ko")
+            if ok:
+                return baudrate
+        return DEFAULT_BAUDRATE
+
+    def close(self):
+        self.bridge.close()
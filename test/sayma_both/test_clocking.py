@@ -1,14 +1,14 @@
 #!/usr/bin/env python3
 import sys
-import runpy
-
 
 from litex.soc.tools.remote import RemoteClient
 
 from libbase.hmc import *
+from libbase.spi_sequencer import SPISequencer
+from libbase.hmc7043_image import RATES, HMC7043Loader
 
 
-if len(sys.argv) < 2:
+if len(sys.argv) < 2 or sys.argv[1] not in RATES:
     print("missing config (2p5gbps, 5gbps or 10gbps)")
     exit()
 
@@ -35,15 +35,6 @@ hmc830_config = [
     (0x3, 0x28), # n_divider
 ]
 
-hmc7043_config = []
-
-class HMC7043DUT:
-    @staticmethod
-    def write(address, value):
-        hmc7043_config.append([address, value])
-
-runpy.run_path("libbase/hmc7043_config_" + sys.argv[1] + ".py", {"dut": HMC7043DUT})
-
 wb_amc = RemoteClient(port=1234, csr_csv="../sayma_amc/csr.csv", debug=False)
 wb_rtm = RemoteClient(port=1235, csr_csv="../sayma_rtm/csr.csv", debug=False)
 wb_amc.open()
@@ -51,18 +42,24 @@ wb_rtm.open()
 
 # # #
 
-hmc830 = HMC830(wb_rtm.regs)
-hmc7043 = HMC7043(wb_rtm.regs)
+sequencer = SPISequencer(wb_rtm)
+hmc830 = HMC830(wb_rtm.regs, sequencer)
+hmc7043 = HMC7043(wb_rtm.regs, sequencer)
 print("HMC830 present: {:s}".format(str(hmc830.check_presence())))
 print("HMC7043 present: {:s}".format(str(hmc7043.check_presence())))
 
 # configure hmc830
-for addr, data in hmc830_config:
-    hmc830.write(addr, data)
-
-# configure hmc7043
-for addr, data in hmc7043_config:
-    hmc7043.write(addr, data)
+hmc830.write_many(hmc830_config)
+
+# configure hmc7043, only registers differing from the last written
+# config are written ("readback" to diff against the hmc7043 registers,
+# required after a power cycle, "force" to write all registers, "verify"
+# to read back the written registers)
+hmc7043_loader = HMC7043Loader(hmc7043)
+hmc7043_loader.load(sys.argv[1],
+    readback="readback" in sys.argv[2:],
+    force="force" in sys.argv[2:],
+    verify="verify" in sys.argv[2:])
 
 # # #
 
@@ -1,16 +1,21 @@
 #!/usr/bin/env python3
 import sys
 
-from litex.soc.tools.remote import RemoteClient
+import asyncio
 
 from litejesd204b.common import *
 
 from libbase.ad9154 import *
+from libbase.txeq import TXEqualization
+from libbase.jesd_pattern import JESDPatternDriver
+from libbase.session import Session
 
-wb_amc = RemoteClient(port=1234, csr_csv="../sayma_amc/csr.csv", debug=False)
-wb_rtm = RemoteClient(port=1235, csr_csv="../sayma_rtm/csr.csv", debug=False)
-wb_amc.open()
-wb_rtm.open()
+session = Session()
+session.open()
+amc = session.amc
+rtm = session.rtm
+wb_amc = amc.wb
+wb_rtm = rtm.wb
 
 # # #
 
@@ -19,45 +24,58 @@ ps = JESD204BPhysicalSettings(l=8, m=4, n=16, np=16)
 ts = JESD204BTransportSettings(f=2, s=2, k=16, cs=0)
 jesd_settings = JESD204BSettings(ps, ts, did=0x5a, bid=0x5)
 
-
-# configure tx electrical settings
-for i in range(8):
-    produce_square_wave = getattr(wb_amc.regs, "dac0_core_phy{:d}_transmitter_produce_square_wave".format(i))
-    txdiffctrl = getattr(wb_amc.regs, "dac0_core_phy{:d}_transmitter_txdiffcttrl".format(i))
-    txmaincursor = getattr(wb_amc.regs, "dac0_core_phy{:d}_transmitter_txmaincursor".format(i))
-    txprecursor = getattr(wb_amc.regs, "dac0_core_phy{:d}_transmitter_txprecursor".format(i))
-    txpostcursor = getattr(wb_amc.regs, "dac0_core_phy{:d}_transmitter_txpostcursor".format(i))
-    produce_square_wave.write(0) # 1 to generate clock on lane with frequency of linerate/40
-    txdiffctrl.write(0b1111) # cf ug576
-    txmaincursor.write(80) # cf ug576
-    txprecursor.write(0b00000) # cf ug576
-    txpostcursor.write(0b00000) # cf ug576
-
-# reset dacs
-wb_rtm.regs.dac_reset_out.write(0)
-time.sleep(1)
-wb_rtm.regs.dac_reset_out.write(1)
-
-time.sleep(1)
-
-# configure dac0
+txeq = TXEqualization(wb_amc.regs, "dac0", 8)
 dac0 = AD9154(wb_rtm.regs, 0)
-dac0.reset()
-print("dac0 configuration")
-print("dac0 present: {:s}".format(str(dac0.check_presence())))
-dac0.startup(jesd_settings, linerate=10e9)
-# show dac0 status
-dac0.print_status()
-
-# release/reset jesd core
-wb_amc.regs.dac0_control_prbs_config.write(0)
-wb_amc.regs.dac0_control_enable.write(0)
-wb_amc.regs.dac0_control_enable.write(1)
-
-time.sleep(1)
 
-# show dac0 status
-dac0.print_status()
+async def amc_setup():
+    # configure tx electrical settings (tuned settings from txeq_dac0.json if available)
+    for i in range(8):
+        # 1 to generate clock on lane with frequency of linerate/40
+        await amc.write("dac0_core_phy{:d}_transmitter_produce_square_wave".format(i), 0)
+    await amc.call(txeq.apply_all, txeq.load("txeq_dac0.json"))
+
+async def rtm_setup():
+    # reset dacs
+    await rtm.write("dac_reset_out", 0)
+    await asyncio.sleep(0.01)
+    await rtm.write("dac_reset_out", 1)
+
+    # configure dac0
+    await rtm.call(dac0.reset)
+    present = True
+    try:
+        await rtm.poll(dac0.check_presence, timeout=1.0)
+    except TimeoutError:
+        present = False
+    print("dac0 configuration")
+    print("dac0 present: {:s}".format(str(present)))
+    await rtm.call(dac0.startup, jesd_settings, linerate=10e9)
+    try:
+        await rtm.poll(dac0.check_serdes_pll_lock, timeout=1.0)
+    except TimeoutError:
+        print("dac0 serdes pll not locked")
+    # show dac0 status
+    await rtm.call(dac0.print_status)
+
+async def bringup():
+    # amc and rtm are configured concurrently
+    await asyncio.gather(amc_setup(), rtm_setup())
+
+    # release/reset jesd core
+    await amc.write("dac0_control_prbs_config", 0)
+    await amc.write("dac0_control_enable", 0)
+    await amc.write("dac0_control_enable", 1)
+
+    # wait link
+    try:
+        await rtm.poll(dac0.check_link, timeout=2.0)
+    except TimeoutError:
+        print("dac0 jesd link not synchronized")
+
+    # show dac0 status
+    await rtm.call(dac0.print_status)
+
+session.run(bringup())
 
 # prbs test
 if len(sys.argv) > 1:
@@ -76,8 +94,31 @@ if len(sys.argv) > 1:
             print("-"*40)
             for i in range(8):
                 print("-lane{:d}: {:d} errors".format(i, errors[i]))
+    elif sys.argv[1] == "txeq":
+        # sweep tx settings with prbs31 and store best settings of each lane
+        wb_amc.regs.dac0_control_prbs_config.write(0b11)
+        settings = txeq.sweep(lambda: dac0.prbs_test("prbs31", 100)[1])
+        txeq.save("txeq_dac0.json", settings)
+        wb_amc.regs.dac0_control_prbs_config.write(0)
+    elif sys.argv[1] == "dds":
+        # same tone on all converters, channel i phase shifted by i*90 degrees
+        frequency = float(sys.argv[2])*1e6 if len(sys.argv) > 2 else 100e6
+        pattern = JESDPatternDriver(wb_amc, "dac0_pattern")
+        for i in range(4):
+            f = pattern.set_dds(i, frequency, phase=90*i)
+        pattern.update()
+        print("dds: {:.6f}MHz".format(f/1e6))
+    elif sys.argv[1] == "awg":
+        # two tones (coherent over the awg memory) on all converters
+        frequencies = [float(f)*1e6 for f in sys.argv[2:4]] if len(sys.argv) > 3 else [100e6, 110e6]
+        pattern = JESDPatternDriver(wb_amc, "dac0_pattern")
+        for i in range(4):
+            f = pattern.set_tones(i, frequencies)
+        pattern.update()
+        print("awg: " + ", ".join("{:.6f}MHz".format(fi/1e6) for fi in f))
 
 # # #
 
-wb_amc.close()
-wb_rtm.close()
+session.print_summary()
+session.save_trace("session_dac0.csv")
+session.close()
@@ -6,6 +6,8 @@ from litex.soc.tools.remote import RemoteClient
 from litejesd204b.common import *
 
 from libbase.ad9154 import *
+from libbase.txeq import TXEqualization
+from libbase.jesd_pattern import JESDPatternDriver
 
 wb_amc = RemoteClient(port=1234, csr_csv="../sayma_amc/csr.csv", debug=False)
 wb_rtm = RemoteClient(port=1235, csr_csv="../sayma_rtm/csr.csv", debug=False)
@@ -20,18 +22,12 @@ ts = JESD204BTransportSettings(f=2, s=2, k=16, cs=0)
 jesd_settings = JESD204BSettings(ps, ts, did=0x5a, bid=0x5)
 
 
-# configure tx electrical settings
+# configure tx electrical settings (tuned settings from txeq_dac1.json if available)
 for i in range(8):
     produce_square_wave = getattr(wb_amc.regs, "dac1_core_phy{:d}_transmitter_produce_square_wave".format(i))
-    txdiffctrl = getattr(wb_amc.regs, "dac1_core_phy{:d}_transmitter_txdiffcttrl".format(i))
-    txmaincursor = getattr(wb_amc.regs, "dac1_core_phy{:d}_transmitter_txmaincursor".format(i))
-    txprecursor = getattr(wb_amc.regs, "dac1_core_phy{:d}_transmitter_txprecursor".format(i))
-    txpostcursor = getattr(wb_amc.regs, "dac1_core_phy{:d}_transmitter_txpostcursor".format(i))
     produce_square_wave.write(0) # 1 to generate clock on lane with frequency of linerate/40
-    txdiffctrl.write(0b1111) # cf ug576
-    txmaincursor.write(80) # cf ug576
-    txprecursor.write(0b00000) # cf ug576
-    txpostcursor.write(0b00000) # cf ug576
+txeq = TXEqualization(wb_amc.regs, "dac1", 8)
+txeq.apply_all(txeq.load("txeq_dac1.json"))
 
 # reset dacs
 wb_rtm.regs.dac_reset_out.write(0)
@@ -76,6 +72,28 @@ if len(sys.argv) > 1:
             print("-"*40)
             for i in range(8):
                 print("-lane{:d}: {:d} errors".format(i, errors[i]))
+    elif sys.argv[1] == "txeq":
+        # sweep tx settings with prbs31 and store best settings of each lane
+        wb_amc.regs.dac1_control_prbs_config.write(0b11)
+        settings = txeq.sweep(lambda: dac1.prbs_test("prbs31", 100)[1])
+        txeq.save("txeq_dac1.json", settings)
+        wb_amc.regs.dac1_control_prbs_config.write(0)
+    elif sys.argv[1] == "dds":
+        # same tone on all converters, channel i phase shifted by i*90 degrees
+        frequency = float(sys.argv[2])*1e6 if len(sys.argv) > 2 else 100e6
+        pattern = JESDPatternDriver(wb_amc, "dac1_pattern")
+        for i in range(4):
+            f = pattern.set_dds(i, frequency, phase=90*i)
+        pattern.update()
+        print("dds: {:.6f}MHz".format(f/1e6))
+    elif sys.argv[1] == "awg":
+        # two tones (coherent over the awg memory) on all converters
+        frequencies = [float(f)*1e6 for f in sys.argv[2:4]] if len(sys.argv) > 3 else [100e6, 110e6]
+        pattern = JESDPatternDriver(wb_amc, "dac1_pattern")
+        for i in range(4):
+            f = pattern.set_tones(i, frequencies)
+        pattern.update()
+        print("awg: " + ", ".join("{:.6f}MHz".format(fi/1e6) for fi in f))
 
 # # #
 
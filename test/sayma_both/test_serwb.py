@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 
 import sys
-import time
 
 from litex.soc.tools.remote import RemoteClient
 
 from litescope.software.driver.analyzer import LiteScopeAnalyzerDriver
 
+from libbase.memtest import *
+from libbase.poll import poll
+
 wb_amc = RemoteClient(port=1234, csr_csv="../sayma_amc/csr.csv", debug=False)
 wb_rtm = RemoteClient(port=1235, csr_csv="../sayma_rtm/csr.csv", debug=False)
 wb_amc.open()
@@ -14,29 +16,13 @@ wb_rtm.open()
 
 # # #
 
-def seed_to_data(seed, random=True):
-    if random:
-        return (1664525*seed + 1013904223) & 0xffffffff
-    else:
-        return seed
-
 def write_pattern(length):
-    for i in range(length):
-        wb_amc.write(0x20000000 + 4*i, seed_to_data(i))
+    write_memory_pattern(wb_amc, 0x20000000, length)
 
 def check_pattern(length, debug=False):
-    errors = 0
-    for i in range(length):
-        error = 0
-        read_data = wb_amc.read(0x20000000 + 4*i)
-        if read_data != seed_to_data(i):
-            error = 1
-            if debug:
-                print("{}: 0x{:08x}, 0x{:08x}   KO".format(i, read_data, seed_to_data(i)))
-        else:
-            if debug:
-                print("{}: 0x{:08x}, 0x{:08x} OK".format(i, read_data, seed_to_data(i)))
-        errors += error
+    errors, bitmap = check_memory_pattern(wb_amc, 0x20000000, length, debug=debug)
+    if debug and errors:
+        print_bitmap(bitmap)
     return errors
 
 
@@ -48,10 +34,10 @@ groups = {
     "wishbone":         4
 }
 
-def analyzer():
+def analyzer(trigger="wishbone_access"):
     analyzer = LiteScopeAnalyzerDriver(wb_amc.regs, "analyzer", config_csv="../sayma_amc/analyzer.csv", debug=True)
     analyzer.configure_group(groups["wishbone"])
-    analyzer.configure_trigger(cond={"wishbone_access" : 1})
+    analyzer.configure_trigger(cond={trigger : 1})
     analyzer.run(offset=32, length=128)
 
     write_pattern(32)
@@ -63,20 +49,55 @@ def analyzer():
     analyzer.save("dump.vcd")
 
 
+checker_errors = ["preamble", "length", "magic", "version", "count", "pairing"]
+
+def checker_report(wb, name):
+    print("{:s} checker".format(name))
+    print("-----------------")
+    print("error: {:d}".format(wb.regs.serwb_checker_error.read()))
+    print("pairing_errors: {:d}".format(wb.regs.serwb_checker_pairing_errors.read()))
+    for direction in ["tx", "rx"]:
+        def read(csr):
+            return getattr(wb.regs, "serwb_checker_" + direction + "_" + csr).read()
+        errors = read("errors")
+        print("{:s}: packets: {:d} errors: {:d}".format(direction, read("packets"), errors))
+        if not errors:
+            continue
+        flags = read("error_flags")
+        print("  first error: {:s}".format(
+            ", ".join(e for i, e in enumerate(checker_errors) if flags & (1 << i))))
+        for i in range(read("buffer_length")):
+            getattr(wb.regs, "serwb_checker_" + direction + "_buffer_index").write(i)
+            print("  {:2d}: 0x{:08x}".format(i, read("buffer_data")))
+    print("")
+
+def checker(loops=16):
+    for wb in [wb_amc, wb_rtm]:
+        wb.regs.serwb_checker_reset.write(1)
+    errors = 0
+    for i in range(loops):
+        write_pattern(1024)
+        errors += check_pattern(1024)
+    print("errors: {:d}".format(errors))
+    print("")
+    checker_report(wb_amc, "AMC")
+    checker_report(wb_rtm, "RTM")
+
+
 if len(sys.argv) < 2:
-    print("missing test (init, wishbone, analyzer)")
+    print("missing test (init, wishbone, checker, analyzer, analyzer_error)")
     wb_amc.close()
     exit()
 
 if sys.argv[1] == "init":
     wb_amc.regs.serwb_control_reset.write(1)
-    timeout = 20
-    while not (wb_amc.regs.serwb_control_ready.read() & 0x1 |
-               wb_amc.regs.serwb_control_error.read() & 0x1 |
-               timeout > 0):
-        time.sleep(0.1)
-        timeout -= 1
-    time.sleep(2)
+    # wait ready or error
+    try:
+        poll(lambda: (wb_amc.regs.serwb_control_ready.read() |
+                      wb_amc.regs.serwb_control_error.read()) & 0x1,
+             name="serwb_init", timeout=4.0)
+    except TimeoutError as e:
+        print(e)
     print("AMC configuration")
     print("-----------------")
     print("delay_found: {:d}".format(wb_amc.regs.serwb_control_delay_found.read()))
@@ -99,8 +120,14 @@ elif sys.argv[1] == "wishbone":
     errors = check_pattern(1024, debug=True)
     print("errors: {:d}".format(errors))
 
+elif sys.argv[1] == "checker":
+    checker()
 elif sys.argv[1] == "analyzer":
     analyzer()
+elif sys.argv[1] == "analyzer_error":
+    # capture the first protocol violation seen by the amc checker
+    wb_amc.regs.serwb_checker_reset.write(1)
+    analyzer(trigger="serwb_checker_error")
 else:
     raise ValueError
 
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+import sys
+
+from libbase.uart_baudrate import UARTBaudrateNegotiation, BAUDRATES
+
+# negotiate a higher uart bridge baudrate (to run before litex_server)
+
+if len(sys.argv) < 3:
+    print("usage: test_uart_baudrate.py [amc or rtm] [com_port] [max_baudrate]")
+    exit()
+
+board = sys.argv[1]
+port = sys.argv[2]
+max_baudrate = int(sys.argv[3]) if len(sys.argv) > 3 else BAUDRATES[0]
+
+negotiation = UARTBaudrateNegotiation(port, "../sayma_" + board + "/csr.csv")
+baudrate = negotiation.negotiate(max_baudrate)
+negotiation.close()
+
+print("{:s} uart bridge at {:d} bauds, start server with:".format(board.upper(), baudrate))
+print("litex_server uart {:s} {:d}".format(port, baudrate))